@@ -49,12 +49,13 @@ for filename in tqdm.tqdm(glob.glob(os.path.join(args.data, "*.fna"))):
     # load sequence
     with open(filename) as f:
         record = next(parse(f))
-    seq = Sequence.from_string(record.seq)
+    seq = Sequence(record.seq)
     tinf = METAGENOMIC_BINS[0].training_info
 
     # create nodes
     nodes = Nodes()
     nodes.extract(seq, translation_table=tinf.translation_table)
+    nodes.sort()
 
     # run connection scoring
     for backend in BACKENDS:
@@ -0,0 +1,146 @@
+import argparse
+import itertools
+import os
+import random
+
+NUCLEOTIDES = "ACGT"
+COMPLEMENT = str.maketrans("ACGT", "TGCA")
+STOP_CODONS = ("TAA", "TAG", "TGA")
+START_CODONS = ("ATG", "GTG", "TTG")
+START_WEIGHTS = (0.85, 0.1, 0.05)
+SHINE_DALGARNO = ("AGGAGG", "GGAGG", "AGGAG", "GGAG", "GAGG")
+
+
+def codon_usage(gc, gc3=None):
+    """Build a codon usage table for the given GC content.
+
+    The GC content of the third codon position defaults to a value
+    exaggerating the deviation from 0.5, as observed in real genomes.
+
+    """
+    if gc3 is None:
+        gc3 = min(max(0.5 + 1.5 * (gc - 0.5), 0.05), 0.95)
+    usage = {}
+    for codon in map("".join, itertools.product(NUCLEOTIDES, repeat=3)):
+        if codon in STOP_CODONS:
+            continue
+        weight = 1.0
+        for position, nucleotide in enumerate(codon):
+            p = gc3 if position == 2 else gc
+            weight *= p / 2 if nucleotide in "GC" else (1 - p) / 2
+        usage[codon] = weight
+    return usage
+
+
+def random_dna(rng, length, gc):
+    weights = ((1 - gc) / 2, gc / 2, gc / 2, (1 - gc) / 2)
+    return "".join(rng.choices(NUCLEOTIDES, weights=weights, k=length))
+
+
+def random_gene(rng, usage, mean_length):
+    codons, weights = zip(*usage.items())
+    length = max(int(rng.expovariate(1 / (mean_length - 300))) + 300, 300)
+    start = rng.choices(START_CODONS, weights=START_WEIGHTS)[0]
+    body = "".join(rng.choices(codons, weights=weights, k=length // 3 - 2))
+    stop = rng.choice(STOP_CODONS)
+    return "".join([start, body, stop])
+
+
+def synthetic_genome(
+    length,
+    gc=0.5,
+    usage=None,
+    gene_density=0.87,
+    mean_gene_length=950,
+    n_runs=0,
+    n_run_length=100,
+    seed=42,
+):
+    """Generate a deterministic synthetic bacterial genome.
+
+    Arguments:
+        length (`int`): The length of the genome, in nucleotides.
+        gc (`float`): The GC content of the genome.
+        usage (`dict`, optional): A mapping of sense codons to their
+            frequency in genes. Defaults to a table built with
+            `codon_usage` from the GC content.
+        gene_density (`float`): The fraction of the genome that is coding.
+        mean_gene_length (`int`): The average gene length.
+        n_runs (`int`): The number of runs of unknown nucleotides to
+            insert at random positions, replacing the genome content.
+        n_run_length (`int`): The length of each run of unknown nucleotides.
+        seed (`int`): The seed for the random number generator.
+
+    Returns:
+        `str`: The genome sequence, which only depends on the arguments.
+
+    """
+    rng = random.Random(seed)
+    if usage is None:
+        usage = codon_usage(gc)
+    mean_spacer = max(int(mean_gene_length * (1 - gene_density) / gene_density), 20)
+
+    chunks = []
+    total = 0
+    while total < length:
+        # build an intergenic region ending with a ribosome binding site
+        spacer = random_dna(rng, max(int(rng.expovariate(1 / mean_spacer)), 20), gc)
+        rbs = rng.choice(SHINE_DALGARNO)
+        gene = random_gene(rng, usage, mean_gene_length)
+        cds = "".join([spacer, rbs, random_dna(rng, rng.randint(5, 10), gc), gene])
+        # put genes on both strands, with the upstream region in the
+        # right orientation
+        if rng.random() < 0.5:
+            cds = cds[::-1].translate(COMPLEMENT)
+        chunks.append(cds)
+        total += len(cds)
+
+    genome = list("".join(chunks)[:length])
+    for _ in range(n_runs):
+        begin = rng.randrange(0, max(length - n_run_length, 1))
+        genome[begin:begin + n_run_length] = "N" * min(n_run_length, length - begin)
+    return "".join(genome)
+
+
+def synthetic_contigs(lengths, gc=0.5, seed=42, **kwargs):
+    """Generate contigs of the given lengths from distinct synthetic genomes.
+    """
+    return [
+        synthetic_genome(length, gc=gc, seed=seed + i, **kwargs)
+        for i, length in enumerate(lengths)
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic genomes to use for the benchmarks offline."
+    )
+    parser.add_argument("-o", "--output", default=os.path.dirname(os.path.realpath(__file__)))
+    parser.add_argument("-n", "--count", default=10, type=int)
+    parser.add_argument("-l", "--length", default=2000000, type=int)
+    parser.add_argument("--gc", default=[0.3, 0.5, 0.7], type=float, nargs="+")
+    parser.add_argument("--gene-density", default=0.87, type=float)
+    parser.add_argument("--n-runs", default=0, type=int)
+    parser.add_argument("--n-run-length", default=100, type=int)
+    parser.add_argument("-s", "--seed", default=42, type=int)
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    for i in range(args.count):
+        gc = args.gc[i % len(args.gc)]
+        # vary genome length like in real prokaryotic genomes
+        length = int(args.length * (0.5 + i / max(args.count - 1, 1)))
+        sequence = synthetic_genome(
+            length,
+            gc=gc,
+            gene_density=args.gene_density,
+            n_runs=args.n_runs,
+            n_run_length=args.n_run_length,
+            seed=args.seed + i,
+        )
+        name = "synthetic.{}.gc{}.fna".format(i, int(gc * 100))
+        with open(os.path.join(args.output, name), "w") as f:
+            f.write(">{}\n".format(name[:-4]))
+            for j in range(0, len(sequence), 80):
+                f.write(sequence[j:j+80])
+                f.write("\n")
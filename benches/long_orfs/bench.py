@@ -0,0 +1,116 @@
+import argparse
+import os
+import random
+import time
+import statistics
+import json
+import sys
+import warnings
+
+import tqdm
+
+sys.path.append(os.path.realpath(os.path.join(__file__, "..", "..", "..")))
+
+from pyrodigal import _pyrodigal, OrfFinder
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-r", "--runs", default=5, type=int)
+parser.add_argument("-o", "--output", required=True)
+parser.add_argument("-s", "--seed", default=42, type=int)
+parser.add_argument("-l", "--length", default=600000, type=int)
+args = parser.parse_args()
+
+BACKENDS = ["generic", None]
+if _pyrodigal._AVX2_RUNTIME_SUPPORT:
+    BACKENDS.append("avx")
+if _pyrodigal._MMX_RUNTIME_SUPPORT:
+    BACKENDS.append("mmx")
+if _pyrodigal._SSE2_RUNTIME_SUPPORT:
+    BACKENDS.append("sse")
+if _pyrodigal._NEON_RUNTIME_SUPPORT:
+    BACKENDS.append("neon")
+
+STOPS = {"TAA", "TAG", "TGA"}
+COMPLEMENT = str.maketrans("ACGT", "TGCA")
+
+
+def random_orf(rng, length, gc):
+    # draw codons until the ORF is long enough, rejecting in-frame stops
+    weights = [(1 - gc) / 2, gc / 2, gc / 2, (1 - gc) / 2]
+    codons = []
+    while 3 * len(codons) < length:
+        codon = "".join(rng.choices("ACGT", weights=weights, k=3))
+        if codon not in STOPS:
+            codons.append(codon)
+    return "ATG{}TAA".format("".join(codons))
+
+
+def synthetic_genome(rng, length, orf_length, gc):
+    # alternate ORFs on both strands, separated by short random spacers
+    parts = []
+    total = 0
+    while total < length:
+        orf = random_orf(rng, orf_length, gc)
+        if len(parts) % 4 == 2:
+            orf = orf[::-1].translate(COMPLEMENT)
+        spacer = "".join(rng.choices("ACGT", k=50))
+        parts.extend((orf, spacer))
+        total += len(orf) + len(spacer)
+    return "".join(parts)[:length]
+
+
+def run_pyrodigal(sequence, backend, meta):
+    orf_finder = OrfFinder(meta=meta, backend=backend)
+    if not meta:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            orf_finder.train(sequence)
+    genes = orf_finder.find_genes(sequence)
+    return len(genes.nodes)
+
+
+results = dict(results=[])
+rng = random.Random(args.seed)
+conditions = [
+    (gc, orf_length)
+    for gc in (0.5, 0.65, 0.8)
+    for orf_length in (1000, 10000, 50000)
+]
+for gc, orf_length in tqdm.tqdm(conditions):
+
+    # generate a sequence with giant ORFs
+    sequence = synthetic_genome(rng, args.length, orf_length, gc)
+
+    # run gene finding for every backend
+    for meta in (False, True):
+        for backend in BACKENDS:
+            times = []
+            for run in tqdm.tqdm(range(args.runs), desc=str(backend), leave=False):
+                # time how long it takes to find genes
+                t1 = time.time()
+                node_count = run_pyrodigal(sequence, backend, meta)
+                t2 = time.time()
+                # record runtime
+                times.append(t2 - t1)
+            # store benchmark result
+            results["results"].append(
+                {
+                    "gc": gc,
+                    "orf_length": orf_length,
+                    "mode": "meta" if meta else "single",
+                    "backend": backend,
+                    "node_count": node_count,
+                    "nucleotide_count": len(sequence),
+                    "times": times,
+                    "mean": statistics.mean(times),
+                    "stddev": statistics.stdev(times),
+                    "median": statistics.median(times),
+                    "min": min(times),
+                    "max": max(times),
+                }
+            )
+
+
+with open(args.output, "w") as f:
+    json.dump(results, f, sort_keys=True, indent=4)
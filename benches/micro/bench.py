@@ -0,0 +1,145 @@
+import argparse
+import io
+import os
+import time
+import statistics
+import json
+import sys
+import warnings
+
+import tqdm
+
+sys.path.append(os.path.realpath(os.path.join(__file__, "..", "..", "..")))
+sys.path.append(os.path.realpath(os.path.join(__file__, "..", "..", "data")))
+
+from pyrodigal import Nodes, OrfFinder, Sequence
+from pyrodigal._pyrodigal import METAGENOMIC_BINS
+from synthetic import synthetic_genome
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-r", "--runs", default=5, type=int)
+parser.add_argument("-o", "--output", required=True)
+parser.add_argument("-l", "--length", default=[500000, 2000000], type=int, nargs="+")
+parser.add_argument("--gc", default=[0.3, 0.5, 0.7], type=float, nargs="+")
+parser.add_argument("--n-runs", default=10, type=int)
+parser.add_argument("-s", "--seed", default=42, type=int)
+args = parser.parse_args()
+
+
+def timed(function, runs, setup=None):
+    # run the setup outside of the timed section, so that each run
+    # starts from the same state
+    times = []
+    for run in tqdm.tqdm(range(runs), desc=function.__name__, leave=False):
+        arg = setup() if setup is not None else None
+        t1 = time.time()
+        function(arg)
+        t2 = time.time()
+        times.append(t2 - t1)
+    return times
+
+
+def profiled(function, runs, profile):
+    # collect the statistics of the profiled calls made in the timed runs
+    del profile[:]
+    times = timed(function, runs)
+    return times, list(profile)
+
+
+results = dict(results=[])
+for length in tqdm.tqdm(args.length):
+    for gc in tqdm.tqdm(args.gc, leave=False):
+
+        # generate a synthetic genome with a few unknown regions
+        dna = synthetic_genome(length, gc=gc, n_runs=args.n_runs, seed=args.seed)
+        name = "synthetic.l{}.gc{}".format(length, int(gc * 100))
+        sequence = Sequence(dna, mask=True)
+
+        # train once to get the training info used by the other stages
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            training_info = OrfFinder(mask=True).train(sequence)
+        nodes = Nodes()
+        nodes.extract(sequence, translation_table=training_info.translation_table)
+        nodes.sort()
+
+        # profile single and meta modes to get the cost of the internal
+        # stages that are not exposed in the Python API
+        profile = []
+        single = OrfFinder(training_info, mask=True, profile=profile.append)
+        meta = OrfFinder(meta=True, mask=True, profile=profile.append)
+        genes = single.find_genes(sequence)
+
+        def sequence_construction(_):
+            Sequence(dna, mask=True)
+
+        def nodes_extract(_):
+            Nodes().extract(sequence, translation_table=training_info.translation_table)
+
+        def nodes_score(copy):
+            copy.score(sequence, training_info)
+
+        def train(_):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                OrfFinder(mask=True).train(sequence)
+
+        def find_genes_single(_):
+            single.find_genes(sequence)
+
+        def find_genes_meta(_):
+            meta.find_genes(sequence)
+
+        def write_gff(_):
+            genes.write_gff(io.StringIO(), name)
+
+        def write_genes(_):
+            genes.write_genes(io.StringIO(), name)
+
+        def write_translations(_):
+            genes.write_translations(io.StringIO(), name)
+
+        def write_scores(_):
+            genes.write_scores(io.StringIO(), name)
+
+        benchmarks = {
+            "sequence": timed(sequence_construction, args.runs),
+            "extract": timed(nodes_extract, args.runs),
+            "score": timed(nodes_score, args.runs, setup=nodes.copy),
+            "train": timed(train, args.runs),
+            "write_gff": timed(write_gff, args.runs),
+            "write_genes": timed(write_genes, args.runs),
+            "write_translations": timed(write_translations, args.runs),
+            "write_scores": timed(write_scores, args.runs),
+        }
+        benchmarks["find_genes_single"], stats = profiled(find_genes_single, args.runs, profile)
+        benchmarks["dynamic_programming"] = [s["times"]["dynamic_programming"] for s in stats]
+        benchmarks["find_genes_meta"], stats = profiled(find_genes_meta, args.runs, profile)
+        for i in range(len(METAGENOMIC_BINS)):
+            times = [s["bins"][i] for s in stats if i in s["bins"]]
+            if times:
+                benchmarks["meta_bin_{}".format(i)] = times
+
+        # store benchmark results
+        for benchmark, times in benchmarks.items():
+            results["results"].append(
+                {
+                    "benchmark": benchmark,
+                    "sequence": name,
+                    "backend": single.backend,
+                    "gc": gc,
+                    "node_count": len(nodes),
+                    "nucleotide_count": len(sequence),
+                    "times": times,
+                    "mean": statistics.mean(times),
+                    "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+                    "median": statistics.median(times),
+                    "min": min(times),
+                    "max": max(times),
+                }
+            )
+
+
+with open(args.output, "w") as f:
+    json.dump(results, f, sort_keys=True, indent=4)
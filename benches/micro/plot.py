@@ -0,0 +1,60 @@
+import argparse
+import itertools
+import json
+
+import numpy
+import matplotlib.pyplot as plt
+from palettable.colorbrewer.qualitative import Dark2_8
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-i", "--input", required=True)
+parser.add_argument("-o", "--output")
+parser.add_argument("-s", "--show", action="store_true")
+args = parser.parse_args()
+
+
+with open(args.input) as f:
+    data = json.load(f)
+
+# plot the per-bin timings separately from the other benchmarks
+results = [r for r in data["results"] if not r["benchmark"].startswith("meta_bin_")]
+benchmarks = list(dict.fromkeys(r["benchmark"] for r in results))
+sequences = list(dict.fromkeys(r["sequence"] for r in results))
+palette = dict(zip(sequences, itertools.cycle(Dark2_8.hex_colors)))
+
+plt.figure(1, figsize=(12, 6))
+
+plt.subplot(1, 2, 1)
+width = 0.8 / len(sequences)
+for i, sequence in enumerate(sequences):
+    group = {r["benchmark"]: r for r in results if r["sequence"] == sequence}
+    X = numpy.arange(len(benchmarks)) + i * width
+    Y = numpy.array([group[b]["median"] if b in group else 0.0 for b in benchmarks])
+    E = numpy.array([group[b]["stddev"] if b in group else 0.0 for b in benchmarks])
+    plt.bar(X, Y, width=width, yerr=E, color=palette[sequence], label=sequence)
+
+plt.xticks(numpy.arange(len(benchmarks)) + 0.4 - width / 2, benchmarks, rotation=45, ha="right")
+plt.yscale("log")
+plt.legend()
+plt.ylabel("Time (s)")
+
+
+plt.subplot(1, 2, 2)
+bins = [r for r in data["results"] if r["benchmark"].startswith("meta_bin_")]
+for sequence, group in itertools.groupby(bins, key=lambda r: r["sequence"]):
+    group = list(group)
+    X = numpy.array([int(r["benchmark"].rsplit("_", 1)[1]) for r in group])
+    Y = numpy.array([r["median"] * 1000 for r in group])
+    plt.scatter(X, Y, marker="+", color=palette[sequence], label=sequence)
+
+plt.legend()
+plt.xlabel("Metagenomic bin")
+plt.ylabel("Time (ms)")
+
+
+plt.tight_layout()
+output = args.output or args.input.replace(".json", ".svg")
+plt.savefig(output, transparent=True)
+if args.show:
+    plt.show()
@@ -0,0 +1,114 @@
+import argparse
+import os
+import glob
+import random
+import time
+import statistics
+import json
+import sys
+
+import tqdm
+
+sys.path.append(os.path.realpath(os.path.join(__file__, "..", "..", "..")))
+sys.path.append(os.path.realpath(os.path.join(__file__, "..", "..", "data")))
+
+from pyrodigal import _pyrodigal, OrfFinder, Sequence
+from pyrodigal.tests.fasta import parse
+from synthetic import synthetic_genome
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-r", "--runs", default=3, type=int)
+parser.add_argument("-d", "--data", help="a folder with FASTA files to use instead of synthetic contigs")
+parser.add_argument("-n", "--contigs", default=200, type=int)
+parser.add_argument("-s", "--seed", default=42, type=int)
+parser.add_argument("-o", "--output", required=True)
+args = parser.parse_args()
+
+BACKENDS = ["generic", None]
+if _pyrodigal._AVX2_RUNTIME_SUPPORT:
+    BACKENDS.append("avx")
+if _pyrodigal._MMX_RUNTIME_SUPPORT:
+    BACKENDS.append("mmx")
+if _pyrodigal._SSE2_RUNTIME_SUPPORT:
+    BACKENDS.append("sse")
+if _pyrodigal._NEON_RUNTIME_SUPPORT:
+    BACKENDS.append("neon")
+
+
+def synthetic_contigs(count, seed):
+    # metagenome assemblies have a long-tailed contig length distribution,
+    # with many short contigs and a few long ones: draw the lengths from
+    # a log-normal distribution with a median of 2kbp
+    rng = random.Random(seed)
+    contigs = []
+    for i in range(count):
+        length = min(max(int(rng.lognormvariate(7.6, 1.2)), 200), 1000000)
+        gc = min(max(rng.gauss(0.5, 0.12), 0.25), 0.75)
+        name = "contig_{}".format(i)
+        contigs.append((name, synthetic_genome(length, gc=gc, seed=seed + i)))
+    return contigs
+
+
+def load_contigs(folder):
+    contigs = []
+    for filename in sorted(glob.glob(os.path.join(folder, "*.fna"))):
+        with open(filename) as f:
+            contigs.extend((record.id, record.seq) for record in parse(f))
+    return contigs
+
+
+if args.data is not None:
+    contigs = load_contigs(args.data)
+else:
+    contigs = synthetic_contigs(args.contigs, args.seed)
+sequences = [(name, Sequence(seq)) for name, seq in contigs]
+
+
+results = dict(results=[])
+for backend in tqdm.tqdm(BACKENDS):
+    stats = []
+    orf_finder = OrfFinder(meta=True, backend=backend, profile=stats.append)
+    for name, sequence in tqdm.tqdm(sequences, desc=str(backend), leave=False):
+        times = []
+        del stats[:]
+        for run in range(args.runs):
+            # time how long it takes to find genes in meta mode
+            t1 = time.time()
+            genes = orf_finder.find_genes(sequence)
+            t2 = time.time()
+            # record runtime
+            times.append(t2 - t1)
+        # compute the per-bin times over all the runs
+        bins = {}
+        for s in stats:
+            for index, t in s["bins"].items():
+                bins.setdefault(index, []).append(t)
+        counters = stats[-1]["counters"]
+        # store benchmark result
+        results["results"].append(
+            {
+                "sequence": name,
+                "backend": backend,
+                "node_count": len(genes.nodes),
+                "nucleotide_count": len(sequence),
+                "gene_count": len(genes),
+                "bins_evaluated": counters["bins_evaluated"],
+                "bin_times": {
+                    str(index): statistics.median(t)
+                    for index, t in bins.items()
+                },
+                "connections_scored": counters["connections_scored"],
+                "connections_skipped": counters["connections_skipped"],
+                "times": times,
+                "mean": statistics.mean(times),
+                "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+                "median": statistics.median(times),
+                "min": min(times),
+                "max": max(times),
+            }
+        )
+
+
+with open(args.output, "w") as f:
+    json.dump(results, f, sort_keys=True, indent=4)
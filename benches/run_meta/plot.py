@@ -0,0 +1,96 @@
+import argparse
+import itertools
+import json
+
+import numpy
+import matplotlib.pyplot as plt
+import scipy.stats
+from palettable.colorbrewer.qualitative import Dark2_7
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-i", "--input", required=True)
+parser.add_argument("-o", "--output")
+parser.add_argument("-s", "--show", action="store_true")
+args = parser.parse_args()
+
+
+palette = dict(zip(["Generic", "NEON", "SSE", "AVX", "None", "MMX", "Prodigal"], Dark2_7.hex_colors))
+
+
+with open(args.input) as f:
+    data = json.load(f)
+for result in data["results"]:
+    if result["backend"] is None:
+        result["backend"] = "None"
+    elif result["backend"] == "generic":
+        result["backend"] = result["backend"].capitalize()
+    else:
+        result["backend"] = result["backend"].upper()
+
+plt.figure(1, figsize=(18, 6))
+
+plt.subplot(1, 3, 1)
+data["results"].sort(key=lambda r: (r["backend"], r["nucleotide_count"]))
+for backend, group in itertools.groupby(data["results"], key=lambda r: r["backend"]):
+    group = list(group)
+    X = numpy.array([r["nucleotide_count"] / 1_000 for r in group])
+    Y = numpy.array([r["mean"] for r in group])
+    reg = scipy.stats.linregress(X, Y)
+    plt.plot(
+        [0, max(X)],
+        [reg.intercept, reg.slope * max(X) + reg.intercept],
+        color=palette[backend],
+        linestyle="--",
+        marker="",
+    )
+    plt.scatter(
+        X,
+        Y,
+        marker="+",
+        color=palette[backend],
+        label=f"{backend} (R²={reg.rvalue**2:.3f})",
+    )
+
+plt.legend()
+plt.xlabel("Contig length (kbp)")
+plt.ylabel("Time per call (s)")
+
+
+plt.subplot(1, 3, 2)
+for backend, group in itertools.groupby(data["results"], key=lambda r: r["backend"]):
+    group = list(group)
+    X = numpy.array([r["node_count"] for r in group])
+    Y = numpy.array([
+        1000 * numpy.median(list(r["bin_times"].values())) if r["bin_times"] else 0.0
+        for r in group
+    ])
+    plt.scatter(X, Y, marker="+", color=palette[backend], label=backend)
+
+plt.legend()
+plt.xlabel("Node count")
+plt.ylabel("Median time per bin (ms)")
+
+
+plt.subplot(1, 3, 3)
+for backend, group in itertools.groupby(data["results"], key=lambda r: r["backend"]):
+    group = list(group)
+    total = sum(r["connections_scored"] + r["connections_skipped"] for r in group)
+    skipped = sum(r["connections_skipped"] for r in group)
+    bins = numpy.mean([r["bins_evaluated"] for r in group])
+    plt.bar(
+        backend,
+        100 * skipped / max(total, 1),
+        color=palette[backend],
+        label=f"{backend} ({bins:.1f} bins/contig)",
+    )
+
+plt.legend()
+plt.ylabel("Connections skipped (%)")
+
+
+plt.tight_layout()
+output = args.output or args.input.replace(".json", ".svg")
+plt.savefig(output, transparent=True)
+if args.show:
+    plt.show()
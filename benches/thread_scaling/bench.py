@@ -0,0 +1,128 @@
+import argparse
+import concurrent.futures
+import os
+import threading
+import time
+import statistics
+import json
+import sys
+import warnings
+
+import tqdm
+
+sys.path.append(os.path.realpath(os.path.join(__file__, "..", "..", "..")))
+sys.path.append(os.path.realpath(os.path.join(__file__, "..", "..", "data")))
+
+from pyrodigal import OrfFinder
+from synthetic import synthetic_genome, synthetic_contigs
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-r", "--runs", default=3, type=int)
+parser.add_argument("-j", "--jobs", default=os.cpu_count() or 1, type=int)
+parser.add_argument("-o", "--output", required=True)
+parser.add_argument("-s", "--seed", default=42, type=int)
+parser.add_argument("--short-length", default=2000, type=int)
+parser.add_argument("--short-count", default=1000, type=int)
+parser.add_argument("--long-length", default=500000, type=int)
+parser.add_argument("--long-count", default=16, type=int)
+args = parser.parse_args()
+
+
+class GilMonitor(threading.Thread):
+    """A thread measuring how long the GIL is held by other threads.
+
+    The monitor sleeps for short intervals, and records how late it wakes
+    up: since waking up requires the GIL, the delay is a lower bound of
+    the time the GIL was held without being released.
+
+    """
+
+    def __init__(self, interval=0.0005):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.blocked = 0.0
+
+    def run(self):
+        while not self.stopped.is_set():
+            t1 = time.perf_counter()
+            time.sleep(self.interval)
+            self.blocked += max(time.perf_counter() - t1 - self.interval, 0.0)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        return self.blocked
+
+
+def run_pyrodigal(orf_finder, contigs, threads):
+    # find genes in every contig with a pool of threads, and monitor
+    # the time the GIL is held while doing so
+    monitor = GilMonitor()
+    monitor.start()
+    t1 = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+        stats = [genes.stats for genes in pool.map(orf_finder.find_genes, contigs)]
+    t2 = time.perf_counter()
+    blocked = monitor.stop()
+    # the stages are the parts of a call running without the GIL, the rest
+    # of the call (argument conversion, result assembly) holds the GIL
+    held = sum(s["total"] - sum(s["times"].values()) for s in stats)
+    return t2 - t1, blocked, held
+
+
+datasets = {
+    "short": synthetic_contigs([args.short_length] * args.short_count, seed=args.seed),
+    "long": synthetic_contigs([args.long_length] * args.long_count, seed=args.seed),
+}
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    training_info = OrfFinder().train(synthetic_genome(1000000, seed=args.seed))
+orf_finders = {
+    "single": OrfFinder(training_info, profile=True),
+    "meta": OrfFinder(meta=True, profile=True),
+}
+
+results = dict(results=[])
+for (mode, orf_finder), (dataset, contigs) in tqdm.tqdm(
+    [(m, d) for m in orf_finders.items() for d in datasets.items()]
+):
+    baseline = None
+    for threads in tqdm.tqdm(range(1, args.jobs + 1), desc=f"{mode}/{dataset}", leave=False):
+        times = []
+        blocked = []
+        held = []
+        for run in range(args.runs):
+            t, b, h = run_pyrodigal(orf_finder, contigs, threads)
+            times.append(t)
+            blocked.append(b)
+            held.append(h)
+        if baseline is None:
+            baseline = statistics.median(times)
+        speedup = baseline / statistics.median(times)
+        # store benchmark result
+        results["results"].append(
+            {
+                "mode": mode,
+                "dataset": dataset,
+                "threads": threads,
+                "sequence_count": len(contigs),
+                "nucleotide_count": sum(map(len, contigs)),
+                "throughput": sum(map(len, contigs)) / statistics.median(times),
+                "speedup": speedup,
+                "efficiency": speedup / threads,
+                "gil_blocked": statistics.median(blocked),
+                "gil_held": statistics.median(held),
+                "times": times,
+                "mean": statistics.mean(times),
+                "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+                "median": statistics.median(times),
+                "min": min(times),
+                "max": max(times),
+            }
+        )
+
+
+with open(args.output, "w") as f:
+    json.dump(results, f, sort_keys=True, indent=4)
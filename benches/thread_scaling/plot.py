@@ -0,0 +1,69 @@
+import argparse
+import itertools
+import json
+
+import numpy
+import matplotlib.pyplot as plt
+from palettable.colorbrewer.qualitative import Dark2_4
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-i", "--input", required=True)
+parser.add_argument("-o", "--output")
+parser.add_argument("-s", "--show", action="store_true")
+args = parser.parse_args()
+
+
+with open(args.input) as f:
+    data = json.load(f)
+
+key = lambda r: (r["mode"], r["dataset"])
+data["results"].sort(key=lambda r: (key(r), r["threads"]))
+groups = [(k, list(g)) for k, g in itertools.groupby(data["results"], key=key)]
+palette = dict(zip([k for k, _ in groups], Dark2_4.hex_colors))
+max_threads = max(r["threads"] for r in data["results"])
+
+plt.figure(1, figsize=(18, 6))
+
+plt.subplot(1, 3, 1)
+plt.plot([1, max_threads], [1, max_threads], color="gray", linestyle=":", marker="")
+for (mode, dataset), group in groups:
+    X = numpy.array([r["threads"] for r in group])
+    Y = numpy.array([r["speedup"] for r in group])
+    plt.plot(X, Y, marker="+", color=palette[mode, dataset], label=f"{mode} ({dataset} contigs)")
+
+plt.legend()
+plt.xlabel("Threads")
+plt.ylabel("Speedup")
+
+
+plt.subplot(1, 3, 2)
+for (mode, dataset), group in groups:
+    X = numpy.array([r["threads"] for r in group])
+    Y = numpy.array([100 * r["efficiency"] for r in group])
+    plt.plot(X, Y, marker="+", color=palette[mode, dataset], label=f"{mode} ({dataset} contigs)")
+
+plt.legend()
+plt.ylim(0, 110)
+plt.xlabel("Threads")
+plt.ylabel("Efficiency (%)")
+
+
+plt.subplot(1, 3, 3)
+for (mode, dataset), group in groups:
+    X = numpy.array([r["threads"] for r in group])
+    Y = numpy.array([100 * r["gil_held"] / (r["median"] * r["threads"]) for r in group])
+    Z = numpy.array([100 * r["gil_blocked"] / r["median"] for r in group])
+    plt.plot(X, Y, marker="+", color=palette[mode, dataset], label=f"{mode} ({dataset} contigs)")
+    plt.plot(X, Z, marker="x", linestyle="--", color=palette[mode, dataset])
+
+plt.legend()
+plt.xlabel("Threads")
+plt.ylabel("Time holding the GIL (%)")
+
+
+plt.tight_layout()
+output = args.output or args.input.replace(".json", ".svg")
+plt.savefig(output, transparent=True)
+if args.show:
+    plt.show()
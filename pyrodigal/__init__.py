@@ -14,6 +14,7 @@ from ._pyrodigal import (
     Node,
     Nodes,
     OrfFinder,
+    ResourceLimitError,
     Sequence,
     TrainingInfo,
     MetagenomicBin,
@@ -22,6 +23,9 @@ from ._pyrodigal import (
     METAGENOMIC_BINS,
     PRODIGAL_VERSION,
     TRANSLATION_TABLES,
+    memory_stats,
+    track_memory,
+    tune,
 )
 
 __doc__ = _pyrodigal.__doc__
@@ -33,6 +37,7 @@ __all__ = [
     "Node",
     "Nodes",
     "OrfFinder",
+    "ResourceLimitError",
     "Sequence",
     "TrainingInfo",
     "MetagenomicBin",
@@ -41,6 +46,9 @@ __all__ = [
     "MIN_SINGLE_GENOME",
     "PRODIGAL_VERSION",
     "TRANSLATION_TABLES",
+    "memory_stats",
+    "track_memory",
+    "tune",
 ]
 
 __author__ = "Martin Larralde <martin.larralde@embl.de>"
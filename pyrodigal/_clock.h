@@ -0,0 +1,33 @@
+/* A monotonic clock usable without holding the GIL.
+ *
+ * `time.perf_counter` requires the GIL, which would distort the timings
+ * of the stages running in `nogil` blocks (and serialize the threads of
+ * a windowed gene search), so the profiling code reads the platform
+ * monotonic clock directly.
+ */
+
+#ifndef _PYRODIGAL_CLOCK_H
+#define _PYRODIGAL_CLOCK_H
+
+#ifdef _WIN32
+#include <windows.h>
+
+static inline double _monotonic(void) {
+    LARGE_INTEGER count;
+    LARGE_INTEGER frequency;
+    QueryPerformanceCounter(&count);
+    QueryPerformanceFrequency(&frequency);
+    return (double) count.QuadPart / (double) frequency.QuadPart;
+}
+
+#else
+#include <time.h>
+
+static inline double _monotonic(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double) ts.tv_sec + (double) ts.tv_nsec * 1e-9;
+}
+
+#endif
+#endif
@@ -0,0 +1,3 @@
+cdef extern from "_clock.h" nogil:
+
+    cdef double _monotonic()
@@ -3,8 +3,9 @@
 
 # ----------------------------------------------------------------------------
 
-from libc.stdint cimport int8_t, uint8_t
+from libc.stdint cimport int8_t, uint8_t, uint16_t
 
+from pyrodigal._connection cimport _hot_nodes
 from pyrodigal.prodigal.bitmap cimport bitmap_t
 from pyrodigal.prodigal.metagenomic cimport NUM_META, _metagenomic_bin
 from pyrodigal.prodigal.node cimport _node, _motif
@@ -22,6 +23,38 @@ cdef public int    _IDEAL_SINGLE_GENOME
 cdef public set    _TRANSLATION_TABLES
 cdef public str    _PRODIGAL_VERSION 
 
+# --- Profiling --------------------------------------------------------------
+
+cdef enum _profile_stage:
+    _STAGE_EXTRACT
+    _STAGE_SORT
+    _STAGE_INDEX
+    _STAGE_GC_FRAME_PLOT
+    _STAGE_SCORE
+    _STAGE_RECORD_OVERLAPPING_STARTS
+    _STAGE_DYNAMIC_PROGRAMMING
+    _STAGE_CALC_DICODON_GENE
+    _STAGE_RAW_CODING_SCORE
+    _STAGE_RBS_SCORE
+    _STAGE_TRAIN_STARTS_SD
+    _STAGE_TRAIN_STARTS_NONSD
+    _STAGE_ELIMINATE_BAD_GENES
+    _STAGE_EXTRACT_GENES
+    _STAGE_TWEAK_FINAL_STARTS
+
+cdef enum:
+    _STAGES = _STAGE_TWEAK_FINAL_STARTS + 1
+
+cdef struct _profile:
+    double times[_STAGES]
+    size_t calls[_STAGES]
+    double bin_times[NUM_META]
+    size_t bin_calls[NUM_META]
+    size_t nodes_extracted
+    size_t connections_scored
+    size_t connections_skipped
+    size_t window_resets
+
 # --- Sequence mask ----------------------------------------------------------
 
 cdef class Mask:
@@ -48,6 +81,9 @@ cdef class Masks:
         const int  end,
     ) nogil except NULL
     cdef int _clear(self) nogil
+    cdef int _sort(self) nogil
+    cdef size_t _search(self, int begin) nogil
+    cdef bint _intersects(self, int begin, int end) nogil
 
     cpdef size_t __sizeof__(self)
     cpdef list __getstate__(self)
@@ -55,6 +91,8 @@ cdef class Masks:
 
     cpdef Masks copy(self)
     cpdef void clear(self)
+    cpdef bint intersects(self, int begin, int end)
+    cpdef list intersecting(self, int begin, int end)
 
 
 # --- Input sequence ---------------------------------------------------------
@@ -62,8 +100,14 @@ cdef class Masks:
 cdef class Sequence:
     cdef          Py_ssize_t slen
     cdef          uint8_t*   digits
+    cdef          uint16_t*  hexamers
+    cdef          int*       gc_frames
+    cdef          size_t     hexamers_size
+    cdef          size_t     gc_frames_size
     cdef readonly double     gc
+    cdef          Py_ssize_t _estimated_nodes
     cdef readonly Masks      masks
+    cdef          object     base
 
     @staticmethod
     cdef int _build(
@@ -74,14 +118,43 @@ cdef class Sequence:
               uint8_t* digits,
     ) nogil except 1
     @staticmethod
+    cdef size_t _estimate_nodes(
+        const uint8_t* digits,
+        const int      slen,
+              int      translation_table=*,
+    ) nogil
+    @staticmethod
     cdef int _mask(
         const uint8_t* digits,
         const size_t   length,
               Masks    masks,
         const size_t   mask_size,
     ) nogil except 1
+    @staticmethod
+    cdef Sequence _from_contigs(
+        list         contigs,
+        bytes        linker,
+        bint         mask,
+        const size_t mask_size,
+    )
+    @staticmethod
+    cdef int _score_shine_dalgarno_exact(
+        const uint8_t mask,
+        const int dist,
+        const _training* tinf,
+    ) nogil
+    @staticmethod
+    cdef int _score_shine_dalgarno_mm(
+        const uint8_t mask,
+        const int dist,
+        const _training* tinf,
+    ) nogil
 
+    cdef size_t _get_estimated_nodes(self) nogil
     cdef int _allocate(self, int slen) except 1
+    cdef const uint16_t* _hexamer_index(self) nogil except NULL
+    cdef const int* _gc_frame_index(self) nogil except NULL
+    cdef int _gc_count(self, int begin, int end) nogil
     cdef int* _max_gc_frame_plot(self, int window_size) nogil except NULL
     cdef char _amino(
         self,
@@ -91,6 +164,11 @@ cdef class Sequence:
         bint is_init=*,
         char unknown_residue=*
     ) nogil
+    cdef uint8_t _shine_dalgarno_mask(
+        self,
+        const int pos,
+        const int strand
+    ) nogil
     cdef int _shine_dalgarno_exact(
         self,
         const int pos,
@@ -105,12 +183,16 @@ cdef class Sequence:
         const _training* tinf,
         const int strand
     ) nogil except -1
+    cdef bint _has_stops(self, int begin, int end, int tt) nogil
+    cdef Sequence _subsequence(self, int begin, int end)
+    cdef void _release_indices(self) nogil
     
 
     cpdef size_t __sizeof__(self)
     cpdef dict __getstate__(self)
     cpdef object __setstate__(self, dict state)
 
+    cpdef Sequence view(self, int begin, int end)
     cpdef object max_gc_frame_plot(self, int window_size=*)
     cpdef int shine_dalgarno(
         self,
@@ -141,15 +223,24 @@ cdef class ConnectionScorer:
     # aligned storage of node frame
     cdef uint8_t* node_frames
     cdef uint8_t* node_frames_raw
+    # compact storage of the node fields used in connection scoring
+    cdef _hot_nodes hot
 
     cpdef size_t __sizeof__(self)
 
     cdef int _index(self, Nodes nodes) nogil except -1
+    cdef int _index_scores(
+        self,
+        Nodes nodes,
+        const size_t begin,
+        const size_t end,
+    ) nogil except -1
     cdef int _compute_skippable(
         self,
         const int min,
         const int i
     ) nogil
+    cdef size_t _count_skipped(self, const int min, const int i) nogil
     cdef void _score_connections(
         self,
         Nodes nodes,
@@ -158,6 +249,15 @@ cdef class ConnectionScorer:
         const _training* tinf,
         const bint final
     ) nogil
+    cdef void _score_connections_between(
+        self,
+        Nodes nodes,
+        const int begin,
+        const int end,
+        const int i,
+        const _training* tinf,
+        const bint final
+    ) nogil
 
 
 # --- Nodes ------------------------------------------------------------------
@@ -209,16 +309,20 @@ cdef class Nodes:
         self,
         const _training* tinf,
         ConnectionScorer scorer,
-        const bint final
-    ) nogil
+        const bint final,
+        _profile* profile=*,
+    ) nogil except -2
+    cdef int _extend(self, Nodes other) nogil except -1
     cdef int _extract(
         self,
         Sequence sequence,
         const int translation_table,
         const bint closed,
         const int min_gene,
-        const int min_edge_gene
+        const int min_edge_gene,
+        int strand=*,
     ) nogil except -1
+    cdef ssize_t _lower_bound(self, int ndx) nogil
     cdef int _raw_coding_score(
         self,
         Sequence seq,
@@ -243,6 +347,7 @@ cdef class Nodes:
         const bint closed,
         const bint is_meta
     ) nogil except -1
+    cdef ssize_t _search(self, int ndx, int strand, int type) nogil
     cdef int _sort(self) nogil except 1
 
     cpdef Nodes copy(self)
@@ -279,8 +384,10 @@ cdef class Genes:
     # References to source data
     cdef          size_t       _num_seq
     cdef readonly bint         meta
+    cdef readonly bint         keep_nodes
     cdef readonly Nodes        nodes
     cdef readonly Sequence     sequence
+    cdef readonly dict         stats
     cdef readonly TrainingInfo training_info
 
     cpdef size_t __sizeof__(self)
@@ -326,10 +433,13 @@ cdef class TrainingInfo:
     @staticmethod
     cdef void _update_motif_counts(double mcnt[4][4][4096], double *zero, Sequence seq, _node* nod, int stage) nogil
 
-    cdef void _calc_dicodon_gene(self, Sequence seq, _node* nodes, int ipath) nogil except *
-    cdef void _count_upstream_composition(self, Sequence seq, int pos, int strand=*) nogil except *
-    cdef void _train_starts_nonsd(self, Nodes nodes, Sequence seq) nogil except *
-    cdef void _train_starts_sd(self, Nodes nodes, Sequence seq) nogil except *
+    @staticmethod
+    cdef void _update_upstream_composition(double ups_comp[32][4], Sequence seq, int pos, int strand) nogil
+
+    cdef void _calc_dicodon_gene(self, Sequence seq, _node* nodes, int ipath, int threads=*) nogil except *
+    cdef void _count_upstream_composition(self, Sequence seq, const int* starts, size_t nstarts, int threads=*) nogil except *
+    cdef void _train_starts_nonsd(self, Nodes nodes, Sequence seq, int threads=*) nogil except *
+    cdef void _train_starts_sd(self, Nodes nodes, Sequence seq, int threads=*) nogil except *
 
     cpdef object dump(self, object fp)
 
@@ -345,21 +455,46 @@ cdef _metagenomic_bin _METAGENOMIC_BINS[NUM_META]
 
 # --- OrfFinder --------------------------------------------------------------
 
+cdef class _Workspace:
+    cdef ConnectionScorer scorer
+    cdef Nodes            nodes
+    cdef Genes            genes
+
+    cdef size_t _size(self)
+    cdef Genes _result(self, bint keep_nodes=*)
+
 cdef class OrfFinder:
     cdef readonly size_t       _num_seq
+    cdef          list         _workspaces
+    cdef          object       _semaphores
     cdef readonly str          backend
     cdef readonly bint         closed
     cdef readonly object       lock
     cdef readonly bint         mask
+    cdef readonly object       max_concurrency
+    cdef readonly object       max_nodes
     cdef readonly int          max_overlap
+    cdef readonly object       max_sequence_length
     cdef readonly bint         meta
     cdef readonly int          min_gene
     cdef readonly int          min_edge_gene
+    cdef readonly object       profile
     cdef readonly TrainingInfo training_info
 
     cpdef dict __getstate__(self)
     cpdef object __setstate__(self, dict state)
 
+    cdef _Workspace _acquire_workspace(self)
+    cdef int _release_workspace(self, _Workspace workspace) except -1
+    cdef Sequence _as_sequence(self, object sequence)
+    cdef int _check_length(self, object sequence) except -1
+    cdef int _check_limits(
+        self,
+        Sequence sequence,
+        object translation_tables,
+        object window=*,
+        object overlap=*,
+    ) except -1
     cdef int _train(
         self,
         Sequence sequence,
@@ -367,7 +502,19 @@ cdef class OrfFinder:
         ConnectionScorer scorer,
         TrainingInfo tinf,
         bint force_nonsd,
-    ) nogil except -1
+        int threads,
+        _profile* profile=*,
+        int* gc_frame=*,
+    ) except -1
+    cdef double _train_candidate(
+        self,
+        Sequence sequence,
+        TrainingInfo tinf,
+        bint force_nonsd,
+        int threads,
+        _profile* profile=*,
+        int* gc_frame=*,
+    ) except -1
     cdef int _find_genes_single(
         self,
         Sequence sequence,
@@ -375,6 +522,17 @@ cdef class OrfFinder:
         ConnectionScorer scorer,
         Nodes nodes,
         Genes genes,
+        _profile* profile=*,
+    ) nogil except -1
+    cdef int _predict_genes(
+        self,
+        Sequence sequence,
+        _training* tinf,
+        ConnectionScorer scorer,
+        Nodes nodes,
+        Genes genes,
+        double* score=*,
+        _profile* profile=*,
     ) nogil except -1
     cdef int _find_genes_meta(
         self,
@@ -382,6 +540,53 @@ cdef class OrfFinder:
         ConnectionScorer scorer,
         Nodes nodes,
         Genes genes,
+        _profile* profile=*,
     ) nogil except -1
+    cdef list _find_genes_windows(
+        self,
+        Sequence sequence,
+        TrainingInfo tinf,
+        list bounds,
+        int threads,
+        _profile* profile=*,
+    )
+    cdef tuple _stitch_windows(
+        self,
+        Sequence sequence,
+        TrainingInfo tinf,
+        tuple left,
+        tuple right,
+        int first,
+    )
+    cdef int _emit_window(
+        self,
+        tuple window,
+        int begin,
+        int end,
+        size_t first,
+        size_t last,
+        Nodes nodes,
+        Genes genes,
+        Nodes gene_nodes,
+    ) except -1
+    cdef int _find_genes_windowed(
+        self,
+        Sequence sequence,
+        TrainingInfo tinf,
+        Nodes nodes,
+        Genes genes,
+        int window,
+        int overlap,
+        int threads,
+        bint keep_nodes=*,
+        _profile* profile=*,
+    ) except -1
 
-    cpdef Genes find_genes(self, object sequence)
+    cpdef Genes find_genes(
+        self,
+        object sequence,
+        object window=*,
+        object overlap=*,
+        int threads=*,
+        bint keep_nodes=*,
+    )
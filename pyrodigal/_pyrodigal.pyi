@@ -1,7 +1,13 @@
 import array
+import concurrent.futures
+import os
 import threading
+import types
 import typing
 from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
     FrozenSet,
     Iterable,
     Iterator,
@@ -10,9 +16,13 @@ from typing import (
     Optional,
     TextIO,
     Tuple,
+    TypeVar,
     Union,
 )
 
+_T = TypeVar("_T")
+_SELF = TypeVar("_SELF")
+
 # --- Globals ----------------------------------------------------------------
 
 _TARGET_CPU: str
@@ -28,6 +38,10 @@ _MMX_BUILD_SUPPORT: bool
 TRANSLATION_TABLES: FrozenSet[int]
 METAGENOMIC_BINS: Tuple[MetagenomicBin]
 
+# --- Exceptions -------------------------------------------------------------
+
+class ResourceLimitError(ValueError): ...
+
 # --- Sequence mask ----------------------------------------------------------
 
 class Mask:
@@ -51,6 +65,8 @@ class Masks(typing.Sequence[Mask]):
     def __setstate__(self, state: List[Tuple[int, int]]) -> None: ...
     def clear(self) -> None: ...
     def copy(self) -> Masks: ...
+    def intersects(self, begin: int, end: int) -> bool: ...
+    def intersecting(self, begin: int, end: int) -> List[Mask]: ...
 
 # --- Input sequence ---------------------------------------------------------
 
@@ -62,11 +78,25 @@ class Sequence(typing.Sized):
         sequence: Union[str, bytes, bytearray, Sequence], 
         mask: bool = False
     ) -> None: ...
+    @classmethod
+    def from_digits(
+        cls,
+        buffer: Union[bytes, bytearray, memoryview],
+        gc: Optional[float] = None,
+        masks: Optional[Masks] = None,
+    ) -> Sequence: ...
     def __len__(self) -> int: ...
+    @typing.overload
+    def __getitem__(self, index: int) -> str: ...
+    @typing.overload
+    def __getitem__(self, index: slice) -> Sequence: ...
     def __sizeof__(self) -> int: ...
     def __str__(self) -> str: ...
     def __getstate__(self) -> Dict[str, object]: ...
     def __setstate__(self, state: Dict[str, object]) -> None: ...
+    @property
+    def estimated_nodes(self) -> int: ...
+    def view(self, begin: int, end: int) -> Sequence: ...
     def max_gc_frame_plot(self, window_size: int = 120) -> array.array[int]: ...
     def shine_dalgarno(
         self,
@@ -87,6 +117,15 @@ class ConnectionScorer:
         self, nodes: Nodes, min: int, i: int, tinf: TrainingInfo, final: bool = False
     ) -> None: ...
 
+def track_memory(enabled: bool = True) -> bool: ...
+def memory_stats(*, reset: bool = False) -> Dict[str, object]: ...
+def tune(
+    path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    *,
+    force: bool = False,
+    runs: int = 5,
+) -> Optional[str]: ...
+
 # --- Nodes ------------------------------------------------------------------
 
 class Node:
@@ -207,6 +246,10 @@ class Genes(typing.Sequence[Gene]):
     def nodes(self) -> Nodes: ...
     @property
     def meta(self) -> bool: ...
+    @property
+    def keep_nodes(self) -> bool: ...
+    @property
+    def stats(self) -> Optional[Dict[str, object]]: ...
     def __bool__(self) -> int: ...
     def __len__(self) -> int: ...
     def __getitem__(self, index: int) -> Gene: ...  # type: ignore
@@ -309,10 +352,21 @@ class OrfFinder:
         min_edge_gene: int = 60,
         max_overlap: int = 60,
         backend: str = "detect",
+        profile: Union[bool, Callable[[Dict[str, object]], object]] = False,
+        max_nodes: Optional[int] = None,
+        max_sequence_length: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None: ...
     def __repr__(self) -> str: ...
     def __getstate__(self) -> Dict[str, object]: ...
     def __setstate__(self, state: Dict[str, object]) -> None: ...
+    def __enter__(self: _SELF) -> _SELF: ...
+    def __exit__(
+        self,
+        exc_type: Optional[typing.Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[types.TracebackType],
+    ) -> None: ...
     @property
     def training_info(self) -> Optional[TrainingInfo]: ...
     @property
@@ -329,22 +383,77 @@ class OrfFinder:
     def max_overlap(self) -> int: ...
     @property
     def backend(self) -> str: ...
-    def find_genes(self, sequence: Union[Sequence, str, bytes, bytearray]) -> Genes: ...
-    @typing.overload
-    def train(
+    @property
+    def profile(self) -> Union[bool, Callable[[Dict[str, object]], object]]: ...
+    @property
+    def max_nodes(self) -> Optional[int]: ...
+    @property
+    def max_sequence_length(self) -> Optional[int]: ...
+    @property
+    def max_concurrency(self) -> Optional[int]: ...
+    def close(self) -> None: ...
+    def find_genes(
         self,
-        sequence: str,
-        *sequences: str,
-        force_nonsd: bool = False,
-        start_weight: float = 4.35,
-        translation_table: int = 11,
-    ) -> TrainingInfo: ...
-    @typing.overload
+        sequence: Union[Sequence, str, bytes, bytearray],
+        window: Optional[int] = None,
+        overlap: Optional[int] = None,
+        threads: int = 1,
+        keep_nodes: bool = True,
+    ) -> Genes: ...
+    def find_genes_multi(
+        self,
+        sequence: Union[Sequence, str, bytes, bytearray],
+        training_infos: Iterable[TrainingInfo],
+        threads: int = 1,
+        keep_nodes: bool = True,
+    ) -> List[Tuple[Genes, float]]: ...
+    def iter_find_genes(
+        self,
+        records: Iterable[Tuple[_T, Union[Sequence, str, bytes, bytearray]]],
+        threads: int = 1,
+        max_in_flight: Optional[int] = None,
+        *,
+        window: Optional[int] = None,
+        overlap: Optional[int] = None,
+        keep_nodes: bool = True,
+    ) -> Iterator[Tuple[_T, Genes]]: ...
+    async def find_genes_async(
+        self,
+        sequence: Union[Sequence, str, bytes, bytearray],
+        window: Optional[int] = None,
+        overlap: Optional[int] = None,
+        threads: int = 1,
+        keep_nodes: bool = True,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Genes: ...
+    def iter_find_genes_async(
+        self,
+        sequences: Union[
+            Iterable[Union[Sequence, str, bytes, bytearray]],
+            AsyncIterable[Union[Sequence, str, bytes, bytearray]],
+        ],
+        concurrency: Optional[int] = None,
+        *,
+        window: Optional[int] = None,
+        overlap: Optional[int] = None,
+        threads: int = 1,
+        keep_nodes: bool = True,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> AsyncIterator[Genes]: ...
     def train(
         self,
-        sequence: Union[bytes, bytearray],
-        *sequences: Union[bytes, bytearray],
+        sequence: Union[
+            Sequence,
+            str,
+            bytes,
+            bytearray,
+            Iterable[Union[Sequence, str, bytes, bytearray]],
+        ],
+        *sequences: Union[Sequence, str, bytes, bytearray],
         force_nonsd: bool = False,
         start_weight: float = 4.35,
-        translation_table: int = 11,
+        translation_table: Union[int, str] = 11,
+        threads: int = 1,
+        candidates: Iterable[int] = (11, 4, 25),
     ) -> TrainingInfo: ...
@@ -71,16 +71,25 @@ References:
 # ----------------------------------------------------------------------------
 
 from cpython cimport Py_buffer
-from cpython.buffer cimport PyBUF_FORMAT, PyBUF_READ, PyBUF_WRITE
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_READ, PyBUF_WRITE, PyBUF_WRITABLE, PyObject_CheckBuffer
 from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AsString
-from cpython.exc cimport PyErr_CheckSignals
+from cpython.exc cimport PyErr_CheckSignals, PyErr_Fetch, PyErr_Restore
 from cpython.list cimport PyList_New, PyList_SET_ITEM
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 from cpython.memoryview cimport PyMemoryView_FromMemory
-from cpython.ref cimport Py_INCREF
+from cpython.pythread cimport (
+    PyThread_type_lock,
+    PyThread_allocate_lock,
+    PyThread_free_lock,
+    PyThread_acquire_lock,
+    PyThread_release_lock,
+    PyThread_start_new_thread,
+    WAIT_LOCK,
+)
+from cpython.ref cimport PyObject, Py_INCREF, Py_XDECREF
 from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
 from libc.math cimport sqrt, log, pow, fmax, fmin
-from libc.stdint cimport int8_t, uint8_t, uintptr_t
+from libc.stdint cimport int8_t, uint8_t, uint16_t, uint64_t, uintptr_t
 from libc.stdio cimport printf
 from libc.stdlib cimport abs, malloc, calloc, free, qsort
 from libc.string cimport memcpy, memchr, memset, strstr
@@ -90,6 +99,7 @@ from pyrodigal.prodigal.metagenomic cimport NUM_META, _metagenomic_bin, initiali
 from pyrodigal.prodigal.node cimport _motif, _node, MIN_EDGE_GENE, MIN_GENE, MAX_SAM_OVLP, cross_mask, compare_nodes, stopcmp_nodes
 from pyrodigal.prodigal.sequence cimport _mask, node_type, rcom_seq, MASK_SIZE
 from pyrodigal.prodigal.training cimport _training
+from pyrodigal._clock cimport _monotonic
 from pyrodigal._unicode cimport *
 from pyrodigal._sequence cimport (
     nucleotide,
@@ -105,6 +115,7 @@ from pyrodigal._sequence cimport (
     _complement
 )
 from pyrodigal._connection cimport (
+    _hot_nodes,
     _intergenic_mod_same,
     _intergenic_mod_diff,
     _intergenic_mod,
@@ -116,7 +127,7 @@ from pyrodigal._connection cimport (
     connection_function,
     CONNECTION_FUNCTIONS,
 )
-from pyrodigal.impl.generic cimport skippable_generic
+from pyrodigal.impl.generic cimport skippable_generic, skippable_generic_single
 
 IF MMX_BUILD_SUPPORT:
     from pyrodigal.impl.mmx cimport skippable_mmx
@@ -137,10 +148,19 @@ ELSE:
 # ----------------------------------------------------------------------------
 
 import array
+import collections
+import concurrent.futures
+import hashlib
 import itertools
+import json
+import os
+import platform
+import sys
 import textwrap
 import threading
+import time
 import warnings
+import weakref
 
 include "_version.py"
 
@@ -152,9 +172,22 @@ cdef size_t MIN_NODES_ALLOC      = 8 * MIN_GENES_ALLOC
 cdef int    _IDEAL_SINGLE_GENOME = 100000
 cdef int    _MIN_SINGLE_GENOME   = 20000
 cdef int    _WINDOW              = 120
+cdef int    _WINDOW_MARGIN       = 64
 cdef set    _TRANSLATION_TABLES  = set(range(1, 7)) | set(range(9, 17)) | set(range(21, 26))
 cdef str    _PRODIGAL_VERSION    = "v2.6.3+c1e2d36"
 
+# the maximum number of workspaces kept by an `OrfFinder` between calls,
+# and the maximum size of the buffers of a workspace worth keeping
+cdef Py_ssize_t _MAX_WORKSPACES      = os.cpu_count() or 1
+cdef size_t     _MAX_WORKSPACE_SIZE  = 64 * 1024 * 1024
+
+# the number of distinct upstream motifs of length 3 to 6, and the masks
+# to extract them from a hexamer index
+cdef int    _MOTIF_SIZES[4]
+cdef int    _MOTIF_MASKS[4]
+_MOTIF_SIZES[:] = [0x40, 0x100, 0x400, 0x1000]
+_MOTIF_MASKS[:] = [0x3F, 0xFF,  0x3FF, 0xFFF ]
+
 IDEAL_SINGLE_GENOME = 100000
 MIN_SINGLE_GENOME   = 20000
 TRANSLATION_TABLES  = frozenset(_TRANSLATION_TABLES)
@@ -185,6 +218,488 @@ cdef list _NODE_TYPE = [
 cdef inline size_t new_capacity(size_t capacity) nogil:
     return capacity + (capacity >> 3) + 6
 
+# --- Exceptions -------------------------------------------------------------
+
+class ResourceLimitError(ValueError):
+    """An input exceeding one of the resource limits of an `OrfFinder`.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+# --- Parallel tasks ---------------------------------------------------------
+
+ctypedef int (*_task_function)(void* data, int index) nogil
+
+cdef struct _task:
+    _task_function     function
+    void*              data
+    int                index
+    int                status
+    PyThread_type_lock done
+    PyObject*          exc_type
+    PyObject*          exc_value
+    PyObject*          exc_traceback
+
+cdef inline void _chunk(size_t length, int chunks, int index, size_t* begin, size_t* end) nogil:
+    """Get the bounds of the ``index``-th of ``chunks`` consecutive chunks.
+    """
+    begin[0] = (length * index) // chunks
+    end[0] = (length * (index + 1)) // chunks
+
+cdef void _run_task(_task* task) nogil:
+    # keep a thread state alive while the task is running, so that an
+    # exception raised by the task can be recovered by the calling thread
+    with gil:
+        with nogil:
+            task.status = task.function(task.data, task.index)
+        if task.status != 0:
+            PyErr_Fetch(&task.exc_type, &task.exc_value, &task.exc_traceback)
+
+# --- Worker threads ---------------------------------------------------------
+
+cdef enum:
+    _MAX_IDLE_WORKERS = 256
+
+cdef struct _worker:
+    PyThread_type_lock wake  # released to hand a new task over to the worker
+    _task*             task  # the task to run when the worker wakes up
+
+# worker threads are kept alive once their task is done, waiting for a new
+# task in the idle stack, so that parallel stages do not have to start new
+# threads every time
+cdef PyThread_type_lock _WORKERS_LOCK = PyThread_allocate_lock()
+cdef _worker*           _IDLE_WORKERS[<int> _MAX_IDLE_WORKERS]
+cdef int                _IDLE_COUNT   = 0
+
+cdef void _worker_main(void* arg) nogil:
+    global _IDLE_COUNT
+    cdef _worker*           worker = <_worker*> arg
+    cdef PyThread_type_lock done
+    cdef bint               idle
+    while True:
+        PyThread_acquire_lock(worker.wake, WAIT_LOCK)
+        _run_task(worker.task)
+        # go back to the idle stack before notifying the calling thread,
+        # so that the worker can be reused by the next parallel stage
+        done = worker.task.done
+        worker.task = NULL
+        PyThread_acquire_lock(_WORKERS_LOCK, WAIT_LOCK)
+        idle = _IDLE_COUNT < _MAX_IDLE_WORKERS
+        if idle:
+            _IDLE_WORKERS[_IDLE_COUNT] = worker
+            _IDLE_COUNT += 1
+        PyThread_release_lock(_WORKERS_LOCK)
+        PyThread_release_lock(done)
+        if not idle:
+            break
+    with gil:
+        PyThread_free_lock(worker.wake)
+    free(worker)
+
+cdef int _start_task(_task* task) nogil:
+    """Run ``task`` in an idle worker thread, or in a new one.
+
+    Returns:
+        `int`: *0* on success, or *-1* if the task could not be started,
+        in which case it must be run by the calling thread.
+
+    """
+    global _IDLE_COUNT
+    cdef _worker* worker = NULL
+
+    PyThread_acquire_lock(_WORKERS_LOCK, WAIT_LOCK)
+    if _IDLE_COUNT > 0:
+        _IDLE_COUNT -= 1
+        worker = _IDLE_WORKERS[_IDLE_COUNT]
+    PyThread_release_lock(_WORKERS_LOCK)
+
+    # wake up an idle worker with the new task
+    if worker != NULL:
+        worker.task = task
+        PyThread_release_lock(worker.wake)
+        return 0
+
+    # start a new worker otherwise, with its wake lock already released
+    # so that it starts running the task immediately
+    worker = <_worker*> malloc(sizeof(_worker))
+    if worker == NULL:
+        return -1
+    worker.task = task
+    with gil:
+        worker.wake = PyThread_allocate_lock()
+        if worker.wake == NULL:
+            free(worker)
+            return -1
+        if <long> PyThread_start_new_thread(_worker_main, worker) == -1:
+            PyThread_free_lock(worker.wake)
+            free(worker)
+            return -1
+    return 0
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+def _shared_executor():
+    """Get the executor running the asynchronous calls by default.
+
+    The executor is created on first use, so that programs not using
+    `asyncio` do not start any thread, and then shared by every ORF finder.
+
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = concurrent.futures.ThreadPoolExecutor(os.cpu_count() or 1)
+        return _EXECUTOR
+
+def _reset_workers():
+    """Forget the worker threads, which do not exist after a fork.
+    """
+    global _WORKERS_LOCK, _IDLE_COUNT, _EXECUTOR, _EXECUTOR_LOCK
+    _WORKERS_LOCK = PyThread_allocate_lock()
+    _IDLE_COUNT = 0
+    _EXECUTOR = None
+    _EXECUTOR_LOCK = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_workers)
+
+cdef int _run_tasks(_task_function function, void* data, int count) nogil except -1:
+    """Run ``function(data, i)`` for every ``i`` in ``range(count)``.
+
+    The first task is run in the calling thread, and every other task in
+    a worker thread if one can be started. Worker threads are reused
+    across calls, so that short parallel stages do not pay for starting
+    new threads. Tasks returning a non-zero
+    status are expected to have raised an exception, which is propagated
+    once all tasks are done.
+
+    """
+    cdef int    i
+    cdef int    status = 0
+    cdef _task* tasks  = NULL
+
+    # run the tasks sequentially if they cannot be run in parallel
+    if count > 1:
+        tasks = <_task*> calloc(count, sizeof(_task))
+    if tasks == NULL:
+        for i in range(count):
+            if function(data, i) != 0:
+                return -1
+        return 0
+
+    for i in range(count):
+        tasks[i].function = function
+        tasks[i].data = data
+        tasks[i].index = i
+
+    # hand the tasks over to worker threads, tasks that could not be
+    # started are run in the calling thread instead
+    IF SYS_IMPLEMENTATION_NAME != "pypy":
+        with gil:
+            for i in range(1, count):
+                tasks[i].done = PyThread_allocate_lock()
+                if tasks[i].done == NULL:
+                    continue
+                PyThread_acquire_lock(tasks[i].done, WAIT_LOCK)
+                if _start_task(&tasks[i]) != 0:
+                    PyThread_release_lock(tasks[i].done)
+                    PyThread_free_lock(tasks[i].done)
+                    tasks[i].done = NULL
+
+    # run the remaining tasks in the calling thread
+    for i in range(count):
+        if status == 0 and (i == 0 or tasks[i].done == NULL):
+            status = function(data, i)
+
+    # wait for the worker threads
+    for i in range(1, count):
+        if tasks[i].done != NULL:
+            PyThread_acquire_lock(tasks[i].done, WAIT_LOCK)
+            PyThread_release_lock(tasks[i].done)
+
+    # release the locks and propagate the first exception of a worker
+    with gil:
+        for i in range(1, count):
+            if tasks[i].done == NULL:
+                continue
+            PyThread_free_lock(tasks[i].done)
+            if tasks[i].status != 0 and status == 0:
+                PyErr_Restore(tasks[i].exc_type, tasks[i].exc_value, tasks[i].exc_traceback)
+                status = -1
+            else:
+                Py_XDECREF(tasks[i].exc_type)
+                Py_XDECREF(tasks[i].exc_value)
+                Py_XDECREF(tasks[i].exc_traceback)
+
+    free(tasks)
+    return status
+
+# --- Memory accounting ------------------------------------------------------
+
+cdef enum _memory_subsystem:
+    _MEMORY_MASKS
+    _MEMORY_SEQUENCE
+    _MEMORY_SEQUENCE_INDEX
+    _MEMORY_GC_FRAME_PLOT
+    _MEMORY_NODES
+    _MEMORY_GENES
+    _MEMORY_CONNECTION_SCORER
+    _MEMORY_TRAINING_INFO
+    _MEMORY_TRAINING_BUFFERS
+    _MEMORY_SUBSYSTEMS
+
+ctypedef struct _memory_counters:
+    size_t current
+    size_t peak
+    size_t allocations
+    size_t reallocations
+    size_t frees
+
+cdef tuple _MEMORY_SUBSYSTEM_NAMES = (
+    "masks",
+    "sequence",
+    "sequence_index",
+    "gc_frame_plot",
+    "nodes",
+    "genes",
+    "connection_scorer",
+    "training_info",
+    "training_buffers",
+)
+
+cdef bint               _MEMORY_TRACKING = False
+cdef PyThread_type_lock _MEMORY_LOCK     = PyThread_allocate_lock()
+cdef _memory_counters   _MEMORY_TOTAL
+cdef _memory_counters   _MEMORY_COUNTERS[<int> _MEMORY_SUBSYSTEMS]
+memset(&_MEMORY_TOTAL, 0, sizeof(_memory_counters))
+memset(_MEMORY_COUNTERS, 0, sizeof(_MEMORY_COUNTERS))
+
+cdef inline void _memory_update(_memory_counters* counters, size_t old_size, size_t new_size) nogil:
+    if old_size == 0:
+        counters.allocations += 1
+    elif new_size == 0:
+        counters.frees += 1
+    else:
+        counters.reallocations += 1
+    # blocks allocated before tracking was enabled are not accounted for,
+    # so make sure releasing them does not wrap the current size around
+    counters.current -= min(counters.current, old_size)
+    counters.current += new_size
+    counters.peak = max(counters.peak, counters.current)
+
+cdef inline void _memory_record(_memory_subsystem subsystem, size_t old_size, size_t new_size) nogil:
+    """Record a change in the size of a block owned by ``subsystem``.
+
+    An allocation is recorded with an ``old_size`` of zero, and a
+    deallocation with a ``new_size`` of zero. This is a no-op unless
+    memory tracking was enabled with `~pyrodigal.track_memory`.
+
+    """
+    if not _MEMORY_TRACKING or (old_size == 0 and new_size == 0):
+        return
+    PyThread_acquire_lock(_MEMORY_LOCK, WAIT_LOCK)
+    _memory_update(&_MEMORY_COUNTERS[<int> subsystem], old_size, new_size)
+    _memory_update(&_MEMORY_TOTAL, old_size, new_size)
+    PyThread_release_lock(_MEMORY_LOCK)
+
+cdef dict _memory_counters_dict(_memory_counters* counters):
+    return {
+        "current": counters.current,
+        "peak": counters.peak,
+        "allocations": counters.allocations,
+        "reallocations": counters.reallocations,
+        "frees": counters.frees,
+    }
+
+def track_memory(bint enabled=True):
+    """track_memory(enabled=True)\n--
+
+    Enable or disable the accounting of memory allocated by Pyrodigal.
+
+    Memory tracking is disabled by default, since it requires a lock
+    to be acquired on every allocation. Enabling it resets all the
+    counters reported by `~pyrodigal.memory_stats`.
+
+    Arguments:
+        enabled (`bool`): Whether to enable or disable memory tracking.
+
+    Returns:
+        `bool`: Whether memory tracking was enabled before the call.
+
+    Caution:
+        Only the memory allocated while tracking is enabled is accounted
+        for: buffers of objects created before the call (for instance,
+        a `~pyrodigal.Sequence`) are not included in the statistics.
+
+    .. versionadded:: 2.1.0
+
+    """
+    global _MEMORY_TRACKING
+    cdef bint previous
+    with nogil:
+        PyThread_acquire_lock(_MEMORY_LOCK, WAIT_LOCK)
+        previous = _MEMORY_TRACKING
+        if enabled and not previous:
+            memset(&_MEMORY_TOTAL, 0, sizeof(_memory_counters))
+            memset(_MEMORY_COUNTERS, 0, sizeof(_MEMORY_COUNTERS))
+        _MEMORY_TRACKING = enabled
+        PyThread_release_lock(_MEMORY_LOCK)
+    return previous
+
+def memory_stats(*, bint reset=False):
+    """memory_stats(*, reset=False)\n--
+
+    Get statistics about the memory allocated by Pyrodigal.
+
+    Statistics are reported for the whole process, and for each of the
+    subsystems allocating memory: ``masks``, ``sequence`` (nucleotide
+    storage), ``sequence_index`` (hexamer and GC indices), ``gc_frame_plot``,
+    ``nodes``, ``genes``, ``connection_scorer``, ``training_info`` and
+    ``training_buffers`` (temporary counts used by `OrfFinder.train`).
+
+    Keyword Arguments:
+        reset (`bool`): Set to `True` to reset the peak sizes to the
+            current sizes, and the allocation counts to zero, after
+            the statistics have been read.
+
+    Returns:
+        `dict`: A dictionary with a ``tracking`` key, recording whether
+        memory tracking is enabled, ``current``, ``peak``, ``allocations``,
+        ``reallocations`` and ``frees`` keys for the whole process, and
+        a ``subsystems`` key mapping each subsystem name to a dictionary
+        with the same counters. Sizes are given in bytes.
+
+    Example:
+        To measure the memory used by a single call, reset the
+        statistics before making the call, and read them afterwards::
+
+            >>> previous = pyrodigal.track_memory()
+            >>> orf_finder = pyrodigal.OrfFinder(meta=True)
+            >>> _ = pyrodigal.memory_stats(reset=True)
+            >>> genes = orf_finder.find_genes("ATGAAACGCATTAGCACCACCATTACCACCACCATCACCATTACCACAGGTAACGGTGCGGGCTGA")
+            >>> stats = pyrodigal.memory_stats()
+            >>> stats["subsystems"]["nodes"]["peak"] > 0
+            True
+            >>> _ = pyrodigal.track_memory(previous)
+
+    Hint:
+        Counters are process-wide: when several calls run concurrently in
+        different threads, their allocations are reported together.
+
+    .. versionadded:: 2.1.0
+
+    """
+    cdef int              i
+    cdef dict             stats
+    cdef bint             tracking
+    cdef _memory_counters total
+    cdef _memory_counters counters[<int> _MEMORY_SUBSYSTEMS]
+
+    # only copy the counters while holding the lock: building the Python
+    # objects may trigger the garbage collector, which may deallocate
+    # objects and record their memory release, acquiring the lock again
+    with nogil:
+        PyThread_acquire_lock(_MEMORY_LOCK, WAIT_LOCK)
+        tracking = _MEMORY_TRACKING
+        memcpy(&total, &_MEMORY_TOTAL, sizeof(_memory_counters))
+        memcpy(counters, _MEMORY_COUNTERS, sizeof(_MEMORY_COUNTERS))
+        if reset:
+            for i in range(<int> _MEMORY_SUBSYSTEMS):
+                _MEMORY_COUNTERS[i].peak = _MEMORY_COUNTERS[i].current
+                _MEMORY_COUNTERS[i].allocations = 0
+                _MEMORY_COUNTERS[i].reallocations = 0
+                _MEMORY_COUNTERS[i].frees = 0
+            _MEMORY_TOTAL.peak = _MEMORY_TOTAL.current
+            _MEMORY_TOTAL.allocations = 0
+            _MEMORY_TOTAL.reallocations = 0
+            _MEMORY_TOTAL.frees = 0
+        PyThread_release_lock(_MEMORY_LOCK)
+
+    stats = _memory_counters_dict(&total)
+    stats["tracking"] = tracking
+    stats["subsystems"] = {
+        name: _memory_counters_dict(&counters[i])
+        for i, name in enumerate(_MEMORY_SUBSYSTEM_NAMES)
+    }
+    return stats
+
+# --- Profiling --------------------------------------------------------------
+
+cdef tuple _PROFILE_STAGE_NAMES = (
+    "extract",
+    "sort",
+    "index",
+    "gc_frame_plot",
+    "score",
+    "record_overlapping_starts",
+    "dynamic_programming",
+    "calc_dicodon_gene",
+    "raw_coding_score",
+    "rbs_score",
+    "train_starts_sd",
+    "train_starts_nonsd",
+    "eliminate_bad_genes",
+    "extract_genes",
+    "tweak_final_starts",
+)
+
+cdef inline double _profile_start(const _profile* profile) nogil:
+    """Get the current time, or zero if profiling is disabled.
+    """
+    return 0.0 if profile == NULL else _monotonic()
+
+cdef inline void _profile_record(_profile* profile, _profile_stage stage, double* start) nogil:
+    """Record the time spent in ``stage`` since ``start``, and reset it.
+    """
+    cdef double now
+    if profile != NULL:
+        now = _monotonic()
+        profile.times[<int> stage] += now - start[0]
+        profile.calls[<int> stage] += 1
+        start[0] = now
+
+cdef void _profile_merge(_profile* profile, const _profile* other) nogil:
+    cdef int i
+    for i in range(<int> _STAGES):
+        profile.times[i] += other.times[i]
+        profile.calls[i] += other.calls[i]
+    for i in range(NUM_META):
+        profile.bin_times[i] += other.bin_times[i]
+        profile.bin_calls[i] += other.bin_calls[i]
+    profile.nodes_extracted += other.nodes_extracted
+    profile.connections_scored += other.connections_scored
+    profile.connections_skipped += other.connections_skipped
+    profile.window_resets += other.window_resets
+
+cdef dict _profile_dict(const _profile* profile, str method, double total):
+    cdef int    i
+    cdef size_t bins_evaluated = 0
+    for i in range(NUM_META):
+        bins_evaluated += profile.bin_calls[i]
+    return {
+        "method": method,
+        "total": total,
+        "times": {
+            name: profile.times[i]
+            for i, name in enumerate(_PROFILE_STAGE_NAMES)
+            if profile.calls[i] > 0
+        },
+        "bins": {
+            i: profile.bin_times[i]
+            for i in range(NUM_META)
+            if profile.bin_calls[i] > 0
+        },
+        "counters": {
+            "nodes_extracted": profile.nodes_extracted,
+            "connections_scored": profile.connections_scored,
+            "connections_skipped": profile.connections_skipped,
+            "bins_evaluated": bins_evaluated,
+            "window_resets": profile.window_resets,
+        },
+    }
+
 # --- Sequence mask ----------------------------------------------------------
 
 cdef class Mask:
@@ -275,6 +790,15 @@ cdef class Mask:
         return Mask._intersects(self.mask, begin, end)
 
 
+cdef int _compare_masks(const void* a, const void* b) nogil:
+    cdef const _mask* x = <const _mask*> a
+    cdef const _mask* y = <const _mask*> b
+    if x.begin != y.begin:
+        return -1 if x.begin < y.begin else 1
+    if x.end != y.end:
+        return -1 if x.end < y.end else 1
+    return 0
+
 cdef class Masks:
     """A list of masked regions within a `~pyrodigal.Sequence`.
 
@@ -291,6 +815,10 @@ cdef class Masks:
         allows to bypass the full scan, saving some time for sequences with
         a lot of unknown regions.
 
+    .. versionchanged:: 2.1.0
+        Masks are always kept sorted and non-overlapping, so that the
+        masks intersecting a region can be found with a binary search.
+
     """
 
     # --- Magic methods ------------------------------------------------------
@@ -304,6 +832,7 @@ cdef class Masks:
         self._clear()
 
     def __dealloc__(self):
+        _memory_record(_MEMORY_MASKS, self.capacity * sizeof(_mask), 0)
         PyMem_Free(self.masks)
 
     def __copy__(self):
@@ -342,16 +871,21 @@ cdef class Masks:
         cdef tuple  mask
 
         # realloc to the exact number of masks
-        self.length = self.capacity = len(state)
-        if self.capacity > 0:
-            self._allocate(self.capacity)
+        if len(state) > 0:
+            self._allocate(len(state))
         else:
+            _memory_record(_MEMORY_MASKS, self.capacity * sizeof(_mask), 0)
             PyMem_Free(self.masks)
             self.masks = NULL
+            self.capacity = 0
+        self.length = self.capacity
 
         # copy data from the state list
         for i, mask in enumerate(state):
             self.masks[i].begin, self.masks[i].end = mask
+        # restore the ordering of the masks if needed
+        with nogil:
+            self._sort()
 
     # --- C interface -------------------------------------------------------
 
@@ -363,6 +897,7 @@ cdef class Masks:
         self.masks = <_mask*> PyMem_Realloc(self.masks, self.capacity * sizeof(_mask))
         if self.masks == NULL:
             raise MemoryError("Failed to reallocate mask array")
+        _memory_record(_MEMORY_MASKS, old_capacity * sizeof(_mask), self.capacity * sizeof(_mask))
         # clean newly-allocated memory
         if self.capacity > old_capacity:
             memset(&self.masks[old_capacity], 0, (self.capacity - old_capacity) * sizeof(_mask))
@@ -396,6 +931,50 @@ cdef class Masks:
         old_length, self.length = self.length, 0
         memset(self.masks, 0, old_length * sizeof(_mask))
 
+    cdef int _sort(self) nogil:
+        """Sort the masks by coordinates, and merge the overlapping ones.
+        """
+        cdef size_t i
+        cdef size_t j = 0
+
+        # masks built from a sequence are already sorted, so only sort
+        # if at least one mask is out of order
+        for i in range(1, self.length):
+            if self.masks[i].begin < self.masks[i-1].end:
+                break
+        else:
+            return 0
+
+        qsort(self.masks, self.length, sizeof(_mask), _compare_masks)
+        for i in range(1, self.length):
+            if self.masks[i].begin < self.masks[j].end:
+                self.masks[j].end = max(self.masks[j].end, self.masks[i].end)
+            else:
+                j += 1
+                self.masks[j] = self.masks[i]
+        memset(&self.masks[j+1], 0, (self.length - j - 1) * sizeof(_mask))
+        self.length = j + 1
+        return 0
+
+    cdef size_t _search(self, int begin) nogil:
+        """Get the index of the first mask ending after ``begin``.
+        """
+        cdef size_t lo  = 0
+        cdef size_t hi  = self.length
+        cdef size_t mid
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.masks[mid].end <= begin:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    cdef bint _intersects(self, int begin, int end) nogil:
+        cdef size_t i = self._search(begin)
+        return i < self.length and Mask._intersects(&self.masks[i], begin, end)
+
     # --- Python interface ---------------------------------------------------
 
     cpdef void clear(self):
@@ -419,12 +998,106 @@ cdef class Masks:
         new.masks = <_mask*> PyMem_Malloc(new.capacity * sizeof(_mask))
         if new.masks == NULL:
             raise MemoryError("Failed to allocate masks array")
+        _memory_record(_MEMORY_MASKS, 0, new.capacity * sizeof(_mask))
         memcpy(new.masks, self.masks, new.capacity * sizeof(_mask))
         return new
 
+    cpdef bint intersects(self, int begin, int end):
+        """intersects(self, begin, end)\n--
+
+        Check whether any mask intersects a range of sequence coordinates.
+
+        Arguments:
+            begin (`int`): The leftmost coordinate of the region to
+                check for intersection (inclusive).
+            end (`int`): The rightmost coordinate of the region to check
+                for intersection (exclusive).
+
+        Example:
+            >>> seq = pyrodigal.Sequence("ATGCNNNNNNATGC", mask=True, mask_size=5)
+            >>> seq.masks.intersects(0, 5)
+            True
+            >>> seq.masks.intersects(10, 14)  # mask end is exclusive
+            False
+
+        .. versionadded:: 2.1.0
+
+        """
+        return self._intersects(begin, end)
+
+    cpdef list intersecting(self, int begin, int end):
+        """intersecting(self, begin, end)\n--
+
+        Get the masks intersecting a range of sequence coordinates.
+
+        Arguments:
+            begin (`int`): The leftmost coordinate of the region to
+                check for intersection (inclusive).
+            end (`int`): The rightmost coordinate of the region to check
+                for intersection (exclusive).
+
+        Returns:
+            `list` of `~pyrodigal.Mask`: The masks intersecting the region,
+            sorted by coordinates.
+
+        Example:
+            >>> seq = pyrodigal.Sequence("ATGCNNNNNNATGCNNNNNNATGC", mask=True, mask_size=5)
+            >>> [(m.begin, m.end) for m in seq.masks.intersecting(8, 24)]
+            [(4, 10), (14, 20)]
+            >>> seq.masks.intersecting(10, 14)
+            []
+
+        .. versionadded:: 2.1.0
+
+        """
+        cdef size_t i
+        cdef Mask   mask
+        cdef list   masks = []
+
+        for i in range(self._search(begin), self.length):
+            if self.masks[i].begin >= end:
+                break
+            mask = Mask.__new__(Mask)
+            mask.owner = self
+            mask.mask = &self.masks[i]
+            masks.append(mask)
+        return masks
+
 
 # --- Input sequence ---------------------------------------------------------
 
+# a lookup table mapping each hexamer index (as computed by `_mer_ndx`) to
+# a bitmask of the positions matching the AGGAGG Shine-Dalgarno motif
+cdef uint8_t _SHINE_DALGARNO_MASKS[4096]
+cdef int _hexamer
+cdef int _k
+for _hexamer in range(4096):
+    _SHINE_DALGARNO_MASKS[_hexamer] = 0
+    for _k in range(6):
+        if (_hexamer >> (2*_k)) & 0b11 == (nucleotide.A if _k%3 == 0 else nucleotide.G):
+            _SHINE_DALGARNO_MASKS[_hexamer] |= 1 << _k
+
+# a lookup table mapping each codon (encoded with 3 bits per nucleotide) to
+# the number of start and stop codons of each translation table on both
+# strands
+cdef uint8_t _CODON_NODES[26][0x200]
+cdef uint8_t _codon[3]
+cdef int _codon_index
+cdef int _table
+for _table in range(26):
+    for _codon_index in range(0x200):
+        _codon[0] = _codon_index >> 6
+        _codon[1] = (_codon_index >> 3) & 0b111
+        _codon[2] = _codon_index & 0b111
+        _CODON_NODES[_table][_codon_index] = (
+              _is_start(_codon, 3, 0, _table, 1) + _is_stop(_codon, 3, 0, _table, 1)
+            + _is_start(_codon, 3, 0, _table, -1) + _is_stop(_codon, 3, 0, _table, -1)
+        )
+
+# the maximum number of nodes built on the edges of an open sequence, i.e.
+# one edge start and one edge stop for each frame of each strand
+cdef size_t _EDGE_NODES = 12
+
 cdef class Sequence:
     """A digitized input sequence.
 
@@ -438,10 +1111,105 @@ cdef class Sequence:
     .. versionchanged:: 2.0.0
         Removed the ``from_string`` and ``from_bytes`` constructors.
 
+    .. versionadded:: 2.1.0
+        The ``estimated_nodes`` property.
+
     """
 
     # --- Class methods ------------------------------------------------------
 
+    @classmethod
+    def from_digits(cls, object buffer, object gc=None, Masks masks=None):
+        """from_digits(cls, buffer, gc=None, masks=None)\n--
+
+        Create a new `Sequence` from already encoded nucleotides.
+
+        The digits use the same encoding as the `Sequence` buffer
+        interface: ``0`` for A, ``1`` for G, ``2`` for C, ``3`` for T,
+        and ``6`` for unknown nucleotides. This allows passing sequences
+        between tools without parsing letters again.
+
+        Arguments:
+            buffer (buffer): A contiguous buffer of bytes storing one
+                nucleotide per byte, such as a `bytes` object or a NumPy
+                array of `~numpy.uint8`. Read-only buffers are used
+                directly without copy, and kept alive by the sequence.
+                Writable buffers are copied, since they could be modified
+                after the sequence was created.
+            gc (`float`, optional): The GC content of the sequence, if
+                already known. Otherwise it is counted from the digits.
+            masks (`~pyrodigal.Masks`, optional): The masked regions of
+                the sequence, which will be copied.
+
+        Returns:
+            `~pyrodigal.Sequence`: The sequence with the given digits.
+
+        Raises:
+            `TypeError`: When ``buffer`` does not store bytes.
+            `ValueError`: When ``buffer`` contains an invalid digit, or
+                when ``gc`` or ``masks`` are out of bounds.
+
+        Example:
+            >>> seq = pyrodigal.Sequence("ATGCNATGC")
+            >>> copy = pyrodigal.Sequence.from_digits(bytes(seq))
+            >>> str(copy)
+            'ATGCNATGC'
+
+        .. versionadded:: 2.1.0
+
+        """
+        cdef size_t                   i
+        cdef uint8_t                  digit
+        cdef const uint8_t*           digits
+        cdef const unsigned char[::1] view
+        cdef size_t                   invalid  = 0
+        cdef size_t                   gc_count = 0
+        cdef object                   mem      = memoryview(buffer)
+        cdef Sequence                 seq      = cls.__new__(cls)
+
+        # get a byte view over the buffer
+        if mem.itemsize != 1:
+            raise TypeError(f"expected a buffer of bytes, found items of size {mem.itemsize}")
+        if mem.format != "B":
+            mem = mem.cast("B")
+        view = mem
+        digits = &view[0] if view.shape[0] > 0 else NULL
+
+        # check the digits and count GC nucleotides in a single pass,
+        # using a branchless loop the compiler can vectorize
+        with nogil:
+            for i in range(<size_t> view.shape[0]):
+                digit = digits[i]
+                invalid += (digit > nucleotide.T) & (digit != nucleotide.N)
+                gc_count += (digit == nucleotide.G) | (digit == nucleotide.C)
+        if invalid > 0:
+            raise ValueError(f"buffer contains {invalid} invalid digits")
+
+        # borrow the digits of read-only buffers, copy the other ones
+        if mem.readonly and view.shape[0] > 0:
+            seq.slen = view.shape[0]
+            seq.digits = <uint8_t*> digits
+            seq.base = mem
+        else:
+            seq._allocate(view.shape[0])
+            if view.shape[0] > 0:
+                memcpy(seq.digits, digits, seq.slen * sizeof(uint8_t))
+
+        # record the sequence statistics
+        if gc is not None:
+            if not 0.0 <= gc <= 1.0:
+                raise ValueError(f"`gc` must be between 0 and 1, found {gc!r}")
+            seq.gc = gc
+        elif seq.slen > 0:
+            seq.gc = (<double> gc_count) / (<double> seq.slen)
+        if masks is not None:
+            for i in range(masks.length):
+                if masks.masks[i].begin < 0 or masks.masks[i].end > seq.slen:
+                    raise ValueError("`masks` contain a mask outside of the sequence")
+            seq.masks = masks.copy()
+
+        return seq
+
     @staticmethod
     cdef int _build(
         const int      kind,
@@ -474,6 +1242,24 @@ cdef class Sequence:
 
         return 0
 
+    @staticmethod
+    cdef size_t _estimate_nodes(
+        const uint8_t* digits,
+        const int      slen,
+              int      translation_table = 11,
+    ) nogil:
+        cdef int      i
+        cdef uint16_t codon = 0
+        cdef size_t   count = 0
+        # every node that is not on the sequence edges is built on a start
+        # or a stop codon, so the codon counts give a cheap upper bound
+        # without extracting the nodes
+        for i in range(slen):
+            codon = ((codon << 3) | digits[i]) & 0x1FF
+            if i >= 2:
+                count += _CODON_NODES[translation_table][codon]
+        return count
+
     @staticmethod
     cdef int _mask(
         const uint8_t* digits,
@@ -493,114 +1279,427 @@ cdef class Sequence:
                     mask_begin = -1
         return 0
 
-    # --- Magic methods ------------------------------------------------------
-
-    def __cinit__(self):
-        self.slen = 0
-        self.gc = 0.0
-        self.digits = NULL
-        self.masks = Masks.__new__(Masks)
-
-    def __init__(self, object sequence, bint mask = False, size_t mask_size = MASK_SIZE):
-        """__init__(self, sequence, mask=False, mask_size=50)\n--
-
-        Create a new `Sequence` object from a nucleotide sequence.
+    @staticmethod
+    cdef Sequence _from_contigs(
+        list         contigs,
+        bytes        linker,
+        bint         mask,
+        const size_t mask_size,
+    ):
+        """Build a single sequence from contigs followed by ``linker``.
 
-        Arguments:
-            sequence (`str`, `bytes` or `Sequence`): The sequence to read
-                from. `bytes` or byte-like buffers will be treated as
-                ASCII-encoded strings.
-            mask (`bool`): Enable region-masking for spans of unknown
-                characters, preventing genes from being built across them.
-            mask_size (`int`): The minimum number of contiguous unknown 
-                nucleotides required to build a mask.
+        The contigs are written directly into the digits of the new
+        sequence, without building the concatenated string first. Contigs
+        given as `Sequence` objects are copied as-is, with their masks,
+        while other contigs are masked if ``mask`` is `True`.
 
         """
-        cdef ssize_t                  i
+        cdef object                   contig
+        cdef size_t                   i
+        cdef size_t                   j
+        cdef size_t                   first
+        cdef size_t                   length
+        cdef double                   gc
         cdef int                      kind
         cdef const void*              data
         cdef const unsigned char[::1] view
-
-        if isinstance(sequence, Sequence):
-            self._allocate(sequence.slen)
-            self.gc = sequence.gc
-            memcpy(self.digits, (<Sequence> sequence).digits, self.slen * sizeof(uint8_t))
-        else:
-            if isinstance(sequence, str):
-                # make sure the unicode string is in canonical form,
-                # --> won't be needed anymore in Python 3.12
-                IF SYS_VERSION_INFO_MAJOR <= 3 and SYS_VERSION_INFO_MINOR < 12:
-                    PyUnicode_READY(sequence)
-                kind = PyUnicode_KIND(sequence)
-                data = PyUnicode_DATA(sequence)
-                self._allocate(PyUnicode_GET_LENGTH(sequence))
+        cdef Sequence                 seq
+        cdef size_t                   offset        = 0
+        cdef size_t                   total         = 0
+        cdef size_t                   gc_count      = 0
+        cdef const char*              linker_data   = linker
+        cdef size_t                   linker_length = len(linker)
+        cdef Sequence                 result        = Sequence.__new__(Sequence)
+
+        # compute the total length to allocate the digits only once
+        for contig in contigs:
+            if isinstance(contig, Sequence):
+                total += (<Sequence> contig).slen
+            elif isinstance(contig, str):
+                total += PyUnicode_GET_LENGTH(contig)
             else:
-                view = sequence
-                kind = PyUnicode_1BYTE_KIND
-                data = &view[0]
-                self._allocate(view.shape[0])
+                view = contig
+                total += view.shape[0]
+            total += linker_length
+        result._allocate(total)
+
+        # write the digits of each contig followed by a linker, counting
+        # the GC nucleotides of each contig
+        for contig in contigs:
+            first = result.masks.length
+            if isinstance(contig, Sequence):
+                seq = contig
+                length = seq.slen
+                memcpy(&result.digits[offset], seq.digits, length * sizeof(uint8_t))
+                for j in range(seq.masks.length):
+                    result.masks._add_mask(
+                        seq.masks.masks[j].begin + offset,
+                        seq.masks.masks[j].end + offset,
+                    )
+                gc = seq.gc
+            else:
+                if isinstance(contig, str):
+                    # make sure the unicode string is in canonical form,
+                    # --> won't be needed anymore in Python 3.12
+                    IF SYS_VERSION_INFO_MAJOR <= 3 and SYS_VERSION_INFO_MINOR < 12:
+                        PyUnicode_READY(contig)
+                    kind = PyUnicode_KIND(contig)
+                    data = PyUnicode_DATA(contig)
+                    length = PyUnicode_GET_LENGTH(contig)
+                else:
+                    view = contig
+                    kind = PyUnicode_1BYTE_KIND
+                    data = &view[0] if view.shape[0] > 0 else NULL
+                    length = view.shape[0]
+                gc = 0.0
+                with nogil:
+                    Sequence._build(kind, data, length, &gc, &result.digits[offset])
+                if mask:
+                    Sequence._mask(&result.digits[offset], length, result.masks, mask_size)
+                    for j in range(first, result.masks.length):
+                        result.masks.masks[j].begin += offset
+                        result.masks.masks[j].end += offset
+            gc_count += <size_t> (gc * length + 0.5)
+            offset += length
+            # write the linker, assuming it has no GC nucleotides
             with nogil:
-                Sequence._build(
-                    kind,
-                    data,
-                    self.slen,
-                    &self.gc,
-                    self.digits,
-                )
-
-        if mask:
-            Sequence._mask(
-                self.digits,
-                self.slen,
-                self.masks,
-                mask_size,
-            )
-
-    def __dealloc__(self):
-        PyMem_Free(self.digits)
-
-    def __len__(self):
-        """__len__(self)\n--
-
-        Return the number of nucleotides in the sequence.
+                Sequence._build(PyUnicode_1BYTE_KIND, linker_data, linker_length, &gc, &result.digits[offset])
+            offset += linker_length
 
-        """
-        return self.slen
+        # compute the statistics over the whole sequence
+        if total > 0:
+            result.gc = (<double> gc_count) / (<double> total)
+        return result
 
-    cpdef size_t __sizeof__(self):
-        return self.slen * sizeof(uint8_t) + sizeof(self)
+    @staticmethod
+    cdef int _score_shine_dalgarno_exact(
+        const uint8_t mask,
+        const int dist,
+        const _training* tinf,
+    ) nogil:
+        cdef int i
+        cdef int j
+        cdef int k
+        cdef int mism
+        cdef int rdis
+        cdef int limit
+        cdef int max_val
+        cdef int cmp_val
+        cdef int cur_val = 0
+        cdef int match[6]
+        cdef int cur_ctr
+        cdef int dis_flag
 
-    def __str__(self):
-        cdef int     i
-        cdef Py_UCS4 nuc
+        # reset the match array
+        match[0] = match[1] = match[2] = match[3] = match[4] = match[5] = -10
 
-        IF SYS_VERSION_INFO_MAJOR <= 3 and SYS_VERSION_INFO_MINOR < 7 and SYS_IMPLEMENTATION_NAME == "pypy":
-            cdef bytes dna
-            cdef void* data
-            # create an empty byte buffer that we can write to
-            dna = PyBytes_FromStringAndSize(NULL, self.slen)
-            data = <void*> PyBytes_AsString(dna)
-        ELSE:
-            cdef unicode dna
-            cdef int     kind
-            cdef void*   data
-            # create an empty string that we can write to
-            dna  = PyUnicode_New(self.slen, 0x7F)
-            kind = PyUnicode_KIND(dna)
-            data = PyUnicode_DATA(dna)
+        # compute distance to SD site
+        limit = min(6, dist - 4)
 
-        with nogil:
-            for i in range(self.slen):
-                nuc = _letters[self.digits[i]]
-                IF SYS_VERSION_INFO_MAJOR <= 3 and SYS_VERSION_INFO_MINOR < 7 and SYS_IMPLEMENTATION_NAME == "pypy":
-                    (<char*> data)[i] = nuc
-                ELSE:
-                    PyUnicode_WRITE(kind, data, i, nuc)
+        # Compare the 6-base region to AGGAGG
+        for i in range(limit):
+            if i%3 == 0:
+                if mask & (1 << i):
+                    match[i] = 2
+            else:
+                if mask & (1 << i):
+                    match[i] = 3
 
-        IF SYS_VERSION_INFO_MAJOR <= 3 and SYS_VERSION_INFO_MINOR < 7 and SYS_IMPLEMENTATION_NAME == "pypy":
-            return dna.decode("ascii")
-        ELSE:
-            return dna
+        # Find the maximally scoring motif
+        max_val = 0
+        for i in range(limit, 2, -1):
+            for j in range(limit+1-i):
+                # count number of matching positions, skip if less than
+                # GAG matching (or if a mismatch occurs)
+                cur_ctr = -2
+                for k in range(j, j+i):
+                    cur_ctr += match[k]
+                if cur_ctr < 6:
+                    continue
+                # compute distance to the start codon
+                rdis = dist - (j + i)
+                if rdis < 5: # 3-4bp
+                    dis_flag = 2 if i < 5 else 1
+                elif rdis < 11: # 5-10bp
+                    dis_flag = 0
+                elif rdis < 13: # 11-12bp
+                    dis_flag = 1 if i < 5 else 2
+                elif rdis < 16: # 13-15bp
+                    dis_flag = 3
+                else:
+                    continue
+                # match exact RBS Motifs
+                if cur_ctr == 6:  # GGA
+                    if dis_flag == 0:   cur_val = 13
+                    elif dis_flag == 1: cur_val = 6
+                    elif dis_flag == 2: cur_val = 1
+                    elif dis_flag == 3: cur_val = 2
+                elif cur_ctr == 8: # AGGA
+                    if dis_flag == 0:   cur_val = 15
+                    elif dis_flag == 1: cur_val = 12
+                    elif dis_flag == 2: cur_val = 11
+                    elif dis_flag == 3: cur_val = 3
+                elif cur_ctr == 9: # GGAG
+                    if dis_flag == 0:   cur_val = 16
+                    elif dis_flag == 1: cur_val = 12
+                    elif dis_flag == 2: cur_val = 11
+                    elif dis_flag == 3: cur_val = 3
+                elif cur_ctr == 11: # AGGAG
+                    if dis_flag == 0:   cur_val = 22
+                    elif dis_flag == 1: cur_val = 21
+                    elif dis_flag == 2: cur_val = 20
+                    elif dis_flag == 3: cur_val = 10
+                elif cur_ctr == 12: # GGAGG
+                    if dis_flag == 0:   cur_val = 24
+                    elif dis_flag == 1: cur_val = 23
+                    elif dis_flag == 2: cur_val = 20
+                    elif dis_flag == 3: cur_val = 10
+                elif cur_ctr == 14: # AGGAGG
+                    if dis_flag == 0:   cur_val = 27
+                    elif dis_flag == 1: cur_val = 26
+                    elif dis_flag == 2: cur_val = 25
+                    elif dis_flag == 3: cur_val = 10
+                else:
+                    cur_val = 0
+                # record the motif only if this is the maximal scoring motif so far
+                if tinf.rbs_wt[cur_val] < tinf.rbs_wt[max_val]:
+                    continue
+                if tinf.rbs_wt[cur_val] == tinf.rbs_wt[max_val] and cur_val < max_val:
+                    continue
+                max_val = cur_val
+
+        return max_val
+
+
+    @staticmethod
+    cdef int _score_shine_dalgarno_mm(
+        const uint8_t mask,
+        const int dist,
+        const _training* tinf,
+    ) nogil:
+        cdef int i
+        cdef int j
+        cdef int k
+        cdef int mism
+        cdef int rdis
+        cdef int limit
+        cdef int max_val
+        cdef int cmp_val
+        cdef int cur_val = 0
+        cdef int match[6]
+        cdef int cur_ctr
+        cdef int dis_flag
+
+        # reset the match array
+        match[0] = match[1] = match[2] = match[3] = match[4] = match[5] = -10
+
+        # compute distance to SD site
+        limit = min(6, dist - 4)
+
+        # Compare the 6-base region to AGGAGG
+        for i in range(limit):
+            if i%3 == 0:
+                match[i] = 2 if mask & (1 << i) else -3
+            else:
+                match[i] = 3 if mask & (1 << i) else -2
+
+        # Find the maximally scoring motif
+        max_val = 0
+        for i in range(limit, 4, -1):
+            for j in range(limit+1-i):
+                # count number of matching positions, skip if less than
+                # GAG matching (or if not exactly one mismatch occurs)
+                cur_ctr = -2
+                mism = 0;
+                for k in range(j, j+i):
+                    cur_ctr += match[k]
+                    if match[k] < 0.0:
+                        mism += 1
+                        if k <= j+1 or k >= j+i-2:
+                            cur_ctr -= 10
+                if mism != 1 or cur_ctr < 6:
+                    continue
+                # compute distance to the start codon
+                rdis = dist - (j + i)
+                if rdis < 5:
+                    dis_flag = 1
+                elif rdis < 11:
+                    dis_flag = 0
+                elif rdis < 13:
+                    dis_flag = 2
+                elif rdis < 16:
+                    dis_flag = 3
+                else:
+                    continue
+                # match single-mismatch RBS Motifs
+                if cur_ctr == 6:  # AGxAG
+                    if dis_flag == 0:   cur_val = 9
+                    elif dis_flag == 1: cur_val = 5
+                    elif dis_flag == 2: cur_val = 4
+                    elif dis_flag == 3: cur_val = 2
+                elif cur_ctr == 7: # GGxGG
+                    if dis_flag == 0:   cur_val = 14
+                    elif dis_flag == 1: cur_val = 8
+                    elif dis_flag == 2: cur_val = 7
+                    elif dis_flag == 3: cur_val = 2
+                elif cur_ctr == 9: # AGGxGG
+                    if dis_flag == 0:   cur_val = 19
+                    elif dis_flag == 1: cur_val = 18
+                    elif dis_flag == 2: cur_val = 17
+                    elif dis_flag == 3: cur_val = 3
+                # record the motif only if this is the maximal scoring motif so far
+                if tinf.rbs_wt[cur_val] < tinf.rbs_wt[max_val]:
+                    continue
+                if tinf.rbs_wt[cur_val] == tinf.rbs_wt[max_val] and cur_val < max_val:
+                    continue
+                max_val = cur_val
+
+        return max_val
+
+    # --- Magic methods ------------------------------------------------------
+
+    def __cinit__(self):
+        self.slen = 0
+        self.gc = 0.0
+        self._estimated_nodes = -1
+        self.digits = NULL
+        self.hexamers = NULL
+        self.gc_frames = NULL
+        self.hexamers_size = 0
+        self.gc_frames_size = 0
+        self.masks = Masks.__new__(Masks)
+        self.base = None
+
+    def __init__(self, object sequence, bint mask = False, size_t mask_size = MASK_SIZE):
+        """__init__(self, sequence, mask=False, mask_size=50)\n--
+
+        Create a new `Sequence` object from a nucleotide sequence.
+
+        Arguments:
+            sequence (`str`, `bytes` or `Sequence`): The sequence to read
+                from. `bytes` or byte-like buffers will be treated as
+                ASCII-encoded strings.
+            mask (`bool`): Enable region-masking for spans of unknown
+                characters, preventing genes from being built across them.
+            mask_size (`int`): The minimum number of contiguous unknown 
+                nucleotides required to build a mask.
+
+        """
+        cdef ssize_t                  i
+        cdef int                      kind
+        cdef const void*              data
+        cdef const unsigned char[::1] view
+
+        if isinstance(sequence, Sequence):
+            self._allocate((<Sequence> sequence).slen)
+            self.gc = sequence.gc
+            self._estimated_nodes = (<Sequence> sequence)._estimated_nodes
+            memcpy(self.digits, (<Sequence> sequence).digits, self.slen * sizeof(uint8_t))
+        else:
+            if isinstance(sequence, str):
+                # make sure the unicode string is in canonical form,
+                # --> won't be needed anymore in Python 3.12
+                IF SYS_VERSION_INFO_MAJOR <= 3 and SYS_VERSION_INFO_MINOR < 12:
+                    PyUnicode_READY(sequence)
+                kind = PyUnicode_KIND(sequence)
+                data = PyUnicode_DATA(sequence)
+                self._allocate(PyUnicode_GET_LENGTH(sequence))
+            else:
+                view = sequence
+                kind = PyUnicode_1BYTE_KIND
+                data = &view[0]
+                self._allocate(view.shape[0])
+            with nogil:
+                Sequence._build(
+                    kind,
+                    data,
+                    self.slen,
+                    &self.gc,
+                    self.digits,
+                )
+
+        if mask:
+            Sequence._mask(
+                self.digits,
+                self.slen,
+                self.masks,
+                mask_size,
+            )
+
+    def __dealloc__(self):
+        # digits borrowed from another object are not owned by the sequence
+        if self.base is None:
+            if self.digits != NULL:
+                _memory_record(_MEMORY_SEQUENCE, self.slen * sizeof(uint8_t), 0)
+            PyMem_Free(self.digits)
+        self._release_indices()
+
+    def __len__(self):
+        """__len__(self)\n--
+
+        Return the number of nucleotides in the sequence.
+
+        """
+        return self.slen
+
+    def __getitem__(self, object index):
+        """__getitem__(self, index)\n--
+
+        Get a nucleotide, or a view of a region of the sequence.
+
+        Slicing a sequence does not copy its digits, see `Sequence.view`.
+
+        """
+        cdef ssize_t i
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.slen)
+            if step != 1:
+                raise ValueError("cannot take a view of a sequence with a step")
+            return self._subsequence(start, max(start, stop))
+        i = index
+        if i < 0:
+            i += self.slen
+        if i < 0 or i >= self.slen:
+            raise IndexError("sequence index out of range")
+        return chr(_letters[self.digits[i]])
+
+    cpdef size_t __sizeof__(self):
+        cdef size_t size = sizeof(self)
+        if self.base is None:
+            size += self.slen * sizeof(uint8_t)
+        return size + self.hexamers_size + self.gc_frames_size
+
+    def __str__(self):
+        cdef int     i
+        cdef Py_UCS4 nuc
+
+        IF SYS_VERSION_INFO_MAJOR <= 3 and SYS_VERSION_INFO_MINOR < 7 and SYS_IMPLEMENTATION_NAME == "pypy":
+            cdef bytes dna
+            cdef void* data
+            # create an empty byte buffer that we can write to
+            dna = PyBytes_FromStringAndSize(NULL, self.slen)
+            data = <void*> PyBytes_AsString(dna)
+        ELSE:
+            cdef unicode dna
+            cdef int     kind
+            cdef void*   data
+            # create an empty string that we can write to
+            dna  = PyUnicode_New(self.slen, 0x7F)
+            kind = PyUnicode_KIND(dna)
+            data = PyUnicode_DATA(dna)
+
+        with nogil:
+            for i in range(self.slen):
+                nuc = _letters[self.digits[i]]
+                IF SYS_VERSION_INFO_MAJOR <= 3 and SYS_VERSION_INFO_MINOR < 7 and SYS_IMPLEMENTATION_NAME == "pypy":
+                    (<char*> data)[i] = nuc
+                ELSE:
+                    PyUnicode_WRITE(kind, data, i, nuc)
+
+        IF SYS_VERSION_INFO_MAJOR <= 3 and SYS_VERSION_INFO_MINOR < 7 and SYS_IMPLEMENTATION_NAME == "pypy":
+            return dna.decode("ascii")
+        ELSE:
+            return dna
 
     cpdef dict __getstate__(self):
         """__getstate__(self)\n--
@@ -626,13 +1725,27 @@ cdef class Sequence:
         # copy attributes
         self.masks = state["masks"]
         self.gc = state["gc"]
+        # clear indices built for the previous digits
+        self._release_indices()
+        # release the previous digits, unless they were borrowed
+        if self.base is None and self.digits != NULL:
+            _memory_record(_MEMORY_SEQUENCE, self.slen * sizeof(uint8_t), 0)
+            PyMem_Free(self.digits)
+        self.digits = NULL
+        self.base = None
         # allocate sequence storage and copy bytes
         self._allocate(state["slen"])
         memcpy(self.digits, &view[0], self.slen * sizeof(uint8_t))
+        self._estimated_nodes = -1
 
     def __getbuffer__(self, Py_buffer* buffer, int flags):
         assert self.digits != NULL
 
+        # never export the digits as writable, since the indices, the
+        # statistics and the views of the sequence would not be updated
+        if flags & PyBUF_WRITABLE:
+            raise BufferError("sequence digits are read-only")
+
         if flags & PyBUF_FORMAT:
             buffer.format = b"B"
         else:
@@ -643,65 +1756,177 @@ cdef class Sequence:
         buffer.len = self.slen * sizeof(uint8_t)
         buffer.ndim = 1
         buffer.obj = self
-        buffer.readonly = 0
+        buffer.readonly = True
         buffer.shape = &self.slen
         buffer.suboffsets = NULL
         buffer.strides = NULL
 
+    # --- Properties ---------------------------------------------------------
+
+    @property
+    def estimated_nodes(self):
+        """`int`: An estimate of the number of nodes in the sequence.
+
+        The estimate is counted from the start and stop codons of the
+        standard genetic code on both strands when first accessed. It
+        does not include the nodes built on the sequence edges.
+
+        .. versionadded:: 2.1.0
+
+        """
+        return self._get_estimated_nodes()
+
     # --- C interface -------------------------------------------------------
 
+    cdef size_t _get_estimated_nodes(self) nogil:
+        # count the nodes on first use only, since most sequences are never
+        # checked against a node limit
+        if self._estimated_nodes < 0:
+            self._estimated_nodes = Sequence._estimate_nodes(self.digits, self.slen)
+        return self._estimated_nodes
+
     cdef int _allocate(self, int slen) except 1:
         self.slen = slen
         self.digits = <uint8_t*> PyMem_Malloc(slen * sizeof(uint8_t))
         if self.digits == NULL:
             raise MemoryError()
+        _memory_record(_MEMORY_SEQUENCE, 0, slen * sizeof(uint8_t))
         with nogil:
             memset(self.digits, 0, slen * sizeof(uint8_t))
         return 0
 
+    cdef const uint16_t* _hexamer_index(self) nogil except NULL:
+        cdef ssize_t   i
+        cdef uint16_t  fwd   = 0
+        cdef uint16_t  bwd   = 0
+        cdef ssize_t   slen  = self.slen
+        cdef uint16_t* index = self.hexamers
+        cdef size_t    size  = 2 * slen * sizeof(uint16_t) + 1
+
+        # reuse the index if it was already built for this sequence
+        if index != NULL:
+            return index
+
+        index = <uint16_t*> malloc(size)
+        if index == NULL:
+            with gil:
+                raise MemoryError("Could not allocate hexamer index")
+        _memory_record(_MEMORY_SEQUENCE_INDEX, 0, size)
+
+        # compute the hexamer index at every position with a rolling 2-bit
+        # index, using the same encoding as `_mer_ndx`; nucleotides past
+        # the sequence end are counted as `A` (only needed for positions
+        # `_mer_ndx` would not be called on anyway)
+        for i in range(1, 6):
+            if i - 1 < slen:
+                fwd |= (self.digits[i - 1] & 0b11) << (2*i)
+                bwd |= (_complement[self.digits[slen - i]] & 0b11) << (2*i)
+        for i in range(slen):
+            fwd >>= 2
+            bwd >>= 2
+            if i + 5 < slen:
+                fwd |= (self.digits[i + 5] & 0b11) << 10
+                bwd |= (_complement[self.digits[slen - 6 - i]] & 0b11) << 10
+            index[i]        = fwd
+            index[slen + i] = bwd
+
+        # store the index, unless another thread was faster to build it
+        with gil:
+            if self.hexamers == NULL:
+                self.hexamers = index
+                self.hexamers_size = size
+            else:
+                _memory_record(_MEMORY_SEQUENCE_INDEX, size, 0)
+                free(index)
+
+        return self.hexamers
+
+    cdef const int* _gc_frame_index(self) nogil except NULL:
+        cdef ssize_t i
+        cdef ssize_t slen  = self.slen
+        cdef int*    index = self.gc_frames
+        cdef size_t  size  = slen * sizeof(int) + 1
+
+        # reuse the index if it was already built for this sequence
+        if index != NULL:
+            return index
+
+        index = <int*> malloc(size)
+        if index == NULL:
+            with gil:
+                raise MemoryError("Could not allocate GC frame index")
+        _memory_record(_MEMORY_SEQUENCE_INDEX, 0, size)
+
+        # compute the number of GC nucleotides in each frame, cumulated
+        # up to every position (so that `index[i] - index[i-3k]` is the
+        # GC count of the in-frame span `(i-3k, i]`)
+        for i in range(min(3, slen)):
+            index[i] = _is_gc(self.digits, slen, i, 1)
+        for i in range(3, slen):
+            index[i] = index[i-3] + _is_gc(self.digits, slen, i, 1)
+
+        # store the index, unless another thread was faster to build it
+        with gil:
+            if self.gc_frames == NULL:
+                self.gc_frames = index
+                self.gc_frames_size = size
+            else:
+                _memory_record(_MEMORY_SEQUENCE_INDEX, size, 0)
+                free(index)
+
+        return self.gc_frames
+
+    cdef int _gc_count(self, int begin, int end) nogil:
+        # NOTE: `Sequence._gc_frame_index` must have been called before
+        #       this method can be used.
+        cdef int i
+        cdef int count = 0
+
+        # clamp the range to the sequence, positions outside of the
+        # sequence are not counted (like in `_is_gc`)
+        begin = max(begin, 0)
+        end = min(end, self.slen)
+        if end <= begin:
+            return 0
+
+        # the total GC count of a prefix is the sum of its last position
+        # in each of the three frames
+        for i in range(end - 3, end):
+            if i >= 0:
+                count += self.gc_frames[i]
+        for i in range(begin - 3, begin):
+            if i >= 0:
+                count -= self.gc_frames[i]
+        return count
+
     cdef int* _max_gc_frame_plot(self, int window_size) nogil except NULL:
-        cdef int  i
-        cdef int  j
-        cdef int  win
-        cdef int* fwd  = <int*> malloc(self.slen*sizeof(int))
-        cdef int* bwd  = <int*> malloc(self.slen*sizeof(int))
-        cdef int* tot  = <int*> malloc(self.slen*sizeof(int))
-        cdef int* gp   = <int*> malloc(self.slen*sizeof(int))
-
-        if fwd == NULL or bwd == NULL or gp == NULL or tot == NULL:
-            free(gp)
-            free(fwd)
-            free(bwd)
-            free(tot)
+        cdef int        i
+        cdef int        j
+        cdef int        k
+        cdef int        win
+        cdef int        tot[3]
+        cdef int        half  = _WINDOW // 2
+        cdef const int* index = self._gc_frame_index()
+        cdef int*       gp    = <int*> malloc(self.slen*sizeof(int))
+
+        if gp == NULL:
             with gil:
                 raise MemoryError("Could not allocate GC frame buffers")
+        _memory_record(_MEMORY_GC_FRAME_PLOT, 0, self.slen*sizeof(int))
 
-        memset(fwd, 0, self.slen*sizeof(int))
-        memset(bwd, 0, self.slen*sizeof(int))
-        memset(tot, 0, self.slen*sizeof(int))
         memset(gp, -1, self.slen*sizeof(int))
 
-        for i in range(min(3, self.slen)):
-            fwd[i] = _is_gc(self.digits, self.slen, i, 1)
-            bwd[self.slen-i-1] = _is_gc(self.digits, self.slen, i, -1)
-        for i in range(3, self.slen):
-            fwd[i] = fwd[i-3] + _is_gc(self.digits, self.slen, i, 1)
-            bwd[self.slen-i-1] = bwd[self.slen-i+2] + _is_gc(self.digits, self.slen, i, -1)
-
-        for i in range(self.slen):
-            tot[i] = fwd[i] + bwd[i] - _is_gc(self.digits, self.slen, i, 1)
-            if i >= _WINDOW/2:
-                tot[i] -= fwd[i-_WINDOW/2]
-            if i + _WINDOW/2 < self.slen:
-                tot[i] -= bwd[i+_WINDOW/2]
-        free(fwd)
-        free(bwd)
-
         for i in range(0, self.slen-2, 3):
-            win = sequence.max_fr(tot[i], tot[i+1], tot[i+2])
+            # count the GC of each frame within the window centered on
+            # position `i + j`, i.e. the in-frame span `(i+j-half, i+j+half)`
+            for j in range(3):
+                k = i + j + 3*min(half//3 - 1, (self.slen - 1 - i - j) // 3)
+                tot[j] = index[k]
+                if i + j >= half:
+                    tot[j] -= index[i+j-half]
+            win = sequence.max_fr(tot[0], tot[1], tot[2])
             for j in range(i, i+3):
                 gp[j] = win
-        free(tot)
 
         return gp
 
@@ -800,105 +2025,35 @@ cdef class Sequence:
 
         return unknown_residue
 
-    cdef int _shine_dalgarno_exact(
+    cdef uint8_t _shine_dalgarno_mask(
         self,
         const int pos,
-        const int start,
-        const _training* tinf,
         const int strand
-    ) nogil except -1:
-        cdef int i
-        cdef int j
-        cdef int k
-        cdef int mism
-        cdef int rdis
-        cdef int limit
-        cdef int max_val
-        cdef int cmp_val
-        cdef int cur_val = 0
-        cdef int match[6]
-        cdef int cur_ctr
-        cdef int dis_flag
-
-        # reset the match array
-        match[0] = match[1] = match[2] = match[3] = match[4] = match[5] = -10
-
-        # compute distance to SD site
-        limit = min(6, start - 4 - pos)
-
-        # Compare the 6-base region to AGGAGG
-        for i in range(limit):
+    ) nogil:
+        cdef int     i
+        cdef uint8_t mask = 0
+        # compare the 6-base region to AGGAGG, with positions outside
+        # of the sequence never matching
+        for i in range(6):
+            if pos + i < 0:
+                continue
             if i%3 == 0:
                 if _is_a(self.digits, self.slen, pos+i, strand):
-                    match[i] = 2
+                    mask |= 1 << i
             else:
                 if _is_g(self.digits, self.slen, pos+i, strand):
-                    match[i] = 3
-
-        # Find the maximally scoring motif
-        max_val = 0
-        for i in range(limit, 2, -1):
-            for j in range(limit+1-i):
-                # count number of matching positions, skip if less than
-                # GAG matching (or if a mismatch occurs)
-                cur_ctr = -2
-                for k in range(j, j+i):
-                    cur_ctr += match[k]
-                if cur_ctr < 6:
-                    continue
-                # compute distance to the start codon
-                rdis = start - (pos + j + i)
-                if rdis < 5: # 3-4bp
-                    dis_flag = 2 if i < 5 else 1
-                elif rdis < 11: # 5-10bp
-                    dis_flag = 0
-                elif rdis < 13: # 11-12bp
-                    dis_flag = 1 if i < 5 else 2
-                elif rdis < 16: # 13-15bp
-                    dis_flag = 3
-                else:
-                    continue
-                # match exact RBS Motifs
-                if cur_ctr == 6:  # GGA
-                    if dis_flag == 0:   cur_val = 13
-                    elif dis_flag == 1: cur_val = 6
-                    elif dis_flag == 2: cur_val = 1
-                    elif dis_flag == 3: cur_val = 2
-                elif cur_ctr == 8: # AGGA
-                    if dis_flag == 0:   cur_val = 15
-                    elif dis_flag == 1: cur_val = 12
-                    elif dis_flag == 2: cur_val = 11
-                    elif dis_flag == 3: cur_val = 3
-                elif cur_ctr == 9: # GGAG
-                    if dis_flag == 0:   cur_val = 16
-                    elif dis_flag == 1: cur_val = 12
-                    elif dis_flag == 2: cur_val = 11
-                    elif dis_flag == 3: cur_val = 3
-                elif cur_ctr == 11: # AGGAG
-                    if dis_flag == 0:   cur_val = 22
-                    elif dis_flag == 1: cur_val = 21
-                    elif dis_flag == 2: cur_val = 20
-                    elif dis_flag == 3: cur_val = 10
-                elif cur_ctr == 12: # GGAGG
-                    if dis_flag == 0:   cur_val = 24
-                    elif dis_flag == 1: cur_val = 23
-                    elif dis_flag == 2: cur_val = 20
-                    elif dis_flag == 3: cur_val = 10
-                elif cur_ctr == 14: # AGGAGG
-                    if dis_flag == 0:   cur_val = 27
-                    elif dis_flag == 1: cur_val = 26
-                    elif dis_flag == 2: cur_val = 25
-                    elif dis_flag == 3: cur_val = 10
-                else:
-                    cur_val = 0
-                # record the motif only if this is the maximal scoring motif so far
-                if tinf.rbs_wt[cur_val] < tinf.rbs_wt[max_val]:
-                    continue
-                if tinf.rbs_wt[cur_val] == tinf.rbs_wt[max_val] and cur_val < max_val:
-                    continue
-                max_val = cur_val
+                    mask |= 1 << i
+        return mask
 
-        return max_val
+    cdef int _shine_dalgarno_exact(
+        self,
+        const int pos,
+        const int start,
+        const _training* tinf,
+        const int strand
+    ) nogil except -1:
+        cdef uint8_t mask = self._shine_dalgarno_mask(pos, strand)
+        return Sequence._score_shine_dalgarno_exact(mask, start - pos, tinf)
 
     cdef int _shine_dalgarno_mm(
         self,
@@ -907,87 +2062,116 @@ cdef class Sequence:
         const _training* tinf,
         const int strand
     ) nogil except -1:
+        cdef uint8_t mask = self._shine_dalgarno_mask(pos, strand)
+        return Sequence._score_shine_dalgarno_mm(mask, start - pos, tinf)
+
+    cdef bint _has_stops(self, int begin, int end, int tt) nogil:
+        """Check whether ``[begin, end)`` has a stop codon in all 6 frames.
+
+        Any ORF overlapping this region must end inside of it, which
+        means that the nodes on either side of the region do not depend
+        on the nucleotides on the other side.
+
+        """
         cdef int i
-        cdef int j
-        cdef int k
-        cdef int mism
-        cdef int rdis
-        cdef int limit
-        cdef int max_val
-        cdef int cmp_val
-        cdef int cur_val = 0
-        cdef int match[6]
-        cdef int cur_ctr
-        cdef int dis_flag
+        cdef int found = 0
+
+        for i in range(max(begin, 0), min(end, <int> self.slen) - 2):
+            if _is_stop(self.digits, self.slen, i, tt, 1):
+                found |= 1 << (i%3)
+            if _is_stop(self.digits, self.slen, self.slen - 3 - i, tt, -1):
+                found |= 8 << (i%3)
+            if found == 0x3F:
+                return True
+        return False
 
-        # reset the match array
-        match[0] = match[1] = match[2] = match[3] = match[4] = match[5] = -10
+    cdef Sequence _subsequence(self, int begin, int end):
+        """Get a view of the ``[begin, end)`` region, sharing the digits.
 
-        # compute distance to SD site
-        limit = min(6, start - 4 - pos)
+        Masked regions are copied as well, clipped to the region bounds.
 
-        # Compare the 6-base region to AGGAGG
-        for i in range(limit):
-            if i%3 == 0:
-                match[i] = 2 if _is_a(self.digits, self.slen, pos+i, strand) else -3
-            else:
-                match[i] = 3 if _is_g(self.digits, self.slen, pos+i, strand) else -2
+        """
+        cdef size_t   i
+        cdef int      gc_count = 0
+        cdef Sequence seq      = Sequence.__new__(Sequence)
 
-        # Find the maximally scoring motif
-        max_val = 0
-        for i in range(limit, 4, -1):
-            for j in range(limit+1-i):
-                # count number of matching positions, skip if less than
-                # GAG matching (or if not exactly one mismatch occurs)
-                cur_ctr = -2
-                mism = 0;
-                for k in range(j, j+i):
-                    cur_ctr += match[k]
-                    if match[k] < 0.0:
-                        mism += 1
-                        if k <= j+1 or k >= j+i-2:
-                            cur_ctr -= 10
-                if mism != 1 or cur_ctr < 6:
-                    continue
-                # compute distance to the start codon
-                rdis = start - (pos + j + i)
-                if rdis < 5:
-                    dis_flag = 1
-                elif rdis < 11:
-                    dis_flag = 0
-                elif rdis < 13:
-                    dis_flag = 2
-                elif rdis < 16:
-                    dis_flag = 3
-                else:
-                    continue
-                # match single-mismatch RBS Motifs
-                if cur_ctr == 6:  # AGxAG
-                    if dis_flag == 0:   cur_val = 9
-                    elif dis_flag == 1: cur_val = 5
-                    elif dis_flag == 2: cur_val = 4
-                    elif dis_flag == 3: cur_val = 2
-                elif cur_ctr == 7: # GGxGG
-                    if dis_flag == 0:   cur_val = 14
-                    elif dis_flag == 1: cur_val = 8
-                    elif dis_flag == 2: cur_val = 7
-                    elif dis_flag == 3: cur_val = 2
-                elif cur_ctr == 9: # AGGxGG
-                    if dis_flag == 0:   cur_val = 19
-                    elif dis_flag == 1: cur_val = 18
-                    elif dis_flag == 2: cur_val = 17
-                    elif dis_flag == 3: cur_val = 3
-                # record the motif only if this is the maximal scoring motif so far
-                if tinf.rbs_wt[cur_val] < tinf.rbs_wt[max_val]:
-                    continue
-                if tinf.rbs_wt[cur_val] == tinf.rbs_wt[max_val] and cur_val < max_val:
-                    continue
-                max_val = cur_val
+        # keep a reference to the sequence owning the digits
+        seq.base = self
+        seq.slen = end - begin
+        seq.digits = &self.digits[begin]
+        with nogil:
+            # count GC directly in the region: the GC frame index cannot be
+            # used here, since it also counts unknown nucleotides like
+            # Prodigal does when computing the GC content of ORFs
+            if begin == 0 and end == self.slen:
+                seq.gc = self.gc
+                seq._estimated_nodes = self._estimated_nodes
+            else:
+                for i in range(<size_t> seq.slen):
+                    if seq.digits[i] == nucleotide.G or seq.digits[i] == nucleotide.C:
+                        gc_count += 1
+                if seq.slen > 0:
+                    seq.gc = (<double> gc_count) / (<double> seq.slen)
+            for i in range(self.masks._search(begin), self.masks.length):
+                if self.masks.masks[i].begin >= end:
+                    break
+                seq.masks._add_mask(
+                    max(self.masks.masks[i].begin, begin) - begin,
+                    min(self.masks.masks[i].end, end) - begin,
+                )
+        return seq
 
-        return max_val
+    cdef void _release_indices(self) nogil:
+        """Free the hexamer and GC indices, which are rebuilt on demand.
+        """
+        _memory_record(_MEMORY_SEQUENCE_INDEX, self.hexamers_size, 0)
+        _memory_record(_MEMORY_SEQUENCE_INDEX, self.gc_frames_size, 0)
+        free(self.hexamers)
+        free(self.gc_frames)
+        self.hexamers = NULL
+        self.gc_frames = NULL
+        self.hexamers_size = 0
+        self.gc_frames_size = 0
 
     # --- Python interface ---------------------------------------------------
 
+    cpdef Sequence view(self, int begin, int end):
+        """view(self, begin, end)\n--
+
+        Get a view of a region of the sequence, without copying it.
+
+        The returned `Sequence` shares the digits of this sequence, and
+        keeps it alive. Masked regions are clipped to the region bounds,
+        and the GC content is computed only for the region.
+
+        Arguments:
+            begin (`int`): The leftmost coordinate of the region
+                (inclusive, 0-based).
+            end (`int`): The rightmost coordinate of the region
+                (exclusive).
+
+        Returns:
+            `~pyrodigal.Sequence`: A read-only view of the region, which
+            can be passed to `OrfFinder.find_genes` like any sequence.
+
+        Raises:
+            `IndexError`: When the region is not within the sequence.
+
+        Example:
+            >>> seq = pyrodigal.Sequence("ATGCNNNNNNATGC", mask=True, mask_size=5)
+            >>> view = seq.view(2, 12)
+            >>> str(view)
+            'GCNNNNNNAT'
+            >>> view.masks[0].begin, view.masks[0].end
+            (2, 8)
+
+        .. versionadded:: 2.1.0
+
+        """
+        if begin < 0 or end > self.slen or begin > end:
+            raise IndexError(f"region [{begin}, {end}) is out of bounds for a sequence of length {self.slen}")
+        return self._subsequence(begin, end)
+
     cpdef object max_gc_frame_plot(self, int window_size=_WINDOW):
         """max_gc_frame_plot(self, window_size=120)\n--
 
@@ -1011,6 +2195,7 @@ cdef class Sequence:
         cdef object plot = array.array('i')
 
         plot.frombytes(mem)
+        _memory_record(_MEMORY_GC_FRAME_PLOT, self.slen*sizeof(int), 0)
         free(gc)
 
         if len(plot) != self.slen:
@@ -1104,6 +2289,13 @@ cdef enum simd_backend:
     NEON = 4
     GENERIC = 5
 
+cdef inline size_t _scorer_size(size_t capacity) nogil:
+    """Get the size of the buffers of a `ConnectionScorer` with ``capacity``.
+    """
+    if capacity == 0:
+        return 0
+    return 4 * (capacity * sizeof(uint8_t) + 0x1F) + capacity * (3 * sizeof(int) + 5 * sizeof(double))
+
 cdef class ConnectionScorer:
     """A dedicated class for the fast scoring of nodes.
     """
@@ -1116,6 +2308,7 @@ cdef class ConnectionScorer:
         self.node_types      = self.node_types_raw      = NULL
         self.node_strands    = self.node_strands_raw    = NULL
         self.node_frames     = self.node_frames_raw     = NULL
+        memset(&self.hot, 0, sizeof(_hot_nodes))
 
     def __init__(self, str backend="detect"):
         """__init__(self, backend="detect")\n--
@@ -1127,8 +2320,15 @@ cdef class ConnectionScorer:
                 Use ``"detect"`` to use the best available one depending on
                 the CPU capabilities of the local machine. Other available
                 values are: ``"generic"``, ``"sse"``, ``"avx"``, ``neon``.
+                Use ``"autotune"`` to use the backend found to be the fastest
+                on the local machine by `~pyrodigal.tune`.
+
+        .. versionadded:: 2.1.0
+            The ``"autotune"`` backend.
 
         """
+        if backend == "autotune":
+            backend = tune()
         IF TARGET_CPU == "x86":
             if backend == "detect":
                 self.backend = simd_backend.NONE
@@ -1198,13 +2398,25 @@ cdef class ConnectionScorer:
                 raise ValueError(f"Unsupported backend on this architecture: {backend}")
 
     def __dealloc__(self):
+        _memory_record(_MEMORY_CONNECTION_SCORER, _scorer_size(self.capacity), 0)
         PyMem_Free(self.node_types_raw)
         PyMem_Free(self.node_strands_raw)
         PyMem_Free(self.node_frames_raw)
         PyMem_Free(self.skip_connection_raw)
+        PyMem_Free(self.hot.ndx)
+        PyMem_Free(self.hot.stop_val)
+        PyMem_Free(self.hot.traceb)
+        PyMem_Free(self.hot.score)
+        PyMem_Free(self.hot.cscore)
+        PyMem_Free(self.hot.sscore)
+        PyMem_Free(self.hot.rscore)
+        PyMem_Free(self.hot.uscore)
 
     cpdef size_t __sizeof__(self):
-        return sizeof(self) + (self.capacity * sizeof(uint8_t) + 0x1F) * 4
+        cdef size_t size = sizeof(self) + (self.capacity * sizeof(uint8_t) + 0x1F) * 4
+        if self.hot.ndx != NULL:
+            size += self.capacity * (3 * sizeof(int) + 5 * sizeof(double))
+        return size
 
     # --- C interface --------------------------------------------------------
 
@@ -1230,6 +2442,22 @@ cdef class ConnectionScorer:
                     raise MemoryError("Failed to allocate memory for node strand array")
                 if self.node_frames_raw == NULL:
                     raise MemoryError("Failed to allocate memory for node frame array")
+                # reallocate compact storage of hot node fields
+                self.hot.ndx      = <int*>    PyMem_Realloc(self.hot.ndx, nodes.length      * sizeof(int))
+                self.hot.stop_val = <int*>    PyMem_Realloc(self.hot.stop_val, nodes.length * sizeof(int))
+                self.hot.traceb   = <int*>    PyMem_Realloc(self.hot.traceb, nodes.length   * sizeof(int))
+                self.hot.score    = <double*> PyMem_Realloc(self.hot.score, nodes.length    * sizeof(double))
+                self.hot.cscore   = <double*> PyMem_Realloc(self.hot.cscore, nodes.length   * sizeof(double))
+                self.hot.sscore   = <double*> PyMem_Realloc(self.hot.sscore, nodes.length   * sizeof(double))
+                self.hot.rscore   = <double*> PyMem_Realloc(self.hot.rscore, nodes.length   * sizeof(double))
+                self.hot.uscore   = <double*> PyMem_Realloc(self.hot.uscore, nodes.length   * sizeof(double))
+                if self.hot.ndx == NULL or self.hot.stop_val == NULL or self.hot.traceb == NULL:
+                    raise MemoryError("Failed to allocate memory for node coordinate arrays")
+                if self.hot.score == NULL or self.hot.cscore == NULL or self.hot.sscore == NULL:
+                    raise MemoryError("Failed to allocate memory for node score arrays")
+                if self.hot.rscore == NULL or self.hot.uscore == NULL:
+                    raise MemoryError("Failed to allocate memory for node score arrays")
+                _memory_record(_MEMORY_CONNECTION_SCORER, _scorer_size(self.capacity), _scorer_size(nodes.length))
             # record new capacity
             self.capacity = nodes.length
             # compute pointers to aligned memory
@@ -1237,13 +2465,42 @@ cdef class ConnectionScorer:
             self.node_types      = <uint8_t*> ((<uintptr_t> self.node_types_raw      + 0x1F) & (~0x1F))
             self.node_strands    = <int8_t*>  ((<uintptr_t> self.node_strands_raw    + 0x1F) & (~0x1F))
             self.node_frames     = <uint8_t*> ((<uintptr_t> self.node_frames_raw     + 0x1F) & (~0x1F))
+            self.hot.type        = self.node_types
+            self.hot.strand      = self.node_strands
         # copy data from the array of nodes
         for i in range(nodes.length):
             self.node_types[i]      = nodes.nodes[i].type
             self.node_strands[i]    = nodes.nodes[i].strand
             self.node_frames[i]     = nodes.nodes[i].ndx % 3
             self.skip_connection[i] = False
+            self.hot.ndx[i]         = nodes.nodes[i].ndx
+            self.hot.stop_val[i]    = nodes.nodes[i].stop_val
         # return 0 if no exceptions were raised
+        return self._index_scores(nodes, 0, nodes.length)
+
+    cdef int _index_scores(
+        self,
+        Nodes nodes,
+        const size_t begin,
+        const size_t end,
+    ) nogil except -1:
+        cdef size_t i
+        # nothing to be done if we are using the Prodigal code
+        if self.backend == simd_backend.NONE:
+            return 0
+        # scores can only be copied for nodes that were indexed
+        if self.capacity < end:
+            with gil:
+                raise RuntimeError("Cannot copy scores of nodes that were not indexed")
+        # copy node scores, which may have changed since the nodes were
+        # indexed (e.g. after `Nodes._score` or `Nodes._reset_scores`)
+        for i in range(begin, end):
+            self.hot.traceb[i] = nodes.nodes[i].traceb
+            self.hot.score[i]  = nodes.nodes[i].score
+            self.hot.cscore[i] = nodes.nodes[i].cscore
+            self.hot.sscore[i] = nodes.nodes[i].sscore
+            self.hot.rscore[i] = nodes.nodes[i].rscore
+            self.hot.uscore[i] = nodes.nodes[i].uscore
         return 0
 
     cdef int _compute_skippable(
@@ -1272,6 +2529,16 @@ cdef class ConnectionScorer:
             return 0
         return 0
 
+    cdef size_t _count_skipped(self, const int min, const int i) nogil:
+        """Count the connections to node *i* flagged by `_compute_skippable`.
+        """
+        cdef int    j
+        cdef size_t count = 0
+        if self.backend != simd_backend.NONE:
+            for j in range(min, i):
+                count += self.skip_connection[j] != 0
+        return count
+
     cdef void _score_connections(
         self,
         Nodes nodes,
@@ -1290,8 +2557,7 @@ cdef class ConnectionScorer:
         else:
             _score_connections(
                 self.skip_connection,
-                self.node_types,
-                self.node_strands,
+                &self.hot,
                 nodes.nodes,
                 min,
                 i,
@@ -1299,6 +2565,34 @@ cdef class ConnectionScorer:
                 final
             )
 
+    cdef void _score_connections_between(
+        self,
+        Nodes nodes,
+        const int begin,
+        const int end,
+        const int i,
+        const _training* tinf,
+        const bint final
+    ) nogil:
+        """Score the connections from nodes in ``[begin, end)`` to node *i*.
+
+        Unlike `_score_connections`, this does not record the new score
+        of node *i* in the index, so it must be followed by a call to
+        `_score_connections` for the nodes in the distance window.
+
+        """
+        cdef int j
+        cdef int kind
+        if self.backend == simd_backend.NONE:
+            for j in range(begin, end):
+                dprog.score_connection(nodes.nodes, j, i, <_training*> tinf, final)
+        else:
+            kind = 2*(self.hot.strand[i] == -1) + (self.hot.type[i] == node_type.STOP)
+            for j in range(begin, end):
+                skippable_generic_single(self.node_strands, self.node_types, self.node_frames, j, i, self.skip_connection)
+                if not self.skip_connection[j]:
+                    CONNECTION_FUNCTIONS[kind](nodes.nodes, &self.hot, j, &nodes.nodes[i], tinf, final)
+
     # --- Python interface ---------------------------------------------------
 
     def index(self, Nodes nodes not None):
@@ -1352,11 +2646,217 @@ cdef class ConnectionScorer:
         """
         assert (self.skip_connection != NULL) | (self.backend == simd_backend.NONE)
         assert (i < <int> nodes.length) | (self.backend == simd_backend.NONE)
+        assert 0 <= min
         assert min <= i
         with nogil:
+            # refresh the scores of the nodes involved, which may have
+            # changed since the nodes were indexed (e.g. after `Nodes.score`)
+            self._index_scores(nodes, min, i + 1)
             self._score_connections(nodes, min, i, tinf.tinf, final)
 
 
+# --- Backend autotuning -----------------------------------------------------
+
+cdef int    _TUNE_SEQUENCE_LENGTH = 50000
+cdef object _TUNE_LOCK            = threading.Lock()
+
+_TUNED_BACKENDS = {}
+
+cdef list _available_backends():
+    cdef list backends = [None, "generic"]
+    if _MMX_BUILD_SUPPORT and _MMX_RUNTIME_SUPPORT:
+        backends.append("mmx")
+    if _SSE2_BUILD_SUPPORT and _SSE2_RUNTIME_SUPPORT:
+        backends.append("sse")
+    if _AVX2_BUILD_SUPPORT and _AVX2_RUNTIME_SUPPORT:
+        backends.append("avx")
+    if _NEON_BUILD_SUPPORT and _NEON_RUNTIME_SUPPORT:
+        backends.append("neon")
+    return backends
+
+cdef str _HOST_FINGERPRINT = None
+
+cdef str _host_fingerprint():
+    global _HOST_FINGERPRINT
+    # the host does not change during the lifetime of the process, so
+    # only query the platform and read the CPU model name once
+    if _HOST_FINGERPRINT is not None:
+        return _HOST_FINGERPRINT
+    cdef str cpu = platform.processor()
+    # `platform.processor` is often empty on Linux, so read the CPU model
+    # name directly from the kernel when possible
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    cpu = line.split(":", 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    cdef list fields = [
+        platform.node(),
+        platform.system(),
+        platform.machine(),
+        cpu,
+        __version__,
+    ]
+    fields.extend(str(backend) for backend in _available_backends())
+    _HOST_FINGERPRINT = hashlib.sha1("\0".join(fields).encode()).hexdigest()
+    return _HOST_FINGERPRINT
+
+cdef str _tune_cache_path():
+    cdef str cache_dir = os.environ.get("PYRODIGAL_CACHE_DIR")
+    if cache_dir is None:
+        if sys.platform == "win32":
+            cache_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        else:
+            cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(cache_dir, "pyrodigal")
+    return os.path.join(cache_dir, "backends.json")
+
+cdef Sequence _tune_sequence(int length, uint64_t seed):
+    cdef int      i
+    cdef int      gc_count = 0
+    cdef uint64_t state    = seed
+    cdef Sequence seq      = Sequence.__new__(Sequence)
+    seq._allocate(length)
+    with nogil:
+        for i in range(length):
+            # xorshift64 generator, using the 2 lowest bits as a nucleotide
+            state ^= state << 13
+            state ^= state >> 7
+            state ^= state << 17
+            seq.digits[i] = state & 0b11
+            if seq.digits[i] == nucleotide.G or seq.digits[i] == nucleotide.C:
+                gc_count += 1
+    seq.gc = (<double> gc_count) / (<double> length)
+    return seq
+
+cdef double _tune_backend(ConnectionScorer scorer, Nodes nodes, const _training* tinf) except -1:
+    cdef double end
+    cdef double start = time.perf_counter()
+    with nogil:
+        scorer._index(nodes)
+        nodes._dynamic_programming(tinf, scorer, final=True)
+    end = time.perf_counter()
+    return end - start
+
+def tune(object path=None, *, bint force=False, int runs=5):
+    """tune(path=None, *, force=False, runs=5)\n--
+
+    Find the fastest connection scoring backend on the local machine.
+
+    All the backends available at runtime, including the original Prodigal
+    code, are benchmarked on a synthetic set of nodes, and the fastest one
+    is returned. The result is stored in a cache file, indexed by a
+    fingerprint of the host, so that it can be reused by subsequent
+    processes, possibly running on different machines of a cluster sharing
+    the same filesystem.
+
+    Arguments:
+        path (`str`, optional): The path to the cache file to use. By
+            default, a ``pyrodigal/backends.json`` file is created in the
+            user cache directory, or in the folder given by the
+            ``PYRODIGAL_CACHE_DIR`` environment variable if set.
+
+    Keyword Arguments:
+        force (`bool`): Set to `True` to run the benchmark again even if
+            a result for the local machine was cached.
+        runs (`int`): The number of times each backend should be run. The
+            fastest run of each backend is used for the comparison.
+
+    Returns:
+        `str` or `None`: The name of the fastest backend, which can be
+        passed to `~pyrodigal.OrfFinder` as the ``backend`` argument.
+
+    Raises:
+        `ValueError`: When ``runs`` is not strictly positive.
+
+    Hint:
+        This function is called automatically the first time a
+        `~pyrodigal.OrfFinder` is created with ``backend="autotune"``.
+
+    .. versionadded:: 2.1.0
+
+    """
+    cdef str              fingerprint
+    cdef dict             cache
+    cdef dict             times
+    cdef Nodes            nodes
+    cdef Sequence         seq
+    cdef object           backend
+    cdef ConnectionScorer scorer
+    cdef _training*       tinf        = _METAGENOMIC_BINS[0].tinf
+    cdef list             backends    = _available_backends()
+
+    if runs <= 0:
+        raise ValueError("`runs` must be strictly positive")
+
+    fingerprint = _host_fingerprint()
+    path = _tune_cache_path() if path is None else path
+
+    with _TUNE_LOCK:
+        # reuse the backend tuned by this process
+        if not force and fingerprint in _TUNED_BACKENDS:
+            return _TUNED_BACKENDS[fingerprint]
+
+        # load the cache file, ignoring it if missing or corrupted
+        try:
+            with open(path) as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+
+        # reuse the backend tuned by a previous process on the same host
+        if not force and isinstance(cache.get(fingerprint), dict):
+            backend = cache[fingerprint].get("backend")
+            if backend in backends:
+                _TUNED_BACKENDS[fingerprint] = backend
+                return backend
+
+        # build a synthetic set of nodes to benchmark the backends with
+        seq = _tune_sequence(_TUNE_SEQUENCE_LENGTH, 42)
+        nodes = Nodes.__new__(Nodes)
+        with nogil:
+            nodes._extract(
+                seq,
+                tinf.trans_table,
+                closed=False,
+                min_gene=MIN_GENE,
+                min_edge_gene=MIN_EDGE_GENE
+            )
+            nodes._sort()
+            nodes._score(seq, tinf, closed=False, is_meta=True)
+            nodes._record_overlapping_starts(tinf, True, MAX_SAM_OVLP)
+
+        # time each backend, interleaving runs to mitigate frequency scaling
+        times = dict.fromkeys(range(len(backends)), float("inf"))
+        for _ in range(runs):
+            for i, backend in enumerate(backends):
+                scorer = ConnectionScorer(backend=backend)
+                times[i] = min(times[i], _tune_backend(scorer, nodes, tinf))
+        backend = backends[min(times, key=times.__getitem__)]
+        _TUNED_BACKENDS[fingerprint] = backend
+
+        # record the results, ignoring errors on read-only filesystems
+        cache[fingerprint] = {
+            "backend": backend,
+            "version": __version__,
+            "times": {str(backends[i]): t for i, t in times.items()},
+        }
+        try:
+            os.makedirs(os.path.dirname(path) or os.curdir, exist_ok=True)
+            with open(f"{path}.{os.getpid()}.tmp", "w") as f:
+                json.dump(cache, f, indent=4)
+            os.replace(f"{path}.{os.getpid()}.tmp", path)
+        except OSError as err:
+            warnings.warn(f"failed to write backend cache file: {err}")
+
+    return backend
+
+
 # --- Nodes ------------------------------------------------------------------
 
 cdef class Node:
@@ -1496,6 +2996,8 @@ cdef class Node:
         cdef int max_ndx      = 0
         cdef double max_sc    = -100.0
         cdef double score     = 0.0
+        # NOTE: the hexamer index must have been built by the caller
+        cdef const uint16_t* hexamers = seq.hexamers
 
         if node.type == node_type.STOP or node.edge:
             return
@@ -1504,6 +3006,7 @@ cdef class Node:
             start = node.ndx
         else:
             start = seq.slen - 1 - node.ndx
+            hexamers += seq.slen
 
         for i in reversed(range(4)):
             for j in range(start-18-i, start-5-i):
@@ -1518,7 +3021,7 @@ cdef class Node:
                 else:
                     spacendx = 0
 
-                index = _mer_ndx(seq.digits, seq.slen, j, i+3, node.strand)
+                index = hexamers[j] & _MOTIF_MASKS[i]
                 score = tinf.mot_wt[i][spacendx][index]
                 if score > max_sc:
                     max_sc = score
@@ -1600,6 +3103,7 @@ cdef class Nodes:
         self._clear()
 
     def __dealloc__(self):
+        _memory_record(_MEMORY_NODES, self.capacity * sizeof(_node), 0)
         PyMem_Free(self.nodes)
 
     def __copy__(self):
@@ -1678,14 +3182,14 @@ cdef class Nodes:
         cdef dict   motif
 
         # realloc to the exact number of nodes
-        self.length = self.capacity = len(state)
-        if self.capacity > 0:
-            self.nodes = <_node*> PyMem_Realloc(self.nodes, self.capacity * sizeof(_node))
-            if self.nodes == NULL:
-                raise MemoryError("Failed to reallocate node array")
+        if len(state) > 0:
+            self._allocate(len(state))
         else:
+            _memory_record(_MEMORY_NODES, self.capacity * sizeof(_node), 0)
             PyMem_Free(self.nodes)
             self.nodes = NULL
+            self.capacity = 0
+        self.length = self.capacity
 
         # copy node data from the state dictionary
         for i, node in enumerate(state):
@@ -1726,6 +3230,7 @@ cdef class Nodes:
         self.nodes = <_node*> PyMem_Realloc(self.nodes, self.capacity * sizeof(_node))
         if self.nodes == NULL:
             raise MemoryError("Failed to reallocate node array")
+        _memory_record(_MEMORY_NODES, old_capacity * sizeof(_node), self.capacity * sizeof(_node))
         # clean newly-allocated memory
         if self.capacity > old_capacity:
             memset(&self.nodes[old_capacity], 0, (self.capacity - old_capacity) * sizeof(_node))
@@ -1763,6 +3268,9 @@ cdef class Nodes:
         cdef double gc[3]
         cdef double gsize = 0.0
 
+        # make sure the GC frame index is available for range counts
+        seq._gc_frame_index()
+
         # direct strand
         gc[0] = gc[1] = gc[2] = 0.0
         for i in reversed(range(<int> self.length)):
@@ -1770,18 +3278,9 @@ cdef class Nodes:
                 phase = self.nodes[i].ndx %3
                 if self.nodes[i].type == node_type.STOP:
                     last[phase] = j = self.nodes[i].ndx
-                    gc[phase] = (
-                        _is_gc(seq.digits, seq.slen, j,   1)
-                      + _is_gc(seq.digits, seq.slen, j+1, 1)
-                      + _is_gc(seq.digits, seq.slen, j+2, 1)
-                    )
+                    gc[phase] = seq._gc_count(j, j+3)
                 else:
-                    for j in range(last[phase] - 3, self.nodes[i].ndx - 1, -3):
-                        gc[phase] += (
-                            _is_gc(seq.digits, seq.slen, j,   1)
-                          + _is_gc(seq.digits, seq.slen, j+1, 1)
-                          + _is_gc(seq.digits, seq.slen, j+2, 1)
-                        )
+                    gc[phase] += seq._gc_count(self.nodes[i].ndx, last[phase])
                     gsize = abs(self.nodes[i].stop_val - self.nodes[i].ndx) + 3.0
                     self.nodes[i].gc_cont = gc[phase] / gsize
                     last[phase] = self.nodes[i].ndx
@@ -1793,18 +3292,9 @@ cdef class Nodes:
                 phase = self.nodes[i].ndx % 3
                 if self.nodes[i].type == node_type.STOP:
                     last[phase] = j = self.nodes[i].ndx
-                    gc[phase] = (
-                        _is_gc(seq.digits, seq.slen, j,   1)
-                      + _is_gc(seq.digits, seq.slen, j-1, 1)
-                      + _is_gc(seq.digits, seq.slen, j-2, 1)
-                    )
+                    gc[phase] = seq._gc_count(j-2, j+1)
                 else:
-                    for j in range(last[phase] + 3, self.nodes[i].ndx + 1, 3):
-                        gc[phase] += (
-                              _is_gc(seq.digits, seq.slen, j,   1)
-                            + _is_gc(seq.digits, seq.slen, j+1, 1)
-                            + _is_gc(seq.digits, seq.slen, j+2, 1)
-                        )
+                    gc[phase] += seq._gc_count(last[phase] + 3, self.nodes[i].ndx + 3)
                     gsize = abs(self.nodes[i].stop_val - self.nodes[i].ndx) + 3.0
                     self.nodes[i].gc_cont = gc[phase] / gsize
                     last[phase] = self.nodes[i].ndx
@@ -1823,11 +3313,15 @@ cdef class Nodes:
         self,
         const _training* tinf,
         ConnectionScorer scorer,
-        const bint final
-    ) nogil:
+        const bint final,
+        _profile* profile = NULL,
+    ) nogil except -2:
         cdef int    i
         cdef int    j
         cdef int    min
+        cdef int    begin
+        cdef int    end
+        cdef size_t skipped
         cdef int    path
         cdef int    nxt
         cdef int    tmp
@@ -1841,20 +3335,45 @@ cdef class Nodes:
             self.nodes[i].score = 0
             self.nodes[i].traceb = -1
             self.nodes[i].tracef = -1
+        scorer._index_scores(self, 0, self.length)
 
         for i in range(<int> self.length):
             # Set up distance constraints for making connections,
-            # but make exceptions for giant ORFS.
+            # but make exceptions for giant ORFS: instead of scanning
+            # all the previous nodes, only consider the ones that can
+            # actually form a valid connection with node *i*.
             min = 0 if i < dprog.MAX_NODE_DIST else i - dprog.MAX_NODE_DIST
+            begin = end = 0
             if self.nodes[i].strand == -1 and self.nodes[i].type != node_type.STOP and self.nodes[min].ndx >= self.nodes[i].stop_val:
                 if self.nodes[i].ndx != self.nodes[i].stop_val:
-                    min = 0
+                    # a reverse start can only connect to its own stop, or
+                    # to a forward stop overlapping its stop codon
+                    begin = <int> self._lower_bound(self.nodes[i].stop_val - 3)
+                    end = <int> self._lower_bound(self.nodes[i].stop_val + dprog.MAX_OPP_OVLP)
+                    if profile != NULL:
+                        profile.window_resets += 1
             elif self.nodes[i].strand == 1 and self.nodes[i].type == node_type.STOP and self.nodes[min].ndx >= self.nodes[i].stop_val:
                 if self.nodes[i].ndx != self.nodes[i].stop_val:
-                    min = 0
+                    # a forward stop can only connect to nodes located
+                    # after the end of the previous ORF in the same frame
+                    begin = <int> self._lower_bound(self.nodes[i].stop_val + 1)
+                    end = i
+                    if profile != NULL:
+                        profile.window_resets += 1
             min = 0 if min < dprog.MAX_NODE_DIST else min - dprog.MAX_NODE_DIST
+            if end > min:
+                end = min
+            if begin < end:
+                # Score connections outside of the window
+                scorer._score_connections_between(self, begin, end, i, tinf, final)
+                if profile != NULL:
+                    profile.connections_scored += end - begin
             # Check which nodes can be skipped
             scorer._compute_skippable(min, i)
+            if profile != NULL:
+                skipped = scorer._count_skipped(min, i)
+                profile.connections_skipped += skipped
+                profile.connections_scored += i - min - skipped
             # Score connections
             scorer._score_connections(self, min, i, tinf, final)
 
@@ -1908,6 +3427,18 @@ cdef class Nodes:
 
         return -1 if self.nodes[max_ndx].traceb == -1 else max_ndx
 
+    cdef int _extend(self, Nodes other) nogil except -1:
+        """Append all the nodes from ``other`` to the vector.
+        """
+        if other.length == 0:
+            return 0
+        if self.length + other.length > self.capacity:
+            with gil:
+                self._allocate(self.length + other.length)
+        memcpy(&self.nodes[self.length], other.nodes, other.length * sizeof(_node))
+        self.length += other.length
+        return 0
+
     cdef int _extract(
         self,
         Sequence sequence,
@@ -1915,7 +3446,15 @@ cdef class Nodes:
         bint closed,
         int min_gene,
         int min_edge_gene,
+        int strand = 0,
     ) nogil except -1:
+        """Extract the start and stop nodes from ``sequence``.
+
+        Nodes are only extracted from the direct or reverse strand when
+        ``strand`` is ``1`` or ``-1`` respectively, or from both when
+        ``strand`` is ``0``.
+
+        """
         cdef int    i
         cdef int    j
         cdef bint   skip
@@ -1926,202 +3465,218 @@ cdef class Nodes:
         cdef int    slmod        = sequence.slen % 3
         cdef int    nn           = 0
         cdef int    tt           = translation_table
-
-        # If sequence is smaller than a codon, there are no nodes to add
-        if sequence.slen < 3:
-            return nn
-
-        # Forward strand nodes
-        if sequence.masks.length > 0:
-            mask[0] = mask[1] = mask[2] = &sequence.masks.masks[sequence.masks.length - 1]
-        else:
-            mask[0] = mask[1] = mask[2] = NULL
-        for i in range(3):
-            last[(i+slmod)%3] = sequence.slen + i
-            saw_start[i%3] = False
-            min_dist[i%3] = min_edge_gene
-            if not closed:
-                while last[(i+slmod)%3] + 3 > sequence.slen:
-                    last[(i+slmod)%3] -= 3
-        for i in reversed(range(sequence.slen-2)):
-            # check if the current phase encountered a stop
-            if _is_stop(sequence.digits, sequence.slen, i, tt, 1):
-                if saw_start[i%3]:
-                    self._add_node(
-                        ndx = last[i%3],
-                        type = node_type.STOP,
-                        strand = 1,
-                        stop_val = i,
-                        edge = not _is_stop(sequence.digits, sequence.slen, last[i%3], tt, 1),
-                    )
-                    nn += 1
-                min_dist[i%3] = min_gene
-                last[i%3] = i
+
+        # If sequence is smaller than a codon, there are no nodes to add
+        if sequence.slen < 3:
+            return nn
+
+        # Forward strand nodes
+        if strand != -1:
+            if sequence.masks.length > 0:
+                mask[0] = mask[1] = mask[2] = &sequence.masks.masks[sequence.masks.length - 1]
+            else:
+                mask[0] = mask[1] = mask[2] = NULL
+            for i in range(3):
+                last[(i+slmod)%3] = sequence.slen + i
                 saw_start[i%3] = False
-                continue
-            if last[i%3] >= sequence.slen:
-                continue
-            # find the next phase mask if the candidate gene end is after the mask start
-            while mask[i%3] != NULL and last[i%3] < mask[i%3].begin:
-                if mask[i%3] == &sequence.masks.masks[0]:
-                    mask[i%3] = NULL
-                else:
-                    mask[i%3] -= 1
-            # check that the current phase mask does not intersect the candidate gene
-            if Mask._intersects(mask[i%3], i, last[i%3]):
-                continue
-            # check if the current phase encountered a start
-            if last[i%3] - i + 3 >= min_dist[i%3] and _is_start(sequence.digits, sequence.slen, i, tt, 1):
-                if _is_a(sequence.digits, sequence.slen, i, 1):
+                min_dist[i%3] = min_edge_gene
+                if not closed:
+                    while last[(i+slmod)%3] + 3 > sequence.slen:
+                        last[(i+slmod)%3] -= 3
+            for i in reversed(range(sequence.slen-2)):
+                # check if the current phase encountered a stop
+                if _is_stop(sequence.digits, sequence.slen, i, tt, 1):
+                    if saw_start[i%3]:
+                        self._add_node(
+                            ndx = last[i%3],
+                            type = node_type.STOP,
+                            strand = 1,
+                            stop_val = i,
+                            edge = not _is_stop(sequence.digits, sequence.slen, last[i%3], tt, 1),
+                        )
+                        nn += 1
+                    min_dist[i%3] = min_gene
+                    last[i%3] = i
+                    saw_start[i%3] = False
+                    continue
+                if last[i%3] >= sequence.slen:
+                    continue
+                # find the next phase mask if the candidate gene end is after the mask start
+                while mask[i%3] != NULL and last[i%3] < mask[i%3].begin:
+                    if mask[i%3] == &sequence.masks.masks[0]:
+                        mask[i%3] = NULL
+                    else:
+                        mask[i%3] -= 1
+                # check that the current phase mask does not intersect the candidate gene
+                if Mask._intersects(mask[i%3], i, last[i%3]):
+                    continue
+                # check if the current phase encountered a start
+                if last[i%3] - i + 3 >= min_dist[i%3] and _is_start(sequence.digits, sequence.slen, i, tt, 1):
+                    if _is_a(sequence.digits, sequence.slen, i, 1):
+                        saw_start[i%3] = True
+                        self._add_node(
+                            ndx = i,
+                            type = node_type.ATG,
+                            stop_val = last[i%3],
+                            strand = 1,
+                            edge = False
+                        )
+                        nn += 1
+                    elif _is_t(sequence.digits, sequence.slen, i, 1):
+                        saw_start[i%3] = True
+                        self._add_node(
+                            ndx = i,
+                            type = node_type.TTG,
+                            stop_val = last[i%3],
+                            strand = 1,
+                            edge = False
+                        )
+                        nn += 1
+                    elif _is_g(sequence.digits, sequence.slen, i, 1):
+                        saw_start[i%3] = True
+                        self._add_node(
+                            ndx = i,
+                            type = node_type.GTG,
+                            stop_val = last[i%3],
+                            strand = 1,
+                            edge = False
+                        )
+                        nn += 1
+                    else:
+                        raise RuntimeError("Encountered a STOP codon that is none of ATG/TTG/GTG")
+                elif i <= 2 and not closed and last[i%3] - i > min_edge_gene:
                     saw_start[i%3] = True
                     self._add_node(
                         ndx = i,
                         type = node_type.ATG,
                         stop_val = last[i%3],
                         strand = 1,
-                        edge = False
-                    )
-                    nn += 1
-                elif _is_t(sequence.digits, sequence.slen, i, 1):
-                    saw_start[i%3] = True
-                    self._add_node(
-                        ndx = i,
-                        type = node_type.TTG,
-                        stop_val = last[i%3],
-                        strand = 1,
-                        edge = False
+                        edge = True,
                     )
                     nn += 1
-                elif _is_g(sequence.digits, sequence.slen, i, 1):
-                    saw_start[i%3] = True
+            for i in range(3):
+                if saw_start[i%3]:
                     self._add_node(
-                        ndx = i,
-                        type = node_type.GTG,
-                        stop_val = last[i%3],
+                        ndx = last[i%3],
+                        type = node_type.STOP,
                         strand = 1,
-                        edge = False
+                        stop_val = i - 6,
+                        edge = not _is_stop(sequence.digits, sequence.slen, last[i%3], tt, 1)
                     )
                     nn += 1
-                else:
-                    raise RuntimeError("Encountered a STOP codon that is none of ATG/TTG/GTG")
-            elif i <= 2 and not closed and last[i%3] - i > min_edge_gene:
-                saw_start[i%3] = True
-                self._add_node(
-                    ndx = i,
-                    type = node_type.ATG,
-                    stop_val = last[i%3],
-                    strand = 1,
-                    edge = True,
-                )
-                nn += 1
-        for i in range(3):
-            if saw_start[i%3]:
-                self._add_node(
-                    ndx = last[i%3],
-                    type = node_type.STOP,
-                    strand = 1,
-                    stop_val = i - 6,
-                    edge = not _is_stop(sequence.digits, sequence.slen, last[i%3], tt, 1)
-                )
-                nn += 1
 
         # Reverse strand nodes
-        if sequence.masks.length > 0:
-            mask[0] = mask[1] = mask[2] = &sequence.masks.masks[0]
-        else:
-            mask[0] = mask[1] = mask[2] = NULL
-        for i in range(3):
-            last[(i + slmod) % 3] = sequence.slen + i
-            saw_start[i%3] = False
-            min_dist[i%3] = min_edge_gene
-            if not closed:
-                while last[(i+slmod) % 3] + 3 > sequence.slen:
-                    last[(i+slmod)%3] -= 3
-        for i in reversed(range(sequence.slen-2)):
-            # check if the current phase encountered a stop
-            if _is_stop(sequence.digits, sequence.slen, i, tt, -1):
-                if saw_start[i%3]:
-                    self._add_node(
-                        ndx = sequence.slen - last[i%3] - 1,
-                        type = node_type.STOP,
-                        strand = -1,
-                        stop_val = sequence.slen - i - 1,
-                        edge = not _is_stop(sequence.digits, sequence.slen, last[i%3], tt, -1)
-                    )
-                    nn += 1
-                min_dist[i%3] = min_gene
-                last[i%3] = i
+        if strand != 1:
+            if sequence.masks.length > 0:
+                mask[0] = mask[1] = mask[2] = &sequence.masks.masks[0]
+            else:
+                mask[0] = mask[1] = mask[2] = NULL
+            for i in range(3):
+                last[(i + slmod) % 3] = sequence.slen + i
                 saw_start[i%3] = False
-                continue
-            if last[i%3] >= sequence.slen:
-                continue
-            # find the next phase mask if the candidate gene start is after the mask end
-            while mask[i%3] != NULL and sequence.slen-last[i%3]-1 > mask[i%3].end:
-                if mask[i%3] == &sequence.masks.masks[sequence.masks.length]:
-                    mask[i%3] = NULL
-                else:
-                    mask[i%3] += 1
-            # check that the current phase mask does not intersect the candidate gene
+                min_dist[i%3] = min_edge_gene
+                if not closed:
+                    while last[(i+slmod) % 3] + 3 > sequence.slen:
+                        last[(i+slmod)%3] -= 3
+            for i in reversed(range(sequence.slen-2)):
+                # check if the current phase encountered a stop
+                if _is_stop(sequence.digits, sequence.slen, i, tt, -1):
+                    if saw_start[i%3]:
+                        self._add_node(
+                            ndx = sequence.slen - last[i%3] - 1,
+                            type = node_type.STOP,
+                            strand = -1,
+                            stop_val = sequence.slen - i - 1,
+                            edge = not _is_stop(sequence.digits, sequence.slen, last[i%3], tt, -1)
+                        )
+                        nn += 1
+                    min_dist[i%3] = min_gene
+                    last[i%3] = i
+                    saw_start[i%3] = False
+                    continue
+                if last[i%3] >= sequence.slen:
+                    continue
+                # find the next phase mask if the candidate gene start is after the mask end
+                while mask[i%3] != NULL and sequence.slen-last[i%3]-1 > mask[i%3].end:
+                    if mask[i%3] == &sequence.masks.masks[sequence.masks.length - 1]:
+                        mask[i%3] = NULL
+                    else:
+                        mask[i%3] += 1
+                # check that the current phase mask does not intersect the candidate gene
 
-            if Mask._intersects(mask[i%3], sequence.slen-last[i%3]-1, sequence.slen-i-1):
-                continue
-            # check if the current phase encountered a start
-            if last[i%3] - i + 3 >= min_dist[i%3] and _is_start(sequence.digits, sequence.slen, i, tt, -1):
-                if _is_a(sequence.digits, sequence.slen, i, -1):
-                    saw_start[i%3] = True
-                    self._add_node(
+                if Mask._intersects(mask[i%3], sequence.slen-last[i%3]-1, sequence.slen-i-1):
+                    continue
+                # check if the current phase encountered a start
+                if last[i%3] - i + 3 >= min_dist[i%3] and _is_start(sequence.digits, sequence.slen, i, tt, -1):
+                    if _is_a(sequence.digits, sequence.slen, i, -1):
+                        saw_start[i%3] = True
+                        self._add_node(
+                            ndx = sequence.slen - i - 1,
+                            type = node_type.ATG,
+                            strand = -1,
+                            stop_val = sequence.slen - last[i%3] - 1,
+                            edge = False
+                        )
+                        nn += 1
+                    elif _is_g(sequence.digits, sequence.slen, i, -1):
+                        saw_start[i%3] = True
+                        self._add_node(
+                            ndx = sequence.slen - i - 1,
+                            type = node_type.GTG,
+                            strand = -1,
+                            stop_val = sequence.slen - last[i%3] - 1,
+                            edge = False
+                        )
+                        nn += 1
+                    elif _is_t(sequence.digits, sequence.slen, i, -1):
+                        saw_start[i%3] = 1
+                        self._add_node(
+                            ndx = sequence.slen - i - 1,
+                            type = node_type.TTG,
+                            strand = -1,
+                            stop_val = sequence.slen - last[i%3] - 1,
+                            edge = False,
+                        )
+                        nn += 1
+                    else:
+                        raise RuntimeError("Encountered a STOP codon that is none of ATG/TTG/GTG")
+                elif i <= 2 and not closed and last[i%3] - i > min_edge_gene:
+                    saw_start[i%3] = 1
+                    node = self._add_node(
                         ndx = sequence.slen - i - 1,
                         type = node_type.ATG,
                         strand = -1,
                         stop_val = sequence.slen - last[i%3] - 1,
-                        edge = False
-                    )
-                    nn += 1
-                elif _is_g(sequence.digits, sequence.slen, i, -1):
-                    saw_start[i%3] = True
-                    self._add_node(
-                        ndx = sequence.slen - i - 1,
-                        type = node_type.GTG,
-                        strand = -1,
-                        stop_val = sequence.slen - last[i%3] - 1,
-                        edge = False
+                        edge = True,
                     )
                     nn += 1
-                elif _is_t(sequence.digits, sequence.slen, i, -1):
-                    saw_start[i%3] = 1
-                    self._add_node(
-                        ndx = sequence.slen - i - 1,
-                        type = node_type.TTG,
+            for i in range(3):
+                if saw_start[i%3]:
+                    node = self._add_node(
+                        ndx = sequence.slen - last[i%3] - 1,
+                        type = node_type.STOP,
                         strand = -1,
-                        stop_val = sequence.slen - last[i%3] - 1,
-                        edge = False,
+                        stop_val = sequence.slen - i + 5,
+                        edge = not _is_stop(sequence.digits, sequence.slen, last[i%3], tt, -1),
                     )
                     nn += 1
-                else:
-                    raise RuntimeError("Encountered a STOP codon that is none of ATG/TTG/GTG")
-            elif i <= 2 and not closed and last[i%3] - i > min_edge_gene:
-                saw_start[i%3] = 1
-                node = self._add_node(
-                    ndx = sequence.slen - i - 1,
-                    type = node_type.ATG,
-                    strand = -1,
-                    stop_val = sequence.slen - last[i%3] - 1,
-                    edge = True,
-                )
-                nn += 1
-        for i in range(3):
-            if saw_start[i%3]:
-                node = self._add_node(
-                    ndx = sequence.slen - last[i%3] - 1,
-                    type = node_type.STOP,
-                    strand = -1,
-                    stop_val = sequence.slen - i + 5,
-                    edge = not _is_stop(sequence.digits, sequence.slen, last[i%3], tt, -1),
-                )
-                nn += 1
 
         return nn
 
+    cdef ssize_t _lower_bound(self, int ndx) nogil:
+        """Find the index of the first node located at or after *ndx*.
+        """
+        cdef ssize_t i
+        cdef ssize_t lo = 0
+        cdef ssize_t hi = <ssize_t> self.length
+        while lo < hi:
+            i = (lo + hi) // 2
+            if self.nodes[i].ndx < ndx:
+                lo = i + 1
+            else:
+                hi = i
+        return lo
+
     cdef int _raw_coding_score(
         self,
         Sequence seq,
@@ -2136,6 +3691,7 @@ cdef class Nodes:
         cdef ssize_t j
         cdef ssize_t i
         cdef ssize_t nn = self.length
+        cdef const uint16_t* hexamers = seq._hexamer_index()
 
         if tinf.trans_table != 11:
             no_stop =  ((1-tinf.gc)*(1-tinf.gc)*tinf.gc)     / 8.0
@@ -2156,7 +3712,7 @@ cdef class Nodes:
                     score[phase] = 0.0
                 else:
                     for j in range(last[phase] - 3, self.nodes[i].ndx - 1, -3):
-                        score[phase] += tinf.gene_dc[_mer_ndx(seq.digits, seq.slen, j, 6, 1)];
+                        score[phase] += tinf.gene_dc[hexamers[j]]
                     self.nodes[i].cscore = score[phase]
                     last[phase] = self.nodes[i].ndx
         score[0] = score[1] = score[2] = 0.0
@@ -2168,7 +3724,7 @@ cdef class Nodes:
                     score[phase] = 0.0
                 else:
                     for j in range(last[phase] + 3, self.nodes[i].ndx + 1, 3):
-                        score[phase] += tinf.gene_dc[_mer_ndx(seq.digits, seq.slen, seq.slen-1-j, 6, -1)]
+                        score[phase] += tinf.gene_dc[hexamers[2*seq.slen-1-j]]
                     self.nodes[i].cscore = score[phase]
                     last[phase] = self.nodes[i].ndx
 
@@ -2247,10 +3803,22 @@ cdef class Nodes:
         Sequence seq,
         const _training* tinf
     ) nogil except -1:
-        cdef int i
-        cdef int j
-        cdef int cur_sc[2]
-        cdef int slen      = seq.slen
+        cdef int             i
+        cdef int             j
+        cdef int             dist
+        cdef int             start
+        cdef uint8_t         mask
+        cdef int             exact[16][64]
+        cdef int             mm[16][64]
+        cdef int             slen     = seq.slen
+        cdef const uint16_t* hexamers = seq._hexamer_index()
+
+        # precompute the score of every possible motif match at every
+        # distance from the start codon with the current RBS weights
+        for dist in range(5, 21):
+            for mask in range(64):
+                exact[dist-5][mask] = Sequence._score_shine_dalgarno_exact(mask, dist, tinf)
+                mm[dist-5][mask] = Sequence._score_shine_dalgarno_mm(mask, dist, tinf)
 
         for i in range(<int> self.length):
             if self.nodes[i].type == node_type.STOP or self.nodes[i].edge:
@@ -2258,25 +3826,30 @@ cdef class Nodes:
             self.nodes[i].rbs[0] = self.nodes[i].rbs[1] = 0
 
             if self.nodes[i].strand == 1:
-                for j in range(self.nodes[i].ndx - 20, self.nodes[i].ndx - 5):
+                start = self.nodes[i].ndx
+                for j in range(start - 20, start - 5):
                     if j < 0:
                         continue
-                    cur_sc[0] = seq._shine_dalgarno_exact(j, self.nodes[i].ndx, tinf, strand=1)
-                    cur_sc[1] = seq._shine_dalgarno_mm(j, self.nodes[i].ndx, tinf, strand=1)
-                    if cur_sc[0] > self.nodes[i].rbs[0]:
-                        self.nodes[i].rbs[0] = cur_sc[0]
-                    if cur_sc[1] > self.nodes[i].rbs[1]:
-                        self.nodes[i].rbs[1] = cur_sc[1]
+                    mask = _SHINE_DALGARNO_MASKS[hexamers[j]]
+                    dist = start - j
+                    if exact[dist-5][mask] > self.nodes[i].rbs[0]:
+                        self.nodes[i].rbs[0] = exact[dist-5][mask]
+                    if mm[dist-5][mask] > self.nodes[i].rbs[1]:
+                        self.nodes[i].rbs[1] = mm[dist-5][mask]
             else:
-                for j in range(slen - self.nodes[i].ndx - 21, slen - self.nodes[i].ndx - 6):
+                start = slen - 1 - self.nodes[i].ndx
+                for j in range(start - 20, start - 5):
                     if j >= slen:
                         continue
-                    cur_sc[0] = seq._shine_dalgarno_exact(j, slen-1-self.nodes[i].ndx, tinf, strand=-1)
-                    cur_sc[1] = seq._shine_dalgarno_mm(j, slen-1-self.nodes[i].ndx, tinf, strand=-1)
-                    if cur_sc[0] > self.nodes[i].rbs[0]:
-                        self.nodes[i].rbs[0] = cur_sc[0]
-                    if cur_sc[1] > self.nodes[i].rbs[1]:
-                        self.nodes[i].rbs[1] = cur_sc[1]
+                    elif j < 0:
+                        mask = seq._shine_dalgarno_mask(j, strand=-1)
+                    else:
+                        mask = _SHINE_DALGARNO_MASKS[hexamers[slen + j]]
+                    dist = start - j
+                    if exact[dist-5][mask] > self.nodes[i].rbs[0]:
+                        self.nodes[i].rbs[0] = exact[dist-5][mask]
+                    if mm[dist-5][mask] > self.nodes[i].rbs[1]:
+                        self.nodes[i].rbs[1] = mm[dist-5][mask]
 
         return 0
 
@@ -2359,6 +3932,7 @@ cdef class Nodes:
         if tinf.uses_sd:
             self._rbs_score(seq, tinf)
         else:
+            seq._hexamer_index()
             for i in range(self.length):
                 if self.nodes[i].type == node_type.STOP or self.nodes[i].edge:
                     continue
@@ -2490,6 +4064,18 @@ cdef class Nodes:
         # Return 0 on success
         return 0
 
+    cdef ssize_t _search(self, int ndx, int strand, int type) nogil:
+        """Find the index of a node in the sorted vector, or ``-1``.
+        """
+        cdef ssize_t i
+        # look for the right node among the nodes at that position
+        for i in range(self._lower_bound(ndx), <ssize_t> self.length):
+            if self.nodes[i].ndx != ndx:
+                break
+            if self.nodes[i].strand == strand and self.nodes[i].type == type:
+                return i
+        return -1
+
     cdef int _sort(self) nogil except 1:
         """Sort all nodes in the vector by their index and strand.
         """
@@ -2509,11 +4095,10 @@ cdef class Nodes:
 
         """
         cdef Nodes new = Nodes.__new__(Nodes)
-        new.capacity = self.capacity
-        new.length = self.length
-        if self.capacity > 0:
-            new._allocate(new.capacity)
-            memcpy(new.nodes, self.nodes, new.length * sizeof(_node))
+        if self.length > 0:
+            new._allocate(self.length)
+            memcpy(new.nodes, self.nodes, self.length * sizeof(_node))
+            new.length = self.length
         return new
 
     def clear(self):
@@ -3063,12 +4648,23 @@ cdef class Genes:
             input sequence.
         meta (`bool`): Whether these genes have been found after a run
             in metagenomic mode, or in single mode.
+        keep_nodes (`bool`): Whether ``nodes`` contains all the nodes of
+            the input sequence, or only the start and stop nodes of each
+            gene, in order.
+        stats (`dict` or `None`): The profiling statistics of the call
+            that found these genes, if the `~pyrodigal.OrfFinder` was
+            created with ``profile=True``: the total time (``total``),
+            the time spent in each stage (``times``) and in each
+            metagenomic bin (``bins``) in seconds, and some ``counters``.
 
     .. versionadded:: 0.5.4
 
     .. versionadded:: 2.0.0
         The ``meta`` attribute.
 
+    .. versionadded:: 2.1.0
+        The ``keep_nodes`` and ``stats`` attributes.
+
     """
 
     # --- Magic methods ------------------------------------------------------
@@ -3078,8 +4674,11 @@ cdef class Genes:
         self.capacity = 0
         self.length = 0
         self.meta = False
+        self.keep_nodes = True
+        self.stats = None
 
     def __dealloc__(self):
+        _memory_record(_MEMORY_GENES, self.capacity * sizeof(_gene), 0)
         PyMem_Free(self.genes)
 
     def __bool__(self):
@@ -3110,8 +4709,10 @@ cdef class Genes:
         state = {
             "_num_seq": self._num_seq,
             "meta": self.meta,
+            "keep_nodes": self.keep_nodes,
             "nodes": self.nodes,
             "sequence": self.sequence,
+            "stats": self.stats,
             "genes": [
                 {
                     "begin": self.genes[i].begin,
@@ -3135,18 +4736,20 @@ cdef class Genes:
         cdef list   genes = state["genes"]
 
         # realloc to the exact number of genes
-        self.length = self.capacity = len(genes)
-        if self.capacity > 0:
-            self.genes = <_gene*> PyMem_Realloc(self.genes, self.capacity * sizeof(_gene))
-            if self.genes == NULL:
-                raise MemoryError("Failed to reallocate gene array")
+        if len(genes) > 0:
+            self._allocate(len(genes))
         else:
+            _memory_record(_MEMORY_GENES, self.capacity * sizeof(_gene), 0)
             PyMem_Free(self.genes)
             self.genes = NULL
+            self.capacity = 0
+        self.length = self.capacity
 
         # copy attributes
         self._num_seq = state["_num_seq"]
         self.meta = state["meta"]
+        self.keep_nodes = state.get("keep_nodes", True)
+        self.stats = state.get("stats")
         self.nodes = state["nodes"]
         self.sequence = state["sequence"]
 
@@ -3173,6 +4776,7 @@ cdef class Genes:
         self.genes = <_gene*> PyMem_Realloc(self.genes, self.capacity * sizeof(_gene))
         if self.genes == NULL:
             raise MemoryError("Failed to reallocate gene array")
+        _memory_record(_MEMORY_GENES, old_capacity * sizeof(_gene), self.capacity * sizeof(_gene))
         # clean newly-allocated memory
         if self.capacity > old_capacity:
             memset(&self.genes[old_capacity], 0, (self.capacity - old_capacity) * sizeof(_gene))
@@ -3562,6 +5166,11 @@ cdef class Genes:
 
         .. versionadded:: 0.7.0
 
+        Raises:
+            `RuntimeError`: When the genes were found with
+                ``keep_nodes=False``, since the nodes of the alternative
+                starts were not kept.
+
         .. versionadded:: 2.0.0
             The ``sequence_id`` argument.
 
@@ -3579,6 +5188,9 @@ cdef class Genes:
         cdef double    rbs1
         cdef double    rbs2
 
+        if not self.keep_nodes:
+            raise RuntimeError("cannot write start scores of genes found with `keep_nodes=False`")
+
         try:
             # Sort and groupd nodes by STOP codon position
             qsort(self.nodes.nodes, self.nodes.length, sizeof(_node), stopcmp_nodes)
@@ -3657,6 +5269,142 @@ cdef class Genes:
 
 # --- Training Info ----------------------------------------------------------
 
+cdef struct _dicodon_counts:
+    int background[4096]
+    int genes[4096]
+    int total
+
+cdef struct _dicodon_job:
+    const uint16_t*  hexamers
+    size_t           slen
+    const int*       spans
+    size_t           nspans
+    int              chunks
+    _dicodon_counts* counts
+
+cdef int _dicodon_task(void* data, int index) nogil:
+    cdef size_t           i
+    cdef int              j
+    cdef size_t           begin
+    cdef size_t           end
+    cdef _dicodon_job*    job      = <_dicodon_job*> data
+    cdef _dicodon_counts* counts   = &job.counts[index]
+    cdef const uint16_t*  hexamers = job.hexamers
+
+    # count the hexamers of both strands in a chunk of the background
+    _chunk(job.slen - 5 if job.slen > 5 else 0, job.chunks, index, &begin, &end)
+    for i in range(begin, end):
+        counts.background[hexamers[i]] += 1
+        counts.background[hexamers[job.slen + i]] += 1
+
+    # count the in-frame hexamers in a chunk of the gene spans
+    _chunk(job.nspans, job.chunks, index, &begin, &end)
+    for i in range(begin, end):
+        for j in range(job.spans[3*i], job.spans[3*i + 1] - 5, 3):
+            counts.genes[hexamers[job.spans[3*i + 2] + j]] += 1
+            counts.total += 1
+
+    return 0
+
+cdef struct _upstream_counts:
+    double composition[32][4]
+
+cdef struct _upstream_job:
+    void*             sequence  # borrowed `Sequence`
+    const int*        starts
+    size_t            nstarts
+    int               chunks
+    _upstream_counts* counts
+
+cdef int _upstream_task(void* data, int index) nogil:
+    cdef size_t            i
+    cdef size_t            begin
+    cdef size_t            end
+    cdef _upstream_job*    job    = <_upstream_job*> data
+    cdef _upstream_counts* counts = &job.counts[index]
+
+    _chunk(job.nstarts, job.chunks, index, &begin, &end)
+    for i in range(begin, end):
+        TrainingInfo._update_upstream_composition(
+            counts.composition,
+            <Sequence> job.sequence,
+            job.starts[2*i],
+            job.starts[2*i + 1],
+        )
+
+    return 0
+
+cdef struct _rbs_job:
+    const _node*     nodes
+    size_t           length
+    const _training* tinf
+    int              chunks
+    double*          counts  # 28 per chunk
+
+cdef int _rbs_background_task(void* data, int index) nogil:
+    cdef size_t        j
+    cdef int           max_rb
+    cdef size_t        begin
+    cdef size_t        end
+    cdef _rbs_job*     job    = <_rbs_job*> data
+    cdef const _node*  nodes  = job.nodes
+    cdef double*       rbg    = &job.counts[28*index]
+
+    memset(rbg, 0, 28*sizeof(double))
+    _chunk(job.length, job.chunks, index, &begin, &end)
+    for j in range(begin, end):
+        if nodes[j].type == node_type.STOP or nodes[j].edge:
+            continue
+        if job.tinf.rbs_wt[nodes[j].rbs[0]] > job.tinf.rbs_wt[nodes[j].rbs[1]]+1.0 or nodes[j].rbs[1] == 0:
+            max_rb = nodes[j].rbs[0]
+        elif job.tinf.rbs_wt[nodes[j].rbs[0]] < job.tinf.rbs_wt[nodes[j].rbs[1]]-1.0 or nodes[j].rbs[0] == 0:
+            max_rb = nodes[j].rbs[1]
+        elif nodes[j].rbs[0] > nodes[j].rbs[1]:
+            max_rb = nodes[j].rbs[0]
+        else:
+            max_rb = nodes[j].rbs[1]
+        rbg[max_rb] += 1.0
+
+    return 0
+
+cdef struct _motif_counts:
+    double counts[4][4][4096]
+    double zero
+
+cdef struct _motif_job:
+    _node*           nodes
+    size_t           length
+    void*            sequence  # borrowed `Sequence`
+    const _training* tinf
+    int              stage
+    int              chunks
+    _motif_counts*   counts
+
+cdef int _motif_background_task(void* data, int index) nogil:
+    cdef size_t         j
+    cdef int            k
+    cdef size_t         begin
+    cdef size_t         end
+    cdef _motif_job*    job    = <_motif_job*> data
+    cdef _motif_counts* counts = &job.counts[index]
+    cdef _node*         nodes  = job.nodes
+
+    # only the entries for existing motifs of each length need to be
+    # cleared, all others are never written to
+    for j in range(4):
+        for k in range(4):
+            memset(counts.counts[j][k], 0, _MOTIF_SIZES[j] * sizeof(double))
+    counts.zero = 0.0
+
+    _chunk(job.length, job.chunks, index, &begin, &end)
+    for j in range(begin, end):
+        if nodes[j].type == node_type.STOP or nodes[j].edge:
+            continue
+        Node._find_best_upstream_motif(&nodes[j], <Sequence> job.sequence, job.tinf, job.stage)
+        TrainingInfo._update_motif_counts(counts.counts, &counts.zero, <Sequence> job.sequence, &nodes[j], job.stage)
+
+    return 0
+
 cdef class TrainingInfo:
     """A collection of parameters obtained after training.
 
@@ -3729,6 +5477,7 @@ cdef class TrainingInfo:
         self.tinf = <_training*> PyMem_Malloc(sizeof(_training))
         if self.tinf == NULL:
             raise MemoryError("Failed to allocate training info")
+        _memory_record(_MEMORY_TRAINING_INFO, 0, sizeof(_training))
         # clear memory
         memset(self.tinf, 0, sizeof(_training))
         # set the variables
@@ -3737,7 +5486,8 @@ cdef class TrainingInfo:
         self.tinf.trans_table = translation_table
 
     def __dealloc__(self):
-        if self.owned:
+        if self.owned and self.tinf != NULL:
+            _memory_record(_MEMORY_TRAINING_INFO, sizeof(_training), 0)
             PyMem_Free(self.tinf)
 
     def __repr__(self):
@@ -3958,6 +5708,8 @@ cdef class TrainingInfo:
         cdef int     start
         cdef int     spacendx
         cdef _motif* mot      = &nod.mot
+        # NOTE: the hexamer index must have been built by the caller
+        cdef const uint16_t* hexamers = seq.hexamers
 
         if nod.type == node_type.STOP or nod.edge == 1:
             return
@@ -3969,6 +5721,7 @@ cdef class TrainingInfo:
             start = nod.ndx
         else:
             start = seq.slen-1-nod.ndx
+            hexamers += seq.slen
 
         # Stage 0:  Count all motifs.
         # If a motif is detected, it is counted for every distance in stage 0.
@@ -3978,7 +5731,7 @@ cdef class TrainingInfo:
                 for j in range(start - 18 - i, start - 5 - i):
                     if j < 0:
                         continue
-                    mer = _mer_ndx(seq.digits, seq.slen, j, i+3, nod.strand)
+                    mer = hexamers[j] & _MOTIF_MASKS[i]
                     for k in range(4):
                         mcnt[i][k][mer] += 1.0
         # Stage 1:  Count only the best motif, but also count all its sub-motifs.
@@ -3996,27 +5749,64 @@ cdef class TrainingInfo:
                         spacendx = 1
                     else:
                         spacendx = 0
-                    mer = _mer_ndx(seq.digits, seq.slen, j, i+3, nod.strand)
+                    mer = hexamers[j] & _MOTIF_MASKS[i]
                     mcnt[i][spacendx][mer] += 1.0
         # Stage 2:  Only count the highest scoring motif.
         elif stage == 2:
             mcnt[mot.len-3][mot.spacendx][mot.ndx] += 1.0
 
-    cdef void _calc_dicodon_gene(self, Sequence seq, _node* nodes, int ipath) nogil except *:
+    @staticmethod
+    cdef void _update_upstream_composition(double ups_comp[32][4], Sequence seq, int pos, int strand) nogil:
+        cdef int j
+        cdef int i = 0
+
+        # NOTE: This function is patched not to read out of sequence
+        #       boundaries, which can happen in the original Prodigal
+        #       code when `count_upstream_composition` is called with
+        #       a position less than 45 nucleotides away from the
+        #       edges (this can be observed with Valgrind).
+
+        if strand == 1:
+            for j in range(1, 3):
+                if pos >= j:
+                    ups_comp[i][seq.digits[pos-j] & 0b11] += 1
+                i += 1
+            for j in range(15, 45):
+                if pos >= j:
+                    ups_comp[i][seq.digits[pos-j] & 0b11] += 1
+                i += 1
+        else:
+            for j in range(1, 3):
+                if pos + j < seq.slen:
+                    ups_comp[i][_complement[seq.digits[pos+j]] & 0b11] += 1
+                i += 1
+            for j in range(15, 45):
+                if pos + j < seq.slen:
+                    ups_comp[i][_complement[seq.digits[pos+j]] & 0b11] += 1
+                i += 1
+
+    cdef void _calc_dicodon_gene(self, Sequence seq, _node* nodes, int ipath, int threads=1) nogil except *:
         """Compute the dicodon frequency in genes and in the background.
 
         Stores the log-likelihood of each 6-mer relative to the background.
+        Counts are accumulated over chunks of the sequence and of the genes
+        in up to ``threads`` threads.
 
         """
-        cdef int    i
-        cdef int    counts[4096]
-        cdef double prob[4096]
-        cdef double bg[4096]
-        cdef int    in_gene      = 0
-        cdef int    path         = ipath
-        cdef int    left         = -1
-        cdef int    right        = -1
-        cdef int    glob
+        cdef int          i
+        cdef int          c
+        cdef int          counts[4096]
+        cdef double       prob[4096]
+        cdef double       bg[4096]
+        cdef int          in_gene      = 0
+        cdef int          path         = ipath
+        cdef int          left         = -1
+        cdef int          right        = -1
+        cdef int          glob
+        cdef size_t       length       = 0
+        cdef int*         spans        = NULL
+        cdef size_t       spans_size
+        cdef _dicodon_job job
 
         self._on_modification()
 
@@ -4024,20 +5814,18 @@ cdef class TrainingInfo:
             prob[i] = 0.0
             bg[i] = 0.0
 
-        # get background counts
-        # (shortened code from `calc_mer_bg` without malloc)
-        glob = 0
-        memset(counts, 0, 4096*sizeof(int))
-        for i in range(seq.slen - 5):
-            counts[_mer_ndx(seq.digits, seq.slen, i, 6,  1)] += 1
-            counts[_mer_ndx(seq.digits, seq.slen, i, 6, -1)] += 1
-            glob += 2
-        for i in range(4096):
-            bg[i] = (<double> counts[i]) / (<double> glob)
-
-        # get counts in genes
-        glob = 0
-        memset(counts, 0, 4096*sizeof(int))
+        # get the spans of the genes along the path
+        while path != -1:
+            length += 1
+            path = nodes[path].traceb
+        spans_size = 3 * (length // 2 + 1) * sizeof(int)
+        spans = <int*> malloc(spans_size)
+        if spans == NULL:
+            with gil:
+                raise MemoryError("Failed to allocate gene spans")
+        _memory_record(_MEMORY_TRAINING_BUFFERS, 0, spans_size)
+        job.nspans = 0
+        path = ipath
         while path != -1:
             if nodes[path].strand == 1:
                 if nodes[path].type == node_type.STOP:
@@ -4045,9 +5833,10 @@ cdef class TrainingInfo:
                     right = nodes[path].ndx+2
                 elif in_gene == 1:
                     left = nodes[path].ndx
-                    for i in range(left, right-5, 3):
-                        counts[_mer_ndx(seq.digits, seq.slen, i, 6, 1)] += 1
-                        glob += 1
+                    spans[3*job.nspans]     = left
+                    spans[3*job.nspans + 1] = right
+                    spans[3*job.nspans + 2] = 0
+                    job.nspans += 1
                     in_gene = 0
             else:
                 if nodes[path].type != node_type.STOP:
@@ -4055,12 +5844,48 @@ cdef class TrainingInfo:
                     left = seq.slen - nodes[path].ndx - 1
                 elif in_gene == -1:
                     right = seq.slen - nodes[path].ndx + 1
-                    for i in range(left, right-5, 3):
-                        counts[_mer_ndx(seq.digits, seq.slen, i, 6, -1)] += 1
-                        glob += 1
+                    spans[3*job.nspans]     = left
+                    spans[3*job.nspans + 1] = right
+                    spans[3*job.nspans + 2] = seq.slen
+                    job.nspans += 1
                     in_gene = 0
             path = nodes[path].traceb
 
+        # count hexamers in the background and in the genes
+        job.hexamers = seq._hexamer_index()
+        job.slen = seq.slen
+        job.spans = spans
+        job.chunks = max(threads, 1)
+        job.counts = <_dicodon_counts*> calloc(job.chunks, sizeof(_dicodon_counts))
+        if job.counts == NULL:
+            _memory_record(_MEMORY_TRAINING_BUFFERS, spans_size, 0)
+            free(spans)
+            with gil:
+                raise MemoryError("Failed to allocate dicodon counts")
+        _memory_record(_MEMORY_TRAINING_BUFFERS, 0, job.chunks * sizeof(_dicodon_counts))
+        try:
+            _run_tasks(_dicodon_task, &job, job.chunks)
+            # get background counts
+            glob = 2 * (seq.slen - 5) if seq.slen > 5 else 0
+            memset(counts, 0, 4096*sizeof(int))
+            for c in range(job.chunks):
+                for i in range(4096):
+                    counts[i] += job.counts[c].background[i]
+            for i in range(4096):
+                bg[i] = (<double> counts[i]) / (<double> glob)
+            # get counts in genes
+            glob = 0
+            memset(counts, 0, 4096*sizeof(int))
+            for c in range(job.chunks):
+                glob += job.counts[c].total
+                for i in range(4096):
+                    counts[i] += job.counts[c].genes[i]
+        finally:
+            _memory_record(_MEMORY_TRAINING_BUFFERS, job.chunks * sizeof(_dicodon_counts), 0)
+            _memory_record(_MEMORY_TRAINING_BUFFERS, spans_size, 0)
+            free(job.counts)
+            free(spans)
+
         # compute log likelihood
         for i in range(4096):
             prob[i] = (<double> counts[i])/(<double> glob)
@@ -4075,40 +5900,40 @@ cdef class TrainingInfo:
             elif self.tinf.gene_dc[i] < -5.0:
                 self.tinf.gene_dc[i] = -5.0
 
-    cdef void _count_upstream_composition(self, Sequence seq, int pos, int strand=1) nogil except *:
-        cdef int start
-        cdef int j
-        cdef int i     = 0
+    cdef void _count_upstream_composition(self, Sequence seq, const int* starts, size_t nstarts, int threads=1) nogil except *:
+        """Count the upstream base composition of the given start nodes.
 
-        self._on_modification()
+        Start nodes are given in ``starts`` as ``(ndx, strand)`` pairs, and
+        counted over chunks in up to ``threads`` threads.
 
-        # NOTE: This function is patched not to read out of sequence
-        #       boundaries, which can happen in the original Prodigal
-        #       code when `count_upstream_composition` is called with
-        #       a position less than 45 nucleotides away from the
-        #       edges (this can be observed with Valgrind).
+        """
+        cdef int           i
+        cdef int           j
+        cdef int           c
+        cdef _upstream_job job
 
-        if strand == 1:
-            for j in range(1, 3):
-                if pos >= j:
-                    self.tinf.ups_comp[i][seq.digits[pos-j] & 0b11] += 1
-                i += 1
-            for j in range(15, 45):
-                if pos >= j:
-                    self.tinf.ups_comp[i][seq.digits[pos-j] & 0b11] += 1
-                i += 1
-        else:
-            start = seq.slen - 1 - pos
-            for j in range(1, 3):
-                if pos + j < seq.slen:
-                    self.tinf.ups_comp[i][_complement[seq.digits[pos+j]] & 0b11] += 1
-                i += 1
-            for j in range(15, 45):
-                if pos + j < seq.slen:
-                    self.tinf.ups_comp[i][_complement[seq.digits[pos+j]] & 0b11] += 1
-                i += 1
+        self._on_modification()
 
-    cdef void _train_starts_sd(self, Nodes nodes, Sequence seq) nogil except *:
+        job.sequence = <void*> seq
+        job.starts = starts
+        job.nstarts = nstarts
+        job.chunks = max(threads, 1)
+        job.counts = <_upstream_counts*> calloc(job.chunks, sizeof(_upstream_counts))
+        if job.counts == NULL:
+            with gil:
+                raise MemoryError("Failed to allocate upstream composition counts")
+        _memory_record(_MEMORY_TRAINING_BUFFERS, 0, job.chunks * sizeof(_upstream_counts))
+        try:
+            _run_tasks(_upstream_task, &job, job.chunks)
+            for c in range(job.chunks):
+                for i in range(32):
+                    for j in range(4):
+                        self.tinf.ups_comp[i][j] += job.counts[c].composition[i][j]
+        finally:
+            _memory_record(_MEMORY_TRAINING_BUFFERS, job.chunks * sizeof(_upstream_counts), 0)
+            free(job.counts)
+
+    cdef void _train_starts_sd(self, Nodes nodes, Sequence seq, int threads=1) nogil except *:
         cdef int phase
         cdef int rbs[3]
         cdef int type[3]
@@ -4122,13 +5947,34 @@ cdef class TrainingInfo:
         cdef double treal[3]
         cdef double sthresh   = 35.0
         cdef double wt        = self.tinf.st_wt
+        cdef _rbs_job job
+        cdef int*     starts
+        cdef size_t   starts_size
+        cdef size_t   nstarts = 0
 
         cdef ssize_t i
         cdef ssize_t j
+        cdef ssize_t k
         cdef ssize_t nn = nodes.length
 
         self._on_modification()
 
+        # allocate buffers for the parallel stages
+        job.nodes = nodes.nodes
+        job.length = nn
+        job.tinf = self.tinf
+        job.chunks = max(threads, 1)
+        job.counts = <double*> calloc(28 * job.chunks, sizeof(double))
+        starts_size = 2 * nn * sizeof(int) + 1
+        starts = <int*> malloc(starts_size)
+        if job.counts == NULL or starts == NULL:
+            free(job.counts)
+            free(starts)
+            with gil:
+                raise MemoryError("Failed to allocate start training buffers")
+        _memory_record(_MEMORY_TRAINING_BUFFERS, 0, 28 * job.chunks * sizeof(double))
+        _memory_record(_MEMORY_TRAINING_BUFFERS, 0, starts_size)
+
         # reset training info
         for j in range(3):
             self.tinf.type_wt[j] = 0.0
@@ -4157,20 +6003,11 @@ cdef class TrainingInfo:
         # extra to be safe)
         for i in range(10):
             # Recalculate the RBS motif background */
+            _run_tasks(_rbs_background_task, &job, job.chunks)
             for j in range(28):
                 rbg[j] = 0.0
-            for j in range(nn):
-                if nodes.nodes[j].type == node_type.STOP or nodes.nodes[j].edge:
-                    continue
-                if self.tinf.rbs_wt[nodes.nodes[j].rbs[0]] > self.tinf.rbs_wt[nodes.nodes[j].rbs[1]]+1.0 or nodes.nodes[j].rbs[1] == 0:
-                    max_rb = nodes.nodes[j].rbs[0]
-                elif self.tinf.rbs_wt[nodes.nodes[j].rbs[0]] < self.tinf.rbs_wt[nodes.nodes[j].rbs[1]]-1.0 or nodes.nodes[j].rbs[0] == 0:
-                    max_rb = nodes.nodes[j].rbs[1]
-                elif nodes.nodes[j].rbs[0] > nodes.nodes[j].rbs[1]:
-                    max_rb = nodes.nodes[j].rbs[0]
-                else:
-                    max_rb = nodes.nodes[j].rbs[1]
-                rbg[max_rb] += 1.0;
+                for k in range(job.chunks):
+                    rbg[j] += job.counts[28*k + j]
 
             sum = 0.0
             for j in range(28):
@@ -4196,7 +6033,9 @@ cdef class TrainingInfo:
                             rreal[rbs[phase]] += 1.0
                             treal[type[phase]] += 1.0
                             if i == 9:
-                                self._count_upstream_composition(seq, nodes.nodes[bndx[phase]].ndx, strand=1)
+                                starts[2*nstarts] = nodes.nodes[bndx[phase]].ndx
+                                starts[2*nstarts + 1] = 1
+                                nstarts += 1
                         best[phase] = 0.0; bndx[phase] = -1; rbs[phase] = 0; type[phase] = 0;
                     else:
                         if self.tinf.rbs_wt[nodes.nodes[j].rbs[0]] > self.tinf.rbs_wt[nodes.nodes[j].rbs[1]]+1.0 or nodes.nodes[j].rbs[1] == 0:
@@ -4229,7 +6068,9 @@ cdef class TrainingInfo:
                             rreal[rbs[phase]] += 1.0
                             treal[type[phase]] += 1.0
                             if i == 9:
-                                self._count_upstream_composition(seq, nodes.nodes[bndx[phase]].ndx, strand=-1);
+                                starts[2*nstarts] = nodes.nodes[bndx[phase]].ndx
+                                starts[2*nstarts + 1] = -1
+                                nstarts += 1
                         best[phase] = 0.0
                         bndx[phase] = -1
                         rbs[phase] = 0
@@ -4289,6 +6130,15 @@ cdef class TrainingInfo:
             if sum*2000.0 <= nodes.length:
                 sthresh /= 2.0
 
+        # Count the upstream base composition of the genes from the last pass
+        try:
+            self._count_upstream_composition(seq, starts, nstarts, threads)
+        finally:
+            _memory_record(_MEMORY_TRAINING_BUFFERS, 28 * job.chunks * sizeof(double), 0)
+            _memory_record(_MEMORY_TRAINING_BUFFERS, starts_size, 0)
+            free(job.counts)
+            free(starts)
+
         # Convert upstream base composition to a log score
         for i in range(32):
             sum = 0.0;
@@ -4320,11 +6170,12 @@ cdef class TrainingInfo:
                   if self.tinf.ups_comp[i][j] < -4.0:
                       self.tinf.ups_comp[i][j] = -4.0
 
-    cdef void _train_starts_nonsd(self, Nodes nodes, Sequence seq) nogil except *:
+    cdef void _train_starts_nonsd(self, Nodes nodes, Sequence seq, int threads=1) nogil except *:
         cdef int i
         cdef int j
         cdef int k
         cdef int l
+        cdef int c
         cdef int fr
         cdef int stage
         cdef int bndx[3]
@@ -4341,8 +6192,30 @@ cdef class TrainingInfo:
         cdef double wt                = self.tinf.st_wt
         cdef double sthresh           = 35.0;
         cdef int    nn                = nodes.length
+        cdef _motif_job job
+        cdef int*       starts
+        cdef size_t     starts_size
+        cdef size_t     nstarts       = 0
 
         self._on_modification()
+        seq._hexamer_index()
+
+        # allocate buffers for the parallel stages
+        job.nodes = nodes.nodes
+        job.length = nn
+        job.sequence = <void*> seq
+        job.tinf = self.tinf
+        job.chunks = max(threads, 1)
+        job.counts = <_motif_counts*> malloc(job.chunks * sizeof(_motif_counts))
+        starts_size = 2 * nn * sizeof(int) + 1
+        starts = <int*> malloc(starts_size)
+        if job.counts == NULL or starts == NULL:
+            free(job.counts)
+            free(starts)
+            with gil:
+                raise MemoryError("Failed to allocate start training buffers")
+        _memory_record(_MEMORY_TRAINING_BUFFERS, 0, job.chunks * sizeof(_motif_counts))
+        _memory_record(_MEMORY_TRAINING_BUFFERS, 0, starts_size)
 
         for i in range(32):
             for j in range(4):
@@ -4362,6 +6235,10 @@ cdef class TrainingInfo:
         for i in range(3):
             tbg[i] /= sum
 
+        # Clear the motif tables
+        memset(mbg, 0, sizeof(mbg))
+        memset(mreal, 0, sizeof(mreal))
+
         # Iterate 20 times through the list of nodes
         # Converge upon optimal weights for ATG vs GTG vs TTG and RBS motifs
         # (convergence typically takes 4-5 iterations, but we run a few
@@ -4375,34 +6252,36 @@ cdef class TrainingInfo:
             else:
                 stage = 2
 
-            # Recalculate the upstream motif background and set 'real' counts to 0
+            # Recalculate the upstream motif background
+            # (only the entries for existing motifs of each length need to be
+            # collected, all others are never written to)
+            job.stage = stage
+            _run_tasks(_motif_background_task, &job, job.chunks)
             for j in range(4):
                 for k in range(4):
-                    for l in range(4096):
+                    for l in range(_MOTIF_SIZES[j]):
                         mbg[j][k][l] = 0.0
+                        for c in range(job.chunks):
+                            mbg[j][k][l] += job.counts[c].counts[j][k][l]
             zbg = 0.0
-            for j in range(nn):
-                if nodes.nodes[j].type == node_type.STOP or nodes.nodes[j].edge:
-                    continue
-                Node._find_best_upstream_motif(&nodes.nodes[j], seq, self.tinf, stage)
-                TrainingInfo._update_motif_counts(mbg, &zbg, seq, &nodes.nodes[j], stage)
+            for c in range(job.chunks):
+                zbg += job.counts[c].zero
             sum = 0.0
             for j in range(4):
                 for k in range(4):
-                    for l in range(4096):
+                    for l in range(_MOTIF_SIZES[j]):
                         sum += mbg[j][k][l]
             sum += zbg
             for j in range(4):
                 for k in range(4):
-                    for l in range(4096):
+                    for l in range(_MOTIF_SIZES[j]):
                         mbg[j][k][l] /= sum
             zbg /= sum
 
             # Reset counts of 'real' motifs/types to 0
             for j in range(4):
                 for k in range(4):
-                    for l in range(4096):
-                        mreal[j][k][l] = 0.0
+                    memset(mreal[j][k], 0, _MOTIF_SIZES[j] * sizeof(double))
             zreal = 0.0
             for j in range(3):
                 treal[j] = 0.0
@@ -4423,7 +6302,9 @@ cdef class TrainingInfo:
                             treal[nodes.nodes[bndx[fr]].type] += 1.0
                             TrainingInfo._update_motif_counts(mreal, &zreal, seq, &nodes.nodes[bndx[fr]], stage)
                             if i == 19:
-                                self._count_upstream_composition(seq, nodes.nodes[bndx[fr]].ndx, strand=1)
+                                starts[2*nstarts] = nodes.nodes[bndx[fr]].ndx
+                                starts[2*nstarts + 1] = 1
+                                nstarts += 1
                         best[fr] = 0.0;
                         bndx[fr] = -1;
                     else:
@@ -4446,7 +6327,9 @@ cdef class TrainingInfo:
                             treal[nodes.nodes[bndx[fr]].type] += 1.0;
                             TrainingInfo._update_motif_counts(mreal, &zreal, seq, &nodes.nodes[bndx[fr]], stage)
                             if i == 19:
-                                self._count_upstream_composition(seq, nodes.nodes[bndx[fr]].ndx, strand=-1)
+                                starts[2*nstarts] = nodes.nodes[bndx[fr]].ndx
+                                starts[2*nstarts + 1] = -1
+                                nstarts += 1
                         best[fr] = 0.0
                         bndx[fr] = -1
                     else:
@@ -4460,7 +6343,7 @@ cdef class TrainingInfo:
             sum = 0.0
             for j in range(4):
                 for k in range(4):
-                    for l in range(4096):
+                    for l in range(_MOTIF_SIZES[j]):
                         sum += mreal[j][k][l]
             sum += zreal;
             if sum == 0.0:
@@ -4472,7 +6355,11 @@ cdef class TrainingInfo:
             else:
                 for j in range(4):
                     for k in range(4):
-                        for l in range(4096):
+                        # entries past the number of motifs are always zero
+                        # in both tables, so they always get a -4.0 weight
+                        for l in range(_MOTIF_SIZES[j], 4096):
+                            self.tinf.mot_wt[j][k][l] = -4.0
+                        for l in range(_MOTIF_SIZES[j]):
                             if mgood[j][k][l] == 0:
                                 zreal += mreal[j][k][l]
                                 zbg += mreal[j][k][l]
@@ -4516,6 +6403,15 @@ cdef class TrainingInfo:
             if sum * 2000.0 <= nn:
                 sthresh /= 2.0
 
+        # Count the upstream base composition of the genes from the last pass
+        try:
+            self._count_upstream_composition(seq, starts, nstarts, threads)
+        finally:
+            _memory_record(_MEMORY_TRAINING_BUFFERS, job.chunks * sizeof(_motif_counts), 0)
+            _memory_record(_MEMORY_TRAINING_BUFFERS, starts_size, 0)
+            free(job.counts)
+            free(starts)
+
         # Convert upstream base composition to a log score
         for i in range(32):
             sum = 0.0
@@ -4636,9 +6532,271 @@ for _i in range(NUM_META):
     PyTuple_SET_ITEM(_m, _i, _bin)
     Py_INCREF(_bin)
 METAGENOMIC_BINS = _m
+cdef frozenset _METAGENOMIC_TABLES = frozenset(
+    x.training_info.translation_table for x in METAGENOMIC_BINS
+)
 
 # --- OrfFinder --------------------------------------------------------------
 
+cdef struct _extract_job:
+    void* nodes[2]  # borrowed `Nodes` for each strand
+    void* sequence  # borrowed `Sequence`
+    int   translation_table
+    bint  closed
+    int   min_gene
+    int   min_edge_gene
+
+cdef int _extract_task(void* data, int index) nogil except -1:
+    cdef _extract_job* job = <_extract_job*> data
+    (<Nodes> job.nodes[index])._extract(
+        <Sequence> job.sequence,
+        job.translation_table,
+        closed=job.closed,
+        min_gene=job.min_gene,
+        min_edge_gene=job.min_edge_gene,
+        strand=1 if index == 0 else -1,
+    )
+    return 0
+
+cdef struct _window_job:
+    void*     finder         # borrowed `OrfFinder`
+    void*     training_info  # borrowed `TrainingInfo`
+    void**    sequences      # borrowed `Sequence` view of each window
+    void**    workspaces     # borrowed `_Workspace` of each window
+    _profile* profiles       # one profile per task, or `NULL`
+    int       count
+    int       tasks
+
+cdef int _window_task(void* data, int index) nogil except -1:
+    cdef int          i       = index
+    cdef _window_job* job     = <_window_job*> data
+    cdef _profile*    profile = NULL if job.profiles == NULL else &job.profiles[index]
+    while i < job.count:
+        (<OrfFinder> job.finder)._find_genes_single(
+            <Sequence> job.sequences[i],
+            <TrainingInfo> job.training_info,
+            (<_Workspace> job.workspaces[i]).scorer,
+            (<_Workspace> job.workspaces[i]).nodes,
+            (<_Workspace> job.workspaces[i]).genes,
+            profile,
+        )
+        i += job.tasks
+    return 0
+
+cdef struct _train_job:
+    void*     finder       # borrowed `OrfFinder`
+    void*     sequence     # borrowed `Sequence`
+    void*     candidates   # borrowed `list` of `TrainingInfo` to train
+    void*     densities    # borrowed `list` storing the coding density of each candidate
+    int*      gc_frame     # the GC frame plot of the sequence, shared by all candidates
+    _profile* profiles     # one profile per task, or `NULL`
+    bint      force_nonsd
+    int       threads
+    int       count
+    int       tasks
+
+cdef int _train_task(void* data, int index) nogil except -1:
+    cdef int         i       = index
+    cdef _train_job* job     = <_train_job*> data
+    cdef _profile*   profile = NULL if job.profiles == NULL else &job.profiles[index]
+    while i < job.count:
+        with gil:
+            (<list> job.densities)[i] = (<OrfFinder> job.finder)._train_candidate(
+                <Sequence> job.sequence,
+                <TrainingInfo> (<list> job.candidates)[i],
+                job.force_nonsd,
+                job.threads,
+                profile,
+                job.gc_frame,
+            )
+        i += job.tasks
+    return 0
+
+cdef struct _multi_job:
+    void*       finder      # borrowed `OrfFinder`
+    void*       sequence    # borrowed `Sequence`
+    void*       nodes       # borrowed `Nodes` extracted for the translation table
+    void*       results     # borrowed `list` storing the genes of each model
+    void**      workspaces  # borrowed `_Workspace` of each task
+    _training** tinfs       # borrowed training info of each model
+    double*     scores      # best path score of each model
+    int*        models      # indices of the models using the translation table
+    _profile*   profiles    # one profile per task, or `NULL`
+    int         count
+    int         tasks
+    bint        keep_nodes
+
+cdef int _multi_task(void* data, int index) nogil except -1:
+    cdef int         k
+    cdef double      t
+    cdef int         i         = index
+    cdef _multi_job* job       = <_multi_job*> data
+    cdef void*       workspace = job.workspaces[index]
+    cdef _profile*   profile   = NULL if job.profiles == NULL else &job.profiles[index]
+    # index the nodes once for all the models processed by this task
+    t = _profile_start(profile)
+    (<_Workspace> workspace).scorer._index(<Nodes> job.nodes)
+    _profile_record(profile, _STAGE_INDEX, &t)
+    while i < job.count:
+        k = job.models[i]
+        (<_Workspace> workspace).nodes._clear()
+        (<_Workspace> workspace).nodes._extend(<Nodes> job.nodes)
+        (<_Workspace> workspace).genes._clear()
+        (<OrfFinder> job.finder)._predict_genes(
+            <Sequence> job.sequence,
+            job.tinfs[k],
+            (<_Workspace> workspace).scorer,
+            (<_Workspace> workspace).nodes,
+            (<_Workspace> workspace).genes,
+            &job.scores[k],
+            profile,
+        )
+        with gil:
+            (<list> job.results)[k] = (<_Workspace> workspace)._result(job.keep_nodes)
+        i += job.tasks
+    return 0
+
+cdef inline tuple _window_gene(tuple window, int i):
+    cdef int   offset = window[0]
+    cdef Nodes nodes  = window[2]
+    cdef Genes genes  = window[3]
+    return (
+        genes.genes[i].begin + offset,
+        genes.genes[i].end + offset,
+        nodes.nodes[genes.genes[i].start_ndx].strand,
+    )
+
+def _iter_find_genes(
+    OrfFinder finder,
+    object records,
+    int threads,
+    int max_in_flight,
+    object window,
+    object overlap,
+    bint keep_nodes,
+):
+    """Find genes in a stream of records, see `OrfFinder.iter_find_genes`.
+    """
+    cdef object pool    = concurrent.futures.ThreadPoolExecutor(threads)
+    cdef object pending = collections.deque()
+    try:
+        for id_, sequence in records:
+            pending.append((
+                id_,
+                pool.submit(finder.find_genes, sequence, window, overlap, 1, keep_nodes)
+            ))
+            # only read another record once the oldest one was consumed
+            if len(pending) >= max_in_flight:
+                id_, future = pending.popleft()
+                yield id_, future.result()
+        while pending:
+            id_, future = pending.popleft()
+            yield id_, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+cdef object _running_loop():
+    """Get the event loop running in the current thread.
+    """
+    import asyncio
+    # `asyncio.get_running_loop` was only added in Python 3.7
+    if hasattr(asyncio, "get_running_loop"):
+        return asyncio.get_running_loop()
+    return asyncio.get_event_loop()
+
+class _AsyncGenesIterator(object):
+    """Find genes in a stream of sequences, see `OrfFinder.iter_find_genes_async`.
+    """
+
+    def __init__(self, finder, sequences, concurrency, kwargs):
+        self.finder = finder
+        self.concurrency = concurrency
+        self.kwargs = kwargs
+        self.pending = collections.deque()
+        if hasattr(sequences, "__aiter__"):
+            self.sequences = sequences.__aiter__()
+            self.asynchronous = True
+        else:
+            self.sequences = iter(sequences)
+            self.asynchronous = False
+        self.exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        import asyncio
+        try:
+            # only read more sequences while a slot is available
+            while not self.exhausted and len(self.pending) < self.concurrency:
+                try:
+                    if self.asynchronous:
+                        sequence = await self.sequences.__anext__()
+                    else:
+                        sequence = next(self.sequences)
+                except (StopIteration, StopAsyncIteration):
+                    self.exhausted = True
+                else:
+                    self.pending.append(asyncio.ensure_future(
+                        self.finder.find_genes_async(sequence, **self.kwargs)
+                    ))
+            if not self.pending:
+                raise StopAsyncIteration
+            return await self.pending.popleft()
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def aclose(self):
+        self.exhausted = True
+        while self.pending:
+            self.pending.popleft().cancel()
+
+cdef class _Workspace:
+    """Buffers reused across calls of an `OrfFinder` to avoid allocations.
+    """
+
+    def __init__(self, str backend="detect"):
+        self.scorer = ConnectionScorer(backend=backend)
+        self.nodes = Nodes.__new__(Nodes)
+        self.genes = Genes.__new__(Genes)
+
+    cdef size_t _size(self):
+        """Get the size of the buffers allocated by the workspace.
+        """
+        return self.scorer.__sizeof__() + self.nodes.__sizeof__() + self.genes.__sizeof__()
+
+    cdef Genes _result(self, bint keep_nodes=True):
+        """Copy the genes and nodes into exactly-sized buffers.
+
+        Unless ``keep_nodes`` is `True`, only the start and stop nodes of
+        each gene are copied.
+
+        """
+        cdef size_t i
+        cdef Genes  genes = Genes.__new__(Genes)
+
+        if self.genes.length > 0:
+            genes._allocate(self.genes.length)
+            memcpy(genes.genes, self.genes.genes, self.genes.length * sizeof(_gene))
+            genes.length = self.genes.length
+        if keep_nodes:
+            genes.nodes = self.nodes.copy()
+        else:
+            genes.keep_nodes = False
+            genes.nodes = Nodes.__new__(Nodes)
+            if genes.length > 0:
+                genes.nodes._allocate(2 * genes.length)
+                for i in range(genes.length):
+                    genes.nodes.nodes[2*i] = self.nodes.nodes[genes.genes[i].start_ndx]
+                    genes.nodes.nodes[2*i+1] = self.nodes.nodes[genes.genes[i].stop_ndx]
+                    genes.genes[i].start_ndx = 2*i
+                    genes.genes[i].stop_ndx = 2*i + 1
+                genes.nodes.length = 2 * genes.length
+        return genes
+
 cdef class OrfFinder:
     """A configurable ORF finder for genomes and metagenomes.
 
@@ -4657,6 +6815,16 @@ cdef class OrfFinder:
         min_edge_gene (`int`): The minimum edge gene length.
         max_overlap (`int`): The maximum number of nucleotides that can
             overlap between two genes on the same strand.
+        profile (`bool` or callable): Whether or not the time spent in
+            each stage of a call is recorded, or a callback receiving the
+            statistics of each call.
+        max_nodes (`int` or `None`): The maximum number of nodes that
+            can be extracted from an input sequence, or `None`.
+        max_sequence_length (`int` or `None`): The maximum length of an
+            input sequence, or `None`.
+        max_concurrency (`int` or `None`): The maximum number of
+            asynchronous calls running at the same time on an event
+            loop, or `None` for one per CPU.
 
     """
 
@@ -4665,6 +6833,12 @@ cdef class OrfFinder:
     def __cinit__(self):
         self._num_seq = 1
         self.backend = "detect"
+        self.profile = False
+        self.max_nodes = None
+        self.max_sequence_length = None
+        self.max_concurrency = None
+        self._workspaces = []
+        self._semaphores = weakref.WeakKeyDictionary()
 
     def __init__(
         self,
@@ -4677,8 +6851,12 @@ cdef class OrfFinder:
         int min_edge_gene=MIN_EDGE_GENE,
         int max_overlap=MAX_SAM_OVLP,
         str backend="detect",
+        object profile=False,
+        object max_nodes=None,
+        object max_sequence_length=None,
+        object max_concurrency=None,
     ):
-        """__init__(self, training_info=None, *, meta=False, closed=False, mask=False, min_gene=90, min_edge_gene=60, max_overlap=60, backend="detect")\n--
+        """__init__(self, training_info=None, *, meta=False, closed=False, mask=False, min_gene=90, min_edge_gene=60, max_overlap=60, backend="detect", profile=False, max_nodes=None, max_sequence_length=None, max_concurrency=None)\n--
 
         Instantiate and configure a new ORF finder.
 
@@ -4705,8 +6883,30 @@ cdef class OrfFinder:
                 lower or equal to the minimum gene length**.
             backend (`str`): The backend implementation to use for computing
                 the connection scoring pre-filter. Leave as ``"detect"`` to
-                select the fastest available implementation at runtime.
-                *Mostly useful for testing*.
+                select the fastest available implementation at runtime,
+                or ``"autotune"`` to use the implementation that was
+                measured to be the fastest on the local machine by
+                `~pyrodigal.tune`. *Mostly useful for testing*.
+            profile (`bool` or callable): Set to `True` to record the time
+                spent in each stage of `find_genes`, as well as some
+                counters (nodes extracted, connections scored or skipped,
+                metagenomic bins evaluated), and store them in the
+                `Genes.stats` attribute of the result. Pass a callable
+                instead to also receive the statistics of every
+                `find_genes` and `train` call.
+            max_nodes (`int`, optional): The maximum number of nodes that
+                can be extracted from an input sequence, as estimated
+                from the start and stop codons of the translation table
+                and the edge nodes before any allocation. In windowed
+                mode, the limit applies to each window. Leave as `None`
+                to disable the limit.
+            max_sequence_length (`int`, optional): The maximum number of
+                nucleotides of an input sequence. Leave as `None` to
+                disable the limit.
+            max_concurrency (`int`, optional): The maximum number of
+                `~OrfFinder.find_genes_async` calls running at the same
+                time on an event loop, the other calls waiting for a slot.
+                Defaults to the number of CPUs.
 
         .. versionadded:: 0.6.4
             The ``training_info`` argument.
@@ -4717,9 +6917,15 @@ cdef class OrfFinder:
         .. versionadded:: 2.0.0
             The ``backend`` argument.
 
+        .. versionadded:: 2.1.0
+            The ``"autotune"`` backend, and the ``profile``, ``max_nodes``,
+            ``max_sequence_length`` and ``max_concurrency`` arguments.
+
         """
         if meta and training_info is not None:
             raise ValueError("cannot use a training info in meta mode.")
+        if not isinstance(profile, bool) and not callable(profile):
+            raise TypeError(f"expected bool or callable for `profile`, found {type(profile).__name__}")
 
         if min_gene <= 0:
             raise ValueError("`min_gene` must be strictly positive")
@@ -4729,6 +6935,12 @@ cdef class OrfFinder:
             raise ValueError("`max_overlap` must be positive")
         elif max_overlap > min_gene:
             raise ValueError("`max_overlap` must be lower than `min_gene`")
+        if max_nodes is not None and max_nodes <= 0:
+            raise ValueError("`max_nodes` must be strictly positive")
+        if max_sequence_length is not None and max_sequence_length <= 0:
+            raise ValueError("`max_sequence_length` must be strictly positive")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("`max_concurrency` must be strictly positive")
 
         self.meta = meta
         self.closed = closed
@@ -4739,6 +6951,10 @@ cdef class OrfFinder:
         self.min_edge_gene = min_edge_gene
         self.max_overlap = max_overlap
         self.backend = backend
+        self.profile = profile
+        self.max_nodes = max_nodes
+        self.max_sequence_length = max_sequence_length
+        self.max_concurrency = max_concurrency
 
     def __repr__(self):
         cdef list template = []
@@ -4758,6 +6974,14 @@ cdef class OrfFinder:
             template.append(f"max_overlap={self.max_overlap!r}")
         if self.backend != "detect":
             template.append(f"backend={self.backend!r}")
+        if self.profile is not False:
+            template.append(f"profile={self.profile!r}")
+        if self.max_nodes is not None:
+            template.append(f"max_nodes={self.max_nodes!r}")
+        if self.max_sequence_length is not None:
+            template.append(f"max_sequence_length={self.max_sequence_length!r}")
+        if self.max_concurrency is not None:
+            template.append(f"max_concurrency={self.max_concurrency!r}")
         ty = type(self)
         return "{}.{}({})".format(ty.__module__, ty.__name__, ", ".join(template))
 
@@ -4772,6 +6996,10 @@ cdef class OrfFinder:
             "min_gene": self.min_gene,
             "min_edge_gene": self.min_edge_gene,
             "max_overlap": self.max_overlap,
+            "profile": self.profile,
+            "max_nodes": self.max_nodes,
+            "max_sequence_length": self.max_sequence_length,
+            "max_concurrency": self.max_concurrency,
             "training_info": self.training_info
         }
 
@@ -4786,55 +7014,269 @@ cdef class OrfFinder:
         self.min_gene = state["min_gene"]
         self.min_edge_gene = state["min_edge_gene"]
         self.max_overlap = state["max_overlap"]
+        self.profile = state.get("profile", False)
+        self.max_nodes = state.get("max_nodes")
+        self.max_sequence_length = state.get("max_sequence_length")
+        self.max_concurrency = state.get("max_concurrency")
         self.training_info = state["training_info"]
 
-    # --- C interface --------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # --- C interface --------------------------------------------------------
+
+    cdef _Workspace _acquire_workspace(self):
+        """Get a cleared workspace from the pool, or create a new one.
+        """
+        cdef _Workspace workspace
+        try:
+            workspace = self._workspaces.pop()
+        except IndexError:
+            workspace = _Workspace(self.backend)
+        else:
+            workspace.nodes._clear()
+            workspace.genes._clear()
+        return workspace
+
+    cdef int _release_workspace(self, _Workspace workspace) except -1:
+        """Return a workspace to the pool for use by a later call.
+
+        The workspace is dropped instead if the pool is full, or if its
+        buffers grew too large to be kept around (e.g. after a call on a
+        very long sequence).
+
+        """
+        if (
+                len(self._workspaces) < _MAX_WORKSPACES
+            and workspace._size() <= _MAX_WORKSPACE_SIZE
+        ):
+            self._workspaces.append(workspace)
+        return 0
+
+    cdef Sequence _as_sequence(self, object sequence):
+        """Get a `Sequence` for an input, without copying `Sequence` inputs.
+        """
+        cdef Sequence seq
+        cdef Masks    masks
+
+        if not isinstance(sequence, Sequence):
+            return Sequence(sequence, mask=self.mask)
+
+        # use a view of the sequence when its masks do not match the
+        # masking setting, so that the input is never modified
+        seq = sequence
+        if self.mask and seq.masks.length == 0:
+            masks = Masks.__new__(Masks)
+            Sequence._mask(seq.digits, seq.slen, masks, MASK_SIZE)
+            if masks.length > 0:
+                seq = seq._subsequence(0, seq.slen)
+                seq.masks = masks
+        elif not self.mask and seq.masks.length > 0:
+            seq = seq._subsequence(0, seq.slen)
+            seq.masks = Masks.__new__(Masks)
+        return seq
+
+    cdef int _check_length(self, object sequence) except -1:
+        """Check the length of an input sequence before it is digitized.
+        """
+        cdef size_t                   length
+        cdef const unsigned char[::1] view
+
+        if self.max_sequence_length is None:
+            return 0
+        if isinstance(sequence, Sequence):
+            length = (<Sequence> sequence).slen
+        elif isinstance(sequence, str):
+            length = PyUnicode_GET_LENGTH(sequence)
+        else:
+            view = sequence
+            length = view.shape[0]
+        if length > self.max_sequence_length:
+            raise ResourceLimitError(
+                f"sequence is longer than `max_sequence_length` "
+                f"({length} > {self.max_sequence_length})"
+            )
+        return 0
+
+    cdef int _check_limits(
+        self,
+        Sequence sequence,
+        object translation_tables,
+        object window=None,
+        object overlap=None,
+    ) except -1:
+        """Check an input sequence against the configured resource limits.
+        """
+        cdef int    table
+        cdef int    begin
+        cdef int    size
+        cdef int    step
+        cdef size_t count
+        cdef size_t estimate = 0
+
+        self._check_length(sequence)
+        if self.max_nodes is None:
+            return 0
+
+        # count the nodes of each translation table, in each regular window
+        # if the sequence is processed in windows, and keep the maximum
+        # since the nodes are extracted for one table and window at a time
+        if window is not None and sequence.slen > window:
+            size = window
+            step = window - overlap
+        else:
+            size = step = sequence.slen
+        for table in translation_tables:
+            begin = 0
+            while True:
+                with nogil:
+                    if size == sequence.slen and table == 11:
+                        count = sequence._get_estimated_nodes()
+                    else:
+                        count = Sequence._estimate_nodes(
+                            &sequence.digits[begin],
+                            min(size, sequence.slen - begin),
+                            table,
+                        )
+                if not self.closed:
+                    count += _EDGE_NODES
+                estimate = max(estimate, count)
+                if begin + size >= sequence.slen:
+                    break
+                begin += step
+
+        if estimate > self.max_nodes:
+            raise ResourceLimitError(
+                f"sequence is estimated to have more nodes than `max_nodes` "
+                f"({estimate} > {self.max_nodes})"
+            )
+        return 0
+
+    cdef int _train(
+        self,
+        Sequence sequence,
+        Nodes nodes,
+        ConnectionScorer scorer,
+        TrainingInfo tinf,
+        bint force_nonsd,
+        int threads,
+        _profile* profile = NULL,
+        int* gc_frame = NULL,
+    ) except -1:
+        cdef int          ipath
+        cdef bint         own_frame = gc_frame == NULL
+        cdef double       t
+        cdef _extract_job job
+        cdef Nodes        reverse  = Nodes.__new__(Nodes)
+
+        with nogil:
+            t = _profile_start(profile)
+            # find all the potential starts and stops, extracting each
+            # strand in its own thread if possible
+            if threads > 1:
+                job.nodes[0] = <void*> nodes
+                job.nodes[1] = <void*> reverse
+                job.sequence = <void*> sequence
+                job.translation_table = tinf.tinf.trans_table
+                job.closed = self.closed
+                job.min_gene = self.min_gene
+                job.min_edge_gene = self.min_edge_gene
+                _run_tasks(<_task_function> _extract_task, &job, 2)
+                nodes._extend(reverse)
+            else:
+                nodes._extract(
+                    sequence,
+                    tinf.tinf.trans_table,
+                    closed=self.closed,
+                    min_gene=self.min_gene,
+                    min_edge_gene=self.min_edge_gene
+                )
+            if profile != NULL:
+                profile.nodes_extracted += nodes.length
+            _profile_record(profile, _STAGE_EXTRACT, &t)
+            nodes._sort()
+            _profile_record(profile, _STAGE_SORT, &t)
+            scorer._index(nodes)
+            _profile_record(profile, _STAGE_INDEX, &t)
+            # scan all the ORFs looking for a potential GC bias in a particular
+            # codon position, in order to acquire a good initial set of genes
+            if own_frame:
+                gc_frame = sequence._max_gc_frame_plot(_WINDOW)
+            node.record_gc_bias(gc_frame, nodes.nodes, nodes.length, tinf.tinf)
+            if own_frame:
+                _memory_record(_MEMORY_GC_FRAME_PLOT, sequence.slen * sizeof(int), 0)
+                free(gc_frame)
+            _profile_record(profile, _STAGE_GC_FRAME_PLOT, &t)
+            # do an initial dynamic programming routine with just the GC frame bias
+            # used as a scoring function.
+            nodes._record_overlapping_starts(tinf.tinf, False, self.max_overlap)
+            _profile_record(profile, _STAGE_RECORD_OVERLAPPING_STARTS, &t)
+            ipath = nodes._dynamic_programming(tinf.tinf, scorer, final=False, profile=profile)
+            _profile_record(profile, _STAGE_DYNAMIC_PROGRAMMING, &t)
+            # gather dicodon statistics for the training set
+            tinf._calc_dicodon_gene(sequence, nodes.nodes, ipath, threads)
+            _profile_record(profile, _STAGE_CALC_DICODON_GENE, &t)
+            nodes._raw_coding_score(sequence, tinf.tinf)
+            _profile_record(profile, _STAGE_RAW_CODING_SCORE, &t)
+            # determine if this organism uses Shine-Dalgarno and score the node
+            nodes._rbs_score(sequence, tinf.tinf)
+            _profile_record(profile, _STAGE_RBS_SCORE, &t)
+            tinf._train_starts_sd(nodes, sequence, threads)
+            _profile_record(profile, _STAGE_TRAIN_STARTS_SD, &t)
+            if force_nonsd:
+                tinf.tinf.uses_sd = False
+            else:
+                node.determine_sd_usage(tinf.tinf)
+            if not tinf.tinf.uses_sd:
+                tinf._train_starts_nonsd(nodes, sequence, threads)
+                _profile_record(profile, _STAGE_TRAIN_STARTS_NONSD, &t)
+
+        # return 0 on success
+        return 0
 
-    cdef int _train(
+    cdef double _train_candidate(
         self,
         Sequence sequence,
-        Nodes nodes,
-        ConnectionScorer scorer,
         TrainingInfo tinf,
         bint force_nonsd,
-    ) nogil except -1:
-        cdef int* gc_frame
-        cdef int  ipath
-        # find all the potential starts and stops
-        nodes._extract(
-            sequence,
-            tinf.tinf.trans_table,
-            closed=self.closed,
-            min_gene=self.min_gene,
-            min_edge_gene=self.min_edge_gene
-        )
-        nodes._sort()
-        scorer._index(nodes)
-        # scan all the ORFs looking for a potential GC bias in a particular
-        # codon position, in order to acquire a good initial set of genes
-        gc_frame = sequence._max_gc_frame_plot(_WINDOW)
-        if not gc_frame:
-            raise MemoryError()
-        node.record_gc_bias(gc_frame, nodes.nodes, nodes.length, tinf.tinf)
-        free(gc_frame)
-        # do an initial dynamic programming routine with just the GC frame bias
-        # used as a scoring function.
-        nodes._record_overlapping_starts(tinf.tinf, False, self.max_overlap)
-        ipath = nodes._dynamic_programming(tinf.tinf, scorer, final=False)
-        # gather dicodon statistics for the training set
-        tinf._calc_dicodon_gene(sequence, nodes.nodes, ipath)
-        nodes._raw_coding_score(sequence, tinf.tinf)
-        # determine if this organism uses Shine-Dalgarno and score the node
-        nodes._rbs_score(sequence, tinf.tinf)
-        tinf._train_starts_sd(nodes, sequence)
-        if force_nonsd:
-            tinf.tinf.uses_sd = False
-        else:
-            node.determine_sd_usage(tinf.tinf)
-        if not tinf.tinf.uses_sd:
-            tinf._train_starts_nonsd(nodes, sequence)
-        # return 0 on success
-        return 0
+        int threads,
+        _profile* profile = NULL,
+        int* gc_frame = NULL,
+    ) except -1:
+        """Train ``tinf`` on ``sequence`` and get the resulting coding density.
+        """
+        cdef size_t     i
+        cdef long       coding    = 0
+        cdef _Workspace workspace = self._acquire_workspace()
+        try:
+            self._train(
+                sequence,
+                workspace.nodes,
+                workspace.scorer,
+                tinf,
+                force_nonsd,
+                threads,
+                profile,
+                gc_frame,
+            )
+            with nogil:
+                workspace.nodes._clear()
+                self._find_genes_single(
+                    sequence,
+                    tinf,
+                    workspace.scorer,
+                    workspace.nodes,
+                    workspace.genes,
+                    profile,
+                )
+                for i in range(workspace.genes.length):
+                    coding += workspace.genes.genes[i].end - workspace.genes.genes[i].begin + 1
+        finally:
+            self._release_workspace(workspace)
+        return <double> coding / sequence.slen
 
     cdef int _find_genes_single(
         self,
@@ -4843,8 +7285,10 @@ cdef class OrfFinder:
         ConnectionScorer scorer,
         Nodes nodes,
         Genes genes,
+        _profile* profile = NULL,
     ) nogil except -1:
-        cdef int ipath
+        cdef int    ipath
+        cdef double t     = _profile_start(profile)
         # find all the potential starts and stops, and sort them
         nodes._extract(
             sequence,
@@ -4853,20 +7297,54 @@ cdef class OrfFinder:
             min_gene=self.min_gene,
             min_edge_gene=self.min_edge_gene
         )
+        if profile != NULL:
+            profile.nodes_extracted += nodes.length
+        _profile_record(profile, _STAGE_EXTRACT, &t)
         nodes._sort()
+        _profile_record(profile, _STAGE_SORT, &t)
         scorer._index(nodes)
+        _profile_record(profile, _STAGE_INDEX, &t)
+        # predict genes from the indexed nodes
+        return self._predict_genes(sequence, tinf.tinf, scorer, nodes, genes, NULL, profile)
+
+    cdef int _predict_genes(
+        self,
+        Sequence sequence,
+        _training* tinf,
+        ConnectionScorer scorer,
+        Nodes nodes,
+        Genes genes,
+        double* score = NULL,
+        _profile* profile = NULL,
+    ) nogil except -1:
+        """Score sorted and indexed nodes, and extract the best gene path.
+
+        If ``score`` is not `NULL`, it receives the total score of the
+        best path found by the dynamic programming.
+
+        """
+        cdef int    ipath
+        cdef double t     = _profile_start(profile)
         # second dynamic programming, using the dicodon statistics as the
         # scoring function
         nodes._reset_scores()
-        nodes._score(sequence, tinf.tinf, closed=self.closed, is_meta=False)
-        nodes._record_overlapping_starts(tinf.tinf, True, self.max_overlap)
-        ipath = nodes._dynamic_programming(tinf.tinf, scorer, final=True)
+        nodes._score(sequence, tinf, closed=self.closed, is_meta=False)
+        _profile_record(profile, _STAGE_SCORE, &t)
+        nodes._record_overlapping_starts(tinf, True, self.max_overlap)
+        _profile_record(profile, _STAGE_RECORD_OVERLAPPING_STARTS, &t)
+        ipath = nodes._dynamic_programming(tinf, scorer, final=True, profile=profile)
+        _profile_record(profile, _STAGE_DYNAMIC_PROGRAMMING, &t)
+        if score != NULL:
+            score[0] = nodes.nodes[ipath].score if ipath >= 0 else 0.0
         # eliminate eventual bad genes in the nodes
         if nodes.length > 0:
-            dprog.eliminate_bad_genes(nodes.nodes, ipath, tinf.tinf)
+            dprog.eliminate_bad_genes(nodes.nodes, ipath, tinf)
+            _profile_record(profile, _STAGE_ELIMINATE_BAD_GENES, &t)
         # record genes
         genes._extract(nodes, ipath)
-        genes._tweak_final_starts(nodes, tinf.tinf, self.max_overlap)
+        _profile_record(profile, _STAGE_EXTRACT_GENES, &t)
+        genes._tweak_final_starts(nodes, tinf, self.max_overlap)
+        _profile_record(profile, _STAGE_TWEAK_FINAL_STARTS, &t)
         # NOTE: In the original Prodigal code, the gene data would be
         #       recorded here, but since we build the gene data string
         #       on request we don't have to pre-build them here.
@@ -4878,11 +7356,14 @@ cdef class OrfFinder:
         ConnectionScorer scorer,
         Nodes nodes,
         Genes genes,
+        _profile* profile = NULL,
     ) nogil except -1:
         cdef int          i
         cdef double       low
         cdef double       high
         cdef int          ipath
+        cdef double       t
+        cdef double       t_bin
         cdef _training*   tinf
         cdef int          tt        = -1
         cdef int          max_phase = 0
@@ -4900,6 +7381,7 @@ cdef class OrfFinder:
                 continue
             # record the training information for the current bin
             tinf = _METAGENOMIC_BINS[i].tinf
+            t = t_bin = _profile_start(profile)
             # recreate the node list if the translation table changed
             if tinf.trans_table != tt:
                 tt = tinf.trans_table
@@ -4911,13 +7393,21 @@ cdef class OrfFinder:
                     min_gene=self.min_gene,
                     min_edge_gene=self.min_edge_gene
                 )
+                if profile != NULL:
+                    profile.nodes_extracted += nodes.length
+                _profile_record(profile, _STAGE_EXTRACT, &t)
                 nodes._sort()
+                _profile_record(profile, _STAGE_SORT, &t)
                 scorer._index(nodes)
+                _profile_record(profile, _STAGE_INDEX, &t)
             # compute the score for the current bin
             nodes._reset_scores()
             nodes._score(sequence, tinf, closed=self.closed, is_meta=True)
+            _profile_record(profile, _STAGE_SCORE, &t)
             nodes._record_overlapping_starts(tinf, True, self.max_overlap)
-            ipath = nodes._dynamic_programming(tinf, scorer, final=True)
+            _profile_record(profile, _STAGE_RECORD_OVERLAPPING_STARTS, &t)
+            ipath = nodes._dynamic_programming(tinf, scorer, final=True, profile=profile)
+            _profile_record(profile, _STAGE_DYNAMIC_PROGRAMMING, &t)
             # update genes if the current bin had a better score
             if nodes.length > 0 and ipath >= 0 and nodes.nodes[ipath].score > max_score:
                 # record best phase and score
@@ -4925,17 +7415,25 @@ cdef class OrfFinder:
                 max_score = nodes.nodes[ipath].score
                 # eliminate eventual bad genes in the nodes
                 dprog.eliminate_bad_genes(nodes.nodes, ipath, tinf)
+                _profile_record(profile, _STAGE_ELIMINATE_BAD_GENES, &t)
                 # clear the gene array
                 genes._clear()
                 # extract the genes from the dynamic programming array
                 genes._extract(nodes, ipath)
+                _profile_record(profile, _STAGE_EXTRACT_GENES, &t)
                 genes._tweak_final_starts(nodes, tinf, self.max_overlap)
+                _profile_record(profile, _STAGE_TWEAK_FINAL_STARTS, &t)
                 # NOTE: In the original Prodigal code, the gene data would be
                 #       recorded here, but since we build the gene data string
                 #       on request we don't have to pre-build them here.
+            # record the total time spent on the current bin
+            if profile != NULL:
+                profile.bin_times[i] += t - t_bin
+                profile.bin_calls[i] += 1
 
         # recover the nodes corresponding to the best run
         tinf = _METAGENOMIC_BINS[max_phase].tinf
+        t = _profile_start(profile)
         nodes._clear()
         nodes._extract(
             sequence,
@@ -4944,19 +7442,349 @@ cdef class OrfFinder:
             min_gene=self.min_gene,
             min_edge_gene=self.min_edge_gene
         )
+        if profile != NULL:
+            profile.nodes_extracted += nodes.length
+        _profile_record(profile, _STAGE_EXTRACT, &t)
         nodes._sort()
+        _profile_record(profile, _STAGE_SORT, &t)
         # rescore nodes
         scorer._index(nodes)
+        _profile_record(profile, _STAGE_INDEX, &t)
         nodes._reset_scores()
         nodes._score(sequence, tinf, closed=self.closed, is_meta=True)
+        _profile_record(profile, _STAGE_SCORE, &t)
 
         # return the max phase on success
         return max_phase
 
+    cdef list _find_genes_windows(
+        self,
+        Sequence sequence,
+        TrainingInfo tinf,
+        list bounds,
+        int threads,
+        _profile* profile = NULL,
+    ):
+        """Find genes in several windows of ``sequence`` in parallel.
+
+        Returns:
+            `list` of `tuple`: The bounds, nodes, genes and workspace of
+            each window, in the same order as ``bounds``. The workspaces
+            must be released once the window is not needed anymore.
+
+        """
+        cdef size_t      i
+        cdef int         begin
+        cdef int         end
+        cdef _Workspace  workspace
+        cdef _window_job job
+        cdef list        views   = []
+        cdef list        windows = []
+
+        # prepare the sequence view and the buffers of every window, so
+        # that the tasks do not need the GIL
+        for begin, end in bounds:
+            workspace = self._acquire_workspace()
+            views.append(sequence._subsequence(begin, end))
+            windows.append((begin, end, workspace.nodes, workspace.genes, workspace))
+
+        job.finder = <void*> self
+        job.training_info = <void*> tinf
+        job.count = len(windows)
+        job.tasks = min(threads, job.count)
+        job.sequences = <void**> PyMem_Malloc(job.count * sizeof(void*))
+        job.workspaces = <void**> PyMem_Malloc(job.count * sizeof(void*))
+        job.profiles = NULL
+        try:
+            if job.sequences == NULL or job.workspaces == NULL:
+                raise MemoryError("Failed to allocate window buffers")
+            for i in range(<size_t> job.count):
+                job.sequences[i] = <void*> views[i]
+                job.workspaces[i] = <void*> windows[i][4]
+            if profile != NULL:
+                job.profiles = <_profile*> PyMem_Malloc(job.tasks * sizeof(_profile))
+                if job.profiles == NULL:
+                    raise MemoryError("Failed to allocate window profiles")
+                memset(job.profiles, 0, job.tasks * sizeof(_profile))
+            with nogil:
+                _run_tasks(<_task_function> _window_task, &job, job.tasks)
+            if profile != NULL:
+                for i in range(<size_t> job.tasks):
+                    _profile_merge(profile, &job.profiles[i])
+        except:
+            for i in range(<size_t> len(windows)):
+                self._release_workspace(windows[i][4])
+            raise
+        finally:
+            PyMem_Free(job.sequences)
+            PyMem_Free(job.workspaces)
+            PyMem_Free(job.profiles)
+
+        return windows
+
+    cdef tuple _stitch_windows(
+        self,
+        Sequence sequence,
+        TrainingInfo tinf,
+        tuple left,
+        tuple right,
+        int first,
+    ):
+        """Find where the genes of two consecutive windows can be stitched.
+
+        Windows are stitched on a gene found in both windows inside of
+        their overlap, provided the genes on either side of it agree as
+        well, and that no ORF spans from the stitch point to the bounds
+        of the windows. Genes closer to the middle of the overlap are
+        tried first.
+
+        Returns:
+            `tuple`: The stitch position, and the index of the stitch gene
+            in the left and in the right window, or `None` when the
+            windows cannot be stitched.
+
+        """
+        cdef int   a
+        cdef int   b
+        cdef int   cut
+        cdef tuple key
+        cdef int   lbegin     = left[0]
+        cdef int   lend       = left[1]
+        cdef int   rbegin     = right[0]
+        cdef Genes lgenes     = left[3]
+        cdef Genes rgenes     = right[3]
+        cdef int   middle     = (rbegin + lend) // 2
+        cdef int   tt         = tinf.tinf.trans_table
+        cdef dict  index      = {}
+        cdef list  candidates = []
+
+        # index the genes of the right window inside the overlap
+        for b in range(1, <int> rgenes.length - 1):
+            key = _window_gene(right, b)
+            if key[0] > rbegin and key[1] <= lend:
+                index[key] = b
+        # find the genes of the left window agreeing with the right window
+        for a in range(first + 1, <int> lgenes.length - 1):
+            key = _window_gene(left, a)
+            b = index.get(key, -1)
+            if b == -1:
+                continue
+            if _window_gene(left, a - 1) != _window_gene(right, b - 1):
+                continue
+            if _window_gene(left, a + 1) != _window_gene(right, b + 1):
+                continue
+            candidates.append((abs(key[0] - middle), a, b))
+        # stitch on the first gene not depending on the window bounds
+        for _, a, b in sorted(candidates):
+            cut = lgenes.genes[a].begin + lbegin - 1
+            if (
+                    sequence._has_stops(rbegin + _WINDOW_MARGIN, cut, tt)
+                and sequence._has_stops(cut, lend - _WINDOW_MARGIN, tt)
+            ):
+                return cut, a, b
+        return None
+
+    cdef int _emit_window(
+        self,
+        tuple window,
+        int begin,
+        int end,
+        size_t first,
+        size_t last,
+        Nodes nodes,
+        Genes genes,
+        Nodes gene_nodes,
+    ) except -1:
+        """Copy the results of a window between two stitch points.
+
+        The nodes of the window located in ``[begin, end)`` are added to
+        ``nodes``, and the genes from index ``first`` to ``last`` are
+        added to ``genes``. The start and stop nodes of each gene are
+        added to ``gene_nodes``, since they may not have been copied to
+        ``nodes`` yet.
+
+        """
+        cdef size_t  i
+        cdef int     j
+        cdef ssize_t lo
+        cdef ssize_t hi
+        cdef _gene*  gene
+        cdef _node*  node
+        cdef int     offset = window[0]
+        cdef Nodes   wnodes = window[2]
+        cdef Genes   wgenes = window[3]
+
+        # copy the nodes between the stitch positions
+        if nodes is not gene_nodes:
+            lo = wnodes._lower_bound(begin - offset)
+            hi = wnodes._lower_bound(end - offset)
+            if nodes.length + hi - lo > nodes.capacity:
+                nodes._allocate(new_capacity(nodes.length + hi - lo))
+            memcpy(&nodes.nodes[nodes.length], &wnodes.nodes[lo], (hi - lo) * sizeof(_node))
+            for i in range(nodes.length, nodes.length + hi - lo):
+                nodes.nodes[i].ndx += offset
+                nodes.nodes[i].stop_val += offset
+            nodes.length += hi - lo
+
+        # copy the genes between the stitch genes, with their nodes
+        if gene_nodes.length + 2 * (last - first) > gene_nodes.capacity:
+            gene_nodes._allocate(new_capacity(gene_nodes.length + 2 * (last - first)))
+        for i in range(first, last):
+            gene = &wgenes.genes[i]
+            genes._add_gene(
+                gene.begin + offset,
+                gene.end + offset,
+                gene_nodes.length,
+                gene_nodes.length + 1,
+            )
+            for j in (gene.start_ndx, gene.stop_ndx):
+                node = &gene_nodes.nodes[gene_nodes.length]
+                node[0] = wnodes.nodes[j]
+                node.ndx += offset
+                node.stop_val += offset
+                gene_nodes.length += 1
+
+        return 0
+
+    cdef int _find_genes_windowed(
+        self,
+        Sequence sequence,
+        TrainingInfo tinf,
+        Nodes nodes,
+        Genes genes,
+        int window,
+        int overlap,
+        int threads,
+        bint keep_nodes = True,
+        _profile* profile = NULL,
+    ) except -1:
+        cdef size_t  i
+        cdef _gene*  gene
+        cdef _node*  node
+        cdef tuple   stitch
+        cdef tuple   right
+        cdef tuple   record
+        cdef list    batch
+        cdef tuple   left       = None
+        cdef dict    ready      = {}
+        cdef list    history    = []
+        cdef Nodes   gene_nodes = Nodes.__new__(Nodes) if keep_nodes else nodes
+        cdef int     step       = window - overlap
+        cdef int     count      = 1 + (sequence.slen - window + step - 1) // step
+        cdef int     cut        = 0
+        cdef size_t  first      = 0
+        cdef int     r          = 1
+        cdef int     prefetch   = 2
+        cdef tuple   lbounds    = (0, window)
+        cdef tuple   rbounds    = (step, min(step + window, sequence.slen))
+
+        # windows are stitched in order: the left window is stitched to
+        # the right window, whose end is the end of the `r`-th regular
+        # window, and the results of the left window are copied up to the
+        # stitch point before the right window becomes the left window.
+        # Windows that do not agree are recomputed with a larger overlap,
+        # or merged, in which case the last copied window is recomputed
+        # and stitched to the merged window again.
+        while True:
+            # compute the windows needed to make progress, and prefetch the
+            # next regular windows with the idle threads, keeping at most
+            # about `threads` windows in memory
+            batch = []
+            if left is None and lbounds not in ready:
+                batch.append(lbounds)
+            if rbounds is not None and rbounds not in ready:
+                batch.append(rbounds)
+            if batch:
+                while len(batch) + len(ready) < threads and prefetch < count:
+                    batch.append((prefetch * step, min(prefetch * step + window, sequence.slen)))
+                    prefetch += 1
+                for right in self._find_genes_windows(sequence, tinf, batch, threads, profile):
+                    ready[right[0], right[1]] = right
+            if left is None:
+                left = ready.pop(lbounds)
+
+            # copy the remaining results of the last window
+            if rbounds is None:
+                self._emit_window(left, cut, sequence.slen, first, (<Genes> left[3]).length, nodes, genes, gene_nodes)
+                self._release_workspace(left[4])
+                break
+
+            # stitch the left and right windows if possible, and move to
+            # the next regular window
+            right = ready.pop(rbounds)
+            stitch = self._stitch_windows(sequence, tinf, left, right, first)
+            if stitch is not None:
+                history.append((lbounds, cut, first, nodes.length, genes.length, gene_nodes.length))
+                self._emit_window(left, cut, stitch[0], first, stitch[1], nodes, genes, gene_nodes)
+                self._release_workspace(left[4])
+                left, lbounds, cut, first = right, rbounds, stitch[0], stitch[2]
+                r += 1
+                prefetch = max(prefetch, r + 1)
+                rbounds = (r * step, min(r * step + window, sequence.slen)) if r < count else None
+                continue
+
+            # double the overlap of the windows if they do not agree
+            self._release_workspace(right[4])
+            if 2 * rbounds[0] - lbounds[1] > lbounds[0]:
+                rbounds = (2 * rbounds[0] - lbounds[1], rbounds[1])
+                continue
+
+            # merge the windows when the overlap cannot grow anymore, and
+            # stitch the merged window to the previous window again
+            self._release_workspace(left[4])
+            left = None
+            if history:
+                rbounds = (lbounds[0], rbounds[1])
+                lbounds, cut, first, nodes.length, genes.length, gene_nodes.length = history.pop()
+            else:
+                lbounds = (lbounds[0], rbounds[1])
+                r += 1
+                prefetch = max(prefetch, r + 1)
+                rbounds = (r * step, min(r * step + window, sequence.slen)) if r < count else None
+
+        # find the start and stop nodes of each gene among the copied nodes
+        if keep_nodes:
+            for i in range(genes.length):
+                gene = &genes.genes[i]
+                node = &gene_nodes.nodes[gene.start_ndx]
+                gene.start_ndx = nodes._search(node.ndx, node.strand, node.type)
+                node = &gene_nodes.nodes[gene.stop_ndx]
+                gene.stop_ndx = nodes._search(node.ndx, node.strand, node.type)
+                if gene.start_ndx == -1 or gene.stop_ndx == -1:
+                    raise RuntimeError("Failed to stitch genes from consecutive windows")
+
+        return 0
+
     # --- Python interface ---------------------------------------------------
 
-    cpdef Genes find_genes(self, object sequence):
-        """find_genes(self, sequence)\n--
+    def close(self):
+        """close(self)\n--
+
+        Release the buffers kept by the ORF finder between calls.
+
+        ORF finders can also be used as context managers, in which case
+        the buffers are released when leaving the context. The ORF finder
+        stays usable after being closed, but the next call will have to
+        allocate its buffers again.
+
+        Example:
+            >>> with pyrodigal.OrfFinder(meta=True) as orf_finder:
+            ...     genes = orf_finder.find_genes("ATG" * 100)
+
+        .. versionadded:: 2.1.0
+
+        """
+        del self._workspaces[:]
+
+    cpdef Genes find_genes(
+        self,
+        object sequence,
+        object window=None,
+        object overlap=None,
+        int threads=1,
+        bint keep_nodes=True,
+    ):
+        """find_genes(self, sequence, window=None, overlap=None, threads=1, keep_nodes=True)\n--
 
         Find all the genes in the input DNA sequence.
 
@@ -4965,6 +7793,23 @@ cdef class OrfFinder:
                 either as a string of nucleotides, or as an object
                 implementing the buffer protocol. Letters not corresponding
                 to an usual nucleotide (not any of "ATGC") will be ignored.
+            window (`int`, optional): The size of the windows to split
+                the sequence into, or `None` to process the whole sequence
+                at once. Genes are found independently in each window,
+                and the predictions of consecutive windows are stitched
+                inside their overlap where they agree. Windows that do
+                not agree are merged into a wider window and processed
+                again. Only supported in *single* mode.
+            overlap (`int`, optional): The size of the overlap between
+                consecutive windows, at most half of ``window``. Defaults
+                to a tenth of ``window``.
+            threads (`int`, optional): The number of threads to use to
+                process the windows in parallel. Pass *0* to use as many
+                threads as there are CPUs.
+            keep_nodes (`bool`, optional): Set to `False` to only keep
+                the start and stop nodes of each gene in the result. This
+                greatly reduces the memory used by the returned `Genes`,
+                but prevents using `Genes.write_scores`.
 
         Returns:
             `~pyrodigal.Genes`: A list of all the genes found in the input.
@@ -4972,75 +7817,558 @@ cdef class OrfFinder:
         Raises:
             `MemoryError`: When allocation of an internal buffers fails.
             `RuntimeError`: On calling this method without having called
-                `~Pyrodigal.train` before while in *single* mode.
+                `~Pyrodigal.train` before while in *single* mode, or when
+                using ``window`` in *metagenomic* mode.
             `TypeError`: When ``sequence`` does not implement the buffer
                 protocol.
+            `ValueError`: When ``window``, ``overlap`` or ``threads`` have
+                invalid values.
+            `~pyrodigal.ResourceLimitError`: When ``sequence`` exceeds
+                the ``max_nodes`` or ``max_sequence_length`` limits.
+
+        Note:
+            When ``window`` is given, the dynamic programming scores of
+            the nodes (`Node.score`) are relative to the window they were
+            computed in, and the stage timings reported in `Genes.stats`
+            are summed over all windows.
+
+        Note:
+            The scoring indices built for the input sequence are released
+            when the call returns, so that they are not kept alive by the
+            returned `Genes`. `Sequence` inputs are the exception: their
+            indices are kept, so that they can be shared by concurrent
+            and later calls on the same `Sequence`, and are only
+            released with the `Sequence` itself.
+
+        .. versionadded:: 2.1.0
+            The ``window``, ``overlap``, ``threads`` and ``keep_nodes``
+            arguments.
 
         """
-        cdef int              n
-        cdef int              phase
-        cdef Sequence         seq
-        cdef TrainingInfo     tinf
-        cdef ConnectionScorer scorer = ConnectionScorer(backend=self.backend)
-        cdef Genes            genes  = Genes.__new__(Genes)
-        cdef Nodes            nodes  = Nodes.__new__(Nodes)
+        cdef int          phase
+        cdef Sequence     seq
+        cdef TrainingInfo tinf
+        cdef Genes        genes
+        cdef _Workspace   workspace
+        cdef _profile     stats
+        cdef _profile*    profile   = NULL
+        cdef double       t         = 0.0
+
+        # start profiling if requested
+        if self.profile:
+            memset(&stats, 0, sizeof(_profile))
+            profile = &stats
+            t = _monotonic()
 
         # check argument values
         if not self.meta and self.training_info is None:
             raise RuntimeError("cannot find genes without having trained in single mode")
+        if window is not None:
+            if self.meta:
+                raise RuntimeError("cannot find genes in windows in metagenomic mode")
+            if window <= 0:
+                raise ValueError("`window` must be strictly positive")
+            if overlap is None:
+                overlap = window // 10
+            if overlap <= 0 or overlap > window // 2:
+                raise ValueError("`overlap` must be strictly positive and at most half of `window`")
+        if threads == 0:
+            threads = os.cpu_count() or 1
+        elif threads < 0:
+            raise ValueError("`threads` must be positive or null")
 
         # convert the input to a `Sequence` object
-        seq = Sequence(sequence, mask=self.mask)
-
-        # extract the current sequence index
-        with self.lock:
-            genes._num_seq = self._num_seq
-            self._num_seq += 1
-
-        # find genes with the right mode
+        self._check_length(sequence)
+        seq = self._as_sequence(sequence)
         if self.meta:
-            with nogil:
-                phase = self._find_genes_meta(seq, scorer, nodes, genes)
-            tinf = METAGENOMIC_BINS[phase].training_info
+            self._check_limits(seq, _METAGENOMIC_TABLES)
         else:
-            tinf = self.training_info
-            with nogil:
-                self._find_genes_single(
+            self._check_limits(seq, (self.training_info.translation_table,), window, overlap)
+
+        # find genes with the right mode, reusing the buffers of a
+        # previous call if possible
+        workspace = self._acquire_workspace()
+        try:
+            if self.meta:
+                with nogil:
+                    phase = self._find_genes_meta(
+                        seq,
+                        workspace.scorer,
+                        workspace.nodes,
+                        workspace.genes,
+                        profile,
+                    )
+                tinf = METAGENOMIC_BINS[phase].training_info
+            elif window is not None and seq.slen > window:
+                tinf = self.training_info
+                self._find_genes_windowed(
                     seq,
                     tinf,
-                    scorer,
-                    nodes,
-                    genes,
+                    workspace.nodes,
+                    workspace.genes,
+                    window,
+                    overlap,
+                    threads,
+                    keep_nodes,
+                    profile,
                 )
+            else:
+                tinf = self.training_info
+                with nogil:
+                    self._find_genes_single(
+                        seq,
+                        tinf,
+                        workspace.scorer,
+                        workspace.nodes,
+                        workspace.genes,
+                        profile,
+                    )
+            genes = workspace._result(keep_nodes)
+        finally:
+            self._release_workspace(workspace)
+
+        # release the sequence indices, only needed to score the nodes,
+        # unless the sequence is owned by the caller
+        if seq is not sequence:
+            seq._release_indices()
+
+        # extract the current sequence index
+        with self.lock:
+            genes._num_seq = self._num_seq
+            self._num_seq += 1
 
         # return the predicted genes
         genes.sequence = seq
-        genes.nodes = nodes
         genes.training_info = tinf
         genes.meta = self.meta
+
+        # report profiling statistics
+        if profile != NULL:
+            genes.stats = _profile_dict(profile, "find_genes", _monotonic() - t)
+            if callable(self.profile):
+                self.profile(genes.stats)
+
         return genes
 
+    def find_genes_multi(
+        self,
+        object sequence,
+        object training_infos,
+        int threads=1,
+        bint keep_nodes=True,
+    ):
+        """find_genes_multi(self, sequence, training_infos, threads=1, keep_nodes=True)\n--
+
+        Find genes in the input DNA sequence with several gene models.
+
+        The sequence is converted only once, and the nodes are extracted
+        and sorted only once for each distinct translation table among
+        ``training_infos``, which makes comparing many models on the same
+        sequence much cheaper than calling `~OrfFinder.find_genes` with
+        each of them.
+
+        Arguments:
+            sequence (`str` or buffer): The nucleotide sequence to use,
+                as accepted by `~OrfFinder.find_genes`.
+            training_infos (iterable of `~pyrodigal.TrainingInfo`): The
+                gene models to find genes with, used like the training
+                info of an ORF finder in *single* mode.
+            threads (`int`, optional): The number of threads to use to
+                run the models sharing a translation table in parallel.
+                Pass *0* to use as many threads as there are CPUs.
+            keep_nodes (`bool`, optional): Passed to
+                `~OrfFinder.find_genes`.
+
+        Returns:
+            `list` of `tuple`: A list with, for each model of
+            ``training_infos`` in order, a `~pyrodigal.Genes` with the
+            genes found with this model and the `float` total score of
+            the gene path found by the dynamic programming.
+
+        Raises:
+            `MemoryError`: When allocation of an internal buffers fails.
+            `TypeError`: When ``sequence`` does not implement the buffer
+                protocol, or when ``training_infos`` contains an object
+                that is not a `~pyrodigal.TrainingInfo`.
+            `ValueError`: When ``threads`` is negative.
+            `~pyrodigal.ResourceLimitError`: When ``sequence`` exceeds
+                the ``max_nodes`` or ``max_sequence_length`` limits.
+
+        Example:
+            >>> orf_finder = pyrodigal.OrfFinder(meta=True)
+            >>> models = [b.training_info for b in pyrodigal.METAGENOMIC_BINS[:3]]
+            >>> results = orf_finder.find_genes_multi("ATG" * 100, models)
+            >>> len(results)
+            3
+            >>> genes, score = max(results, key=lambda r: r[1])
+
+        .. versionadded:: 2.1.0
+
+        """
+        cdef int          j
+        cdef int          k
+        cdef size_t       num_seq
+        cdef Sequence     seq
+        cdef TrainingInfo tinf
+        cdef Nodes        nodes
+        cdef Genes        genes
+        cdef list         indices
+        cdef _Workspace   workspace
+        cdef _multi_job   job
+        cdef _profile     stats
+        cdef double       t_stage
+        cdef list         scores
+        cdef dict         stats_dict = None
+        cdef _profile*    profile    = NULL
+        cdef double       t          = 0.0
+        cdef list         models     = list(training_infos)
+        cdef list         results    = [None] * len(models)
+        cdef list         workspaces = []
+        cdef dict         groups     = {}
+
+        # start profiling if requested
+        if self.profile:
+            memset(&stats, 0, sizeof(_profile))
+            profile = &stats
+            t = _monotonic()
+
+        # check argument values
+        for j, tinf in enumerate(models):
+            if tinf is None:
+                raise TypeError("expected TrainingInfo, found None")
+            groups.setdefault(tinf.tinf.trans_table, []).append(j)
+        if threads == 0:
+            threads = os.cpu_count() or 1
+        elif threads < 0:
+            raise ValueError("`threads` must be positive or null")
+
+        # convert the input to a `Sequence` object
+        self._check_length(sequence)
+        seq = self._as_sequence(sequence)
+        self._check_limits(seq, groups)
+
+        memset(&job, 0, sizeof(_multi_job))
+        job.finder = <void*> self
+        job.sequence = <void*> seq
+        job.results = <void*> results
+        job.keep_nodes = keep_nodes
+        try:
+            # allocate buffers shared by all translation tables
+            job.tasks = min(threads, max([len(x) for x in groups.values()], default=1))
+            job.workspaces = <void**> PyMem_Malloc(job.tasks * sizeof(void*))
+            job.tinfs = <_training**> PyMem_Malloc(len(models) * sizeof(_training*) + 1)
+            job.scores = <double*> PyMem_Malloc(len(models) * sizeof(double) + 1)
+            job.models = <int*> PyMem_Malloc(len(models) * sizeof(int) + 1)
+            if job.workspaces == NULL or job.tinfs == NULL or job.scores == NULL or job.models == NULL:
+                raise MemoryError("Failed to allocate model buffers")
+            if profile != NULL:
+                job.profiles = <_profile*> PyMem_Malloc(job.tasks * sizeof(_profile))
+                if job.profiles == NULL:
+                    raise MemoryError("Failed to allocate model profiles")
+                memset(job.profiles, 0, job.tasks * sizeof(_profile))
+            for j, tinf in enumerate(models):
+                job.tinfs[j] = tinf.tinf
+            for j in range(job.tasks):
+                workspaces.append(self._acquire_workspace())
+                job.workspaces[j] = <void*> workspaces[j]
+
+            # extract the nodes once per translation table, and run the
+            # models using it, in parallel if possible
+            for indices in groups.values():
+                tinf = models[indices[0]]
+                nodes = Nodes.__new__(Nodes)
+                with nogil:
+                    t_stage = _profile_start(profile)
+                    nodes._extract(
+                        seq,
+                        tinf.tinf.trans_table,
+                        closed=self.closed,
+                        min_gene=self.min_gene,
+                        min_edge_gene=self.min_edge_gene
+                    )
+                    if profile != NULL:
+                        profile.nodes_extracted += nodes.length
+                    _profile_record(profile, _STAGE_EXTRACT, &t_stage)
+                    nodes._sort()
+                    _profile_record(profile, _STAGE_SORT, &t_stage)
+                for j, k in enumerate(indices):
+                    job.models[j] = k
+                job.nodes = <void*> nodes
+                job.count = len(indices)
+                with nogil:
+                    _run_tasks(<_task_function> _multi_task, &job, min(job.tasks, job.count))
+            if profile != NULL:
+                for j in range(job.tasks):
+                    _profile_merge(profile, &job.profiles[j])
+            scores = [job.scores[j] for j in range(len(models))]
+        finally:
+            for workspace in workspaces:
+                self._release_workspace(workspace)
+            PyMem_Free(job.workspaces)
+            PyMem_Free(job.tinfs)
+            PyMem_Free(job.scores)
+            PyMem_Free(job.models)
+            PyMem_Free(job.profiles)
+
+        # release the sequence indices, only needed to score the nodes,
+        # unless the sequence is owned by the caller
+        if seq is not sequence:
+            seq._release_indices()
+
+        # extract the current sequence index
+        with self.lock:
+            num_seq = self._num_seq
+            self._num_seq += 1
+
+        # report profiling statistics
+        if profile != NULL:
+            stats_dict = _profile_dict(profile, "find_genes_multi", _monotonic() - t)
+            if callable(self.profile):
+                self.profile(stats_dict)
+
+        # finalize the genes of each model
+        for j, tinf in enumerate(models):
+            genes = results[j]
+            genes._num_seq = num_seq
+            genes.sequence = seq
+            genes.training_info = tinf
+            genes.meta = False
+            if profile != NULL:
+                genes.stats = stats_dict
+            results[j] = (genes, scores[j])
+
+        return results
+
+    def iter_find_genes(
+        self,
+        object records,
+        int threads=1,
+        object max_in_flight=None,
+        *,
+        object window=None,
+        object overlap=None,
+        bint keep_nodes=True,
+    ):
+        """iter_find_genes(self, records, threads=1, max_in_flight=None, *, window=None, overlap=None, keep_nodes=True)\n--
+
+        Find genes in a stream of sequences, in parallel.
+
+        Records are read lazily from ``records``, and only when the
+        number of records being processed or waiting to be consumed is
+        below ``max_in_flight``, so that an unbounded stream can be
+        processed in constant memory.
+
+        Arguments:
+            records (iterable of `tuple`): An iterable yielding pairs of
+                record identifiers and nucleotide sequences, as accepted
+                by `~OrfFinder.find_genes`.
+            threads (`int`, optional): The number of records to process
+                in parallel. Pass *0* to use as many threads as there are
+                CPUs.
+            max_in_flight (`int`, optional): The maximum number of
+                records read from ``records`` whose genes have not been
+                consumed yet. Defaults to twice the number of threads.
+
+        Keyword Arguments:
+            window (`int`, optional): Passed to `~OrfFinder.find_genes`.
+            overlap (`int`, optional): Passed to `~OrfFinder.find_genes`.
+            keep_nodes (`bool`, optional): Passed to
+                `~OrfFinder.find_genes`.
+
+        Yields:
+            `tuple`: Pairs of record identifiers and the
+            `~pyrodigal.Genes` found in the record sequence, in the same
+            order as ``records``.
+
+        Raises:
+            `ValueError`: When ``threads`` is negative, or when
+                ``max_in_flight`` is smaller than ``threads``.
+
+        Example:
+            >>> orf_finder = pyrodigal.OrfFinder(meta=True)
+            >>> records = [("seq1", "ATG" * 100), ("seq2", "TTG" * 100)]
+            >>> for name, genes in orf_finder.iter_find_genes(records):
+            ...     print(name, len(genes))
+            seq1 1
+            seq2 1
+
+        .. versionadded:: 2.1.0
+
+        """
+        if threads == 0:
+            threads = os.cpu_count() or 1
+        elif threads < 0:
+            raise ValueError("`threads` must be positive or null")
+        if max_in_flight is None:
+            max_in_flight = 2 * threads
+        elif max_in_flight < threads:
+            raise ValueError("`max_in_flight` must be at least `threads`")
+        return _iter_find_genes(
+            self,
+            records,
+            threads,
+            max_in_flight,
+            window,
+            overlap,
+            keep_nodes,
+        )
+
+    async def find_genes_async(
+        self,
+        object sequence,
+        object window=None,
+        object overlap=None,
+        int threads=1,
+        bint keep_nodes=True,
+        *,
+        object executor=None,
+    ):
+        """find_genes_async(self, sequence, window=None, overlap=None, threads=1, keep_nodes=True, *, executor=None)\n--
+
+        Find all the genes in the input DNA sequence without blocking.
+
+        The gene finding runs in a thread pool shared by all ORF finders,
+        with as many threads as there are CPUs, so that the event loop
+        keeps running while genes are being found. At most one call per
+        CPU runs at any time for a given ORF finder and event loop, or
+        at most `OrfFinder.max_concurrency` calls if it was set, the
+        others waiting for a slot without blocking the event loop. The
+        other arguments and the exceptions are the same as
+        `~OrfFinder.find_genes`.
+
+        Keyword Arguments:
+            executor (`~concurrent.futures.Executor`, optional): The
+                executor to run the gene finding in, instead of the shared
+                thread pool. The caller is responsible for shutting it
+                down.
+
+        Returns:
+            `~pyrodigal.Genes`: A list of all the genes found in the input.
+
+        Example:
+            >>> import asyncio
+            >>> orf_finder = pyrodigal.OrfFinder(meta=True)
+            >>> async def main():
+            ...     return await orf_finder.find_genes_async("ATG" * 100)
+            >>> loop = asyncio.new_event_loop()
+            >>> genes = loop.run_until_complete(main())
+            >>> loop.close()
+
+        .. versionadded:: 2.1.0
+
+        """
+        import asyncio
+
+        loop = _running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency or _MAX_WORKSPACES)
+            self._semaphores[loop] = semaphore
+        if executor is None:
+            executor = _shared_executor()
+        async with semaphore:
+            return await loop.run_in_executor(
+                executor,
+                self.find_genes,
+                sequence,
+                window,
+                overlap,
+                threads,
+                keep_nodes,
+            )
+
+    def iter_find_genes_async(
+        self,
+        object sequences,
+        object concurrency=None,
+        *,
+        object window=None,
+        object overlap=None,
+        int threads=1,
+        bint keep_nodes=True,
+        object executor=None,
+    ):
+        """iter_find_genes_async(self, sequences, concurrency=None, *, window=None, overlap=None, threads=1, keep_nodes=True, executor=None)\n--
+
+        Find genes in several sequences concurrently without blocking.
+
+        Arguments:
+            sequences (iterable or async iterable): The nucleotide
+                sequences to process, as accepted by
+                `~OrfFinder.find_genes`.
+            concurrency (`int`, optional): The maximum number of sequences
+                being processed at any time. New sequences are only read
+                from ``sequences`` when a slot is available. Defaults to
+                `OrfFinder.max_concurrency`, or to the number of CPUs.
+
+        Keyword Arguments:
+            window (`int`, optional): Passed to `~OrfFinder.find_genes`.
+            overlap (`int`, optional): Passed to `~OrfFinder.find_genes`.
+            threads (`int`, optional): Passed to `~OrfFinder.find_genes`.
+            keep_nodes (`bool`, optional): Passed to
+                `~OrfFinder.find_genes`.
+            executor (`~concurrent.futures.Executor`, optional): Passed
+                to `~OrfFinder.find_genes_async`.
+
+        Yields:
+            `~pyrodigal.Genes`: The genes found in each sequence, in the
+            same order as ``sequences``.
+
+        Raises:
+            `ValueError`: When ``concurrency`` is not strictly positive.
+
+        Note:
+            Closing the iterator with ``aclose`` before it is exhausted,
+            or an error in one of the sequences, cancels the processing
+            of the sequences that were not started yet.
+
+        .. versionadded:: 2.1.0
+
+        """
+        if concurrency is None:
+            concurrency = self.max_concurrency or os.cpu_count() or 1
+        elif concurrency <= 0:
+            raise ValueError("`concurrency` must be strictly positive")
+        return _AsyncGenesIterator(
+            self,
+            sequences,
+            concurrency,
+            dict(
+                window=window,
+                overlap=overlap,
+                threads=threads,
+                keep_nodes=keep_nodes,
+                executor=executor,
+            ),
+        )
+
     def train(
         self,
         object sequence,
         *sequences,
         bint force_nonsd=False,
         double start_weight=4.35,
-        int translation_table=11
+        object translation_table=11,
+        int threads=1,
+        object candidates=(11, 4, 25),
     ):
-        """train(self, sequence, *sequences, force_nonsd=False, start_weight=4.35, translation_table=11)\n--
+        """train(self, sequence, *sequences, force_nonsd=False, start_weight=4.35, translation_table=11, threads=1, candidates=(11, 4, 25))\n--
 
         Search parameters for the ORF finder using a training sequence.
 
         If more than one sequence is provided, it is assumed that they are
         different contigs part of the same genome. Like in the original
         Prodigal implementation, they will be merged together in a single
-        sequence joined by ``TTAATTAATTAA`` linkers.
+        sequence joined by ``TTAATTAATTAA`` linkers. The contigs are
+        written directly into the merged sequence, so they can also be
+        given as an iterable, e.g. a generator reading a FASTA file.
 
         Arguments:
-            sequence (`str` or buffer): The nucleotide sequence to use,
-                either as a string of nucleotides, or as an object
-                implementing the buffer protocol.
+            sequence (`str`, buffer, `~pyrodigal.Sequence` or iterable):
+                The nucleotide sequence to use, either as a string of
+                nucleotides, as an object implementing the buffer
+                protocol, as a `~pyrodigal.Sequence`, or as an iterable
+                of any of these for a genome with several contigs.
 
         Keyword Arguments:
             force_nonsd (`bool`, optional): Set to ``True`` to bypass the
@@ -5050,9 +8378,20 @@ cdef class OrfFinder:
             start_weight (`float`, optional): The start score weight to use.
                 The default value has been manually selected by the Prodigal
                 authors as an appropriate value for 99% of genomes.
-            translation_table (`int`, optional): The translation table to
-                use. Check the `Wikipedia <https://w.wiki/47wo>`_ page
-                listing all genetic codes for the available values.
+            translation_table (`int` or `str`, optional): The translation
+                table to use. Check the `Wikipedia <https://w.wiki/47wo>`_
+                page listing all genetic codes for the available values.
+                Pass ``"auto"`` to train with each of the ``candidates``
+                translation tables and select the best one.
+            threads (`int`, optional): The number of threads to use for
+                the data-parallel stages of the training (node extraction,
+                dicodon, motif and upstream composition counting), and to
+                train the ``candidates`` translation tables concurrently.
+                Pass *0* to use as many threads as there are CPUs. The
+                resulting training info does not depend on this value.
+            candidates (iterable of `int`, optional): The translation
+                tables to compare when ``translation_table`` is ``"auto"``,
+                by order of preference.
 
         Returns:
             `~pyrodigal.TrainingInfo`: The resulting training info, which
@@ -5065,37 +8404,82 @@ cdef class OrfFinder:
                 mode.
             `TypeError`: When ``sequence`` does not implement the buffer
                 protocol.
-            `ValueError`: When ``translation_table`` is not a valid genetic
-                code number, or when ``sequence`` is too short to train.
+            `ValueError`: When ``translation_table`` or ``candidates``
+                is not a valid genetic code number, or when ``sequence``
+                is too short to train.
+            `~pyrodigal.ResourceLimitError`: When ``sequence`` exceeds
+                the ``max_nodes`` or ``max_sequence_length`` limits.
+
+        Note:
+            With ``translation_table="auto"``, the candidates are compared
+            using the coding density of the genes found with each of them,
+            like recommended by the Prodigal authors to detect genomes
+            using translation table 4: a candidate replaces the current
+            best one if its coding density is above 70% and exceeds the
+            current best by more than 5%. The `Sequence` is only built
+            once and its indices are shared by all candidates.
+
+        .. versionadded:: 2.1.0
+            The ``threads`` and ``candidates`` keyword arguments, and the
+            ``"auto"`` value for ``translation_table``.
+
+        .. versionchanged:: 2.1.0
+            Support training from several `~pyrodigal.Sequence` objects,
+            or from an iterable of contigs.
 
         """
-        cdef Sequence         seq
-        cdef int              slen
-        cdef TrainingInfo     tinf
-        cdef Nodes            nodes  = Nodes()
-        cdef ConnectionScorer scorer = ConnectionScorer(backend=self.backend)
+        cdef Sequence     seq
+        cdef int          slen
+        cdef int          i
+        cdef int          best
+        cdef TrainingInfo tinf
+        cdef _Workspace   workspace
+        cdef _train_job   job
+        cdef list         contigs
+        cdef list         trained
+        cdef list         densities
+        cdef _profile     stats
+        cdef _profile*    profile   = NULL
+        cdef double       t         = 0.0
+        cdef list         tables    = None
 
         # Check arguments
         if self.meta:
             raise RuntimeError("cannot use training sequence in metagenomic mode")
-        if translation_table not in _TRANSLATION_TABLES:
+        if translation_table == "auto":
+            tables = list(candidates)
+            if not tables:
+                raise ValueError("`candidates` must contain at least one translation table")
+            for table in tables:
+                if table not in _TRANSLATION_TABLES:
+                    raise ValueError(f"{table} is not a valid translation table index")
+        elif translation_table not in _TRANSLATION_TABLES:
             raise ValueError(f"{translation_table} is not a valid translation table index")
-
-        # extract sequence
-        if isinstance(sequence, Sequence):
-            if sequences:
-                raise NotImplementedError("cannot use more than one `Sequence` object in `OrfFinder.train`")
+        if threads == 0:
+            threads = os.cpu_count() or 1
+        elif threads < 0:
+            raise ValueError("`threads` must be positive or null")
+
+        # extract sequence, writing several contigs directly into a
+        # single sequence joined by linkers like Prodigal does
+        if not isinstance(sequence, (Sequence, str)) and not PyObject_CheckBuffer(sequence):
+            contigs = list(itertools.chain(sequence, sequences))
+        elif sequences:
+            contigs = [sequence, *sequences]
+        else:
+            contigs = None
+        if contigs is not None:
+            for contig in contigs:
+                self._check_length(contig)
+            seq = Sequence._from_contigs(contigs, b"TTAATTAATTAA", self.mask, MASK_SIZE)
+        elif isinstance(sequence, Sequence):
             seq = sequence
-        elif isinstance(sequence, str):
-            if sequences:
-                sequence = "TTAATTAATTAA".join(itertools.chain([sequence], sequences, [""]))
-            seq = Sequence(sequence, mask=self.mask)
         else:
-            if sequences:
-                sequence = b"TTAATTAATTAA".join(itertools.chain([sequence], sequences, [b""]))
+            self._check_length(sequence)
             seq = Sequence(sequence, mask=self.mask)
 
-        # check sequence length
+        # check sequence length and number of nodes
+        self._check_limits(seq, tables or (translation_table,))
         if seq.slen < _MIN_SINGLE_GENOME:
             raise ValueError(
                 f"sequence must be at least {_MIN_SINGLE_GENOME} characters ({seq.slen} found)"
@@ -5105,16 +8489,72 @@ cdef class OrfFinder:
                 f"sequence should be at least {_IDEAL_SINGLE_GENOME} characters ({seq.slen} found)"
             )
 
+        # start profiling if requested
+        if self.profile:
+            memset(&stats, 0, sizeof(_profile))
+            profile = &stats
+            t = _monotonic()
+
         # build training info
-        tinf = TrainingInfo(seq.gc, start_weight, translation_table)
-        with nogil:
-            self._train(
-                seq,
-                nodes,
-                scorer,
-                tinf,
-                force_nonsd,
-            )
+        if tables is None:
+            tinf = TrainingInfo(seq.gc, start_weight, translation_table)
+            workspace = self._acquire_workspace()
+            try:
+                self._train(
+                    seq,
+                    workspace.nodes,
+                    workspace.scorer,
+                    tinf,
+                    force_nonsd,
+                    threads,
+                    profile,
+                )
+            finally:
+                self._release_workspace(workspace)
+        else:
+            # train every candidate, splitting threads between them
+            job.finder = <void*> self
+            job.sequence = <void*> seq
+            trained = [TrainingInfo(seq.gc, start_weight, table) for table in tables]
+            densities = [0.0] * len(tables)
+            job.candidates = <void*> trained
+            job.densities = <void*> densities
+            job.force_nonsd = force_nonsd
+            job.count = len(tables)
+            job.tasks = min(threads, job.count)
+            job.threads = max(1, threads // job.tasks)
+            job.profiles = NULL
+            job.gc_frame = NULL
+            if profile != NULL:
+                job.profiles = <_profile*> PyMem_Malloc(job.tasks * sizeof(_profile))
+                if job.profiles == NULL:
+                    raise MemoryError("Failed to allocate training profiles")
+                memset(job.profiles, 0, job.tasks * sizeof(_profile))
+            try:
+                # build the sequence indices and the GC frame plot only
+                # once, since they do not depend on the translation table
+                with nogil:
+                    seq._hexamer_index()
+                    job.gc_frame = seq._max_gc_frame_plot(_WINDOW)
+                    _run_tasks(<_task_function> _train_task, &job, job.tasks)
+                if profile != NULL:
+                    for i in range(job.tasks):
+                        _profile_merge(profile, &job.profiles[i])
+            finally:
+                if job.gc_frame != NULL:
+                    _memory_record(_MEMORY_GC_FRAME_PLOT, seq.slen * sizeof(int), 0)
+                    free(job.gc_frame)
+                PyMem_Free(job.profiles)
+            # select the best translation table from coding density
+            best = 0
+            for i in range(1, job.count):
+                if densities[i] > 0.7 and densities[i] - densities[best] > 0.05:
+                    best = i
+            tinf = trained[best]
+
+        # report profiling statistics
+        if profile != NULL and callable(self.profile):
+            self.profile(_profile_dict(profile, "train", _monotonic() - t))
 
         # store it, using a lock to avoid race condition if there is
         # currently a `find_genes` call going on in a different thread
@@ -2,3 +2,4 @@ from libc.stdint cimport int8_t, uint8_t
 
 cdef extern from "impl/generic.h" nogil:
     void skippable_generic(const int8_t*, const uint8_t*, const uint8_t*, const int, const int, uint8_t*);
+    void skippable_generic_single(const int8_t*, const uint8_t*, const uint8_t*, const int, const int, uint8_t*);
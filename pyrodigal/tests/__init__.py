@@ -3,6 +3,8 @@ from . import (
     test_gene,
     test_genes,
     test_mask,
+    test_masks,
+    test_memory,
     test_nodes,
     test_orf_finder,
     test_sequence,
@@ -16,6 +18,8 @@ def load_tests(loader, suite, pattern):
     suite.addTests(loader.loadTestsFromModule(test_gene))
     suite.addTests(loader.loadTestsFromModule(test_genes))
     suite.addTests(loader.loadTestsFromModule(test_mask))
+    suite.addTests(loader.loadTestsFromModule(test_masks))
+    suite.addTests(loader.loadTestsFromModule(test_memory))
     suite.addTests(loader.loadTestsFromModule(test_nodes))
     suite.addTests(loader.loadTestsFromModule(test_orf_finder))
     suite.addTests(loader.loadTestsFromModule(test_sequence))
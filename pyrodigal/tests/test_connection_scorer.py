@@ -1,12 +1,15 @@
 import collections.abc
 import functools
 import gzip
+import json
 import os
 import sys
+import tempfile
 import unittest
+import unittest.mock
 import random
 
-from .. import TrainingInfo, Nodes, Sequence, _pyrodigal
+from .. import TrainingInfo, Nodes, OrfFinder, Sequence, _pyrodigal, tune
 from .._pyrodigal import METAGENOMIC_BINS, ConnectionScorer
 from . import data
 
@@ -39,6 +42,26 @@ def scored_nodes(record, final=True, backend=None):
     return nodes
 
 
+@functools.lru_cache()
+def giant_orfs_sequence(seed=42, count=4, length=30000):
+    # build a sequence with long ORFs on both strands, so that the
+    # dynamic programming has to look beyond the node distance window
+    rng = random.Random(seed)
+    parts = []
+    for i in range(count):
+        codons = []
+        while len(codons) < length // 3:
+            codon = "".join(rng.choices("ACGT", weights=[1, 2, 2, 1], k=3))
+            if codon not in ("TAA", "TAG", "TGA"):
+                codons.append(codon)
+        orf = "ATG{}TAA".format("".join(codons))
+        if i % 2:
+            orf = orf[::-1].translate(str.maketrans("ACGT", "TGCA"))
+        parts.append(orf)
+        parts.append("".join(rng.choices("ACGT", k=50)))
+    return "".join(parts)
+
+
 class _TestConnectionScorerBase:
     backend = None
 
@@ -71,6 +94,61 @@ class _TestConnectionScorerBase:
         for n1, n2 in zip(nodes_expected, nodes_actual):
             self.assertNodeEqual(n1, n2)
 
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_score_connections_index_before_score(self):
+        # node scores changed after indexing must be used by the scorer
+        record = data.load_record("KK037166.fna.gz")
+        seq = Sequence(record.seq)
+        tinf = METAGENOMIC_BINS[0].training_info
+        results = []
+        for backend in (None, self.backend):
+            scorer = ConnectionScorer(backend=backend)
+            nodes = extract_nodes(record).copy()
+            scorer.index(nodes)
+            nodes.score(seq, tinf, is_meta=True)
+            for i in range(len(nodes)):
+                j = 0 if i < 500 else i - 500
+                scorer.compute_skippable(j, i)
+                scorer.score_connections(nodes, j, i, tinf, final=True)
+            results.append(nodes)
+        for n1, n2 in zip(*results):
+            self.assertNodeEqual(n1, n2)
+
+
+    def test_find_genes_giant_orfs(self):
+        sequence = giant_orfs_sequence()
+        tinf = METAGENOMIC_BINS[0].training_info
+        expected = OrfFinder(tinf, backend=None).find_genes(sequence)
+        actual = OrfFinder(tinf, backend=self.backend).find_genes(sequence)
+        self.assertEqual(len(expected), len(actual))
+        for g1, g2 in zip(expected, actual):
+            self.assertEqual(g1.begin, g2.begin)
+            self.assertEqual(g1.end, g2.end)
+            self.assertEqual(g1.strand, g2.strand)
+            self.assertEqual(g1.score, g2.score)
+        for n1, n2 in zip(expected.nodes, actual.nodes):
+            self.assertNodeEqual(n1, n2)
+
+    def test_find_genes_giant_orfs_expected(self):
+        # genes predicted by the unbounded predecessor scan, which must be
+        # recovered even though the ORFs span more than MAX_NODE_DIST nodes
+        sequence = giant_orfs_sequence()
+        tinf = METAGENOMIC_BINS[0].training_info
+        genes = OrfFinder(tinf, backend=self.backend).find_genes(sequence)
+        self.assertGreater(len(genes.nodes), 4 * 500)  # MAX_NODE_DIST = 500
+        expected = [
+            (31, 30006, 1, 967.95),
+            (30057, 60062, -1, 951.40),
+            (60113, 90118, 1, 951.67),
+            (90169, 120222, -1, 965.09),
+        ]
+        self.assertEqual(len(genes), len(expected))
+        for gene, (begin, end, strand, score) in zip(genes, expected):
+            self.assertEqual(gene.begin, begin)
+            self.assertEqual(gene.end, end)
+            self.assertEqual(gene.strand, strand)
+            self.assertAlmostEqual(gene.score, score, delta=0.01)
+
 
 class TestConnectionScorerGeneric(_TestConnectionScorerBase, unittest.TestCase):
     backend = "generic"
@@ -98,3 +176,64 @@ class TestConnectionScorerAVX(_TestConnectionScorerBase, unittest.TestCase):
 @unittest.skipUnless(_pyrodigal._NEON_RUNTIME_SUPPORT, "requires machine with NEON support")
 class TestConnectionScorerNEON(_TestConnectionScorerBase, unittest.TestCase):
     backend = "neon"
+
+
+class TestTune(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "backends.json")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_tune_returns_available_backend(self):
+        backend = tune(self.path, force=True, runs=1)
+        ConnectionScorer(backend=backend)
+
+    def test_tune_writes_cache(self):
+        backend = tune(self.path, force=True, runs=1)
+        with open(self.path) as f:
+            cache = json.load(f)
+        self.assertEqual(len(cache), 1)
+        entry = next(iter(cache.values()))
+        self.assertEqual(entry["backend"], backend)
+        self.assertIn("None", entry["times"])
+        self.assertIn("generic", entry["times"])
+
+    def test_tune_reads_cache(self):
+        tune(self.path, force=True, runs=1)
+        with open(self.path) as f:
+            cache = json.load(f)
+        fingerprint = next(iter(cache))
+        # force the result in the cache to a backend that is always available
+        cache[fingerprint]["backend"] = "generic"
+        with open(self.path, "w") as f:
+            json.dump(cache, f)
+        # clear the in-memory cache to make sure the file is read
+        with unittest.mock.patch.dict(_pyrodigal._TUNED_BACKENDS, clear=True):
+            self.assertEqual(tune(self.path), "generic")
+
+    def test_tune_corrupted_cache(self):
+        with open(self.path, "w") as f:
+            f.write("not json")
+        backend = tune(self.path, force=True, runs=1)
+        with open(self.path) as f:
+            cache = json.load(f)
+        self.assertEqual(next(iter(cache.values()))["backend"], backend)
+
+    def test_tune_fingerprint_cached(self):
+        backend = tune(self.path, force=True, runs=1)
+        # the host is only inspected once per process
+        with unittest.mock.patch("platform.processor", side_effect=AssertionError):
+            self.assertEqual(tune(self.path), backend)
+
+    def test_tune_invalid_runs(self):
+        self.assertRaises(ValueError, tune, self.path, runs=0)
+
+    def test_autotune_backend(self):
+        env = {"PYRODIGAL_CACHE_DIR": self.tempdir.name}
+        with unittest.mock.patch.dict(os.environ, env):
+            with unittest.mock.patch.dict(_pyrodigal._TUNED_BACKENDS, clear=True):
+                ConnectionScorer(backend="autotune")
+        self.assertTrue(os.path.exists(self.path))
@@ -95,6 +95,19 @@ class TestGenes(unittest.TestCase):
         self.assertIs(genes.training_info, mb.training_info)
         self.assertIs(genes.training_info.metagenomic_bin, mb)
 
+    def test_keep_nodes(self):
+        genes = self.p.find_genes(str(self.record.seq), keep_nodes=False)
+        self.assertTrue(self.genes.keep_nodes)
+        self.assertFalse(genes.keep_nodes)
+        self.assertEqual(len(genes), len(self.genes))
+        self.assertEqual(len(genes.nodes), 2 * len(genes))
+        for gene1, gene2 in zip(self.genes, genes):
+            self.assertEqual(gene1._gene_data(1), gene2._gene_data(1))
+            self.assertEqual(gene1._score_data(), gene2._score_data())
+            self.assertEqual(gene1.translate(), gene2.translate())
+        self.assertRaises(RuntimeError, genes.write_scores, io.StringIO(), self.record.id)
+        self.assertFalse(pickle.loads(pickle.dumps(genes)).keep_nodes)
+
     def test_write_translations(self):
         buffer = io.StringIO()
         self.genes.write_translations(buffer, self.record.id)
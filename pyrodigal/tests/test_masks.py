@@ -0,0 +1,43 @@
+import pickle
+import random
+import unittest
+
+from .. import Masks, Sequence
+
+
+class TestMasks(unittest.TestCase):
+    def test_setstate_sorted(self):
+        masks = Masks()
+        masks.__setstate__([(30, 40), (2, 4), (10, 20), (15, 25), (3, 5)])
+        self.assertEqual(masks.__getstate__(), [(2, 5), (10, 25), (30, 40)])
+
+    def test_pickle(self):
+        seq = Sequence("ATGC" + "N" * 60 + "ATGC" + "N" * 60 + "ATGC", mask=True)
+        masks = pickle.loads(pickle.dumps(seq.masks))
+        self.assertEqual(masks.__getstate__(), seq.masks.__getstate__())
+
+    def test_intersects(self):
+        masks = Masks()
+        masks.__setstate__([(2, 4), (10, 20)])
+        self.assertTrue(masks.intersects(1, 3))
+        self.assertTrue(masks.intersects(3, 11))
+        self.assertTrue(masks.intersects(12, 14))
+        self.assertFalse(masks.intersects(4, 10))
+        self.assertFalse(masks.intersects(20, 30))
+        self.assertFalse(masks.intersects(0, 2))
+        self.assertFalse(Masks().intersects(0, 100))
+
+    def test_intersecting(self):
+        rng = random.Random(42)
+        seq = Sequence(
+            "".join(rng.choice("ACGTNNNNNN") for _ in range(2000)),
+            mask=True,
+            mask_size=3,
+        )
+        self.assertGreater(len(seq.masks), 10)
+        for _ in range(100):
+            begin = rng.randrange(0, len(seq))
+            end = rng.randrange(begin, len(seq) + 1)
+            expected = [mask for mask in seq.masks if mask.intersects(begin, end)]
+            self.assertEqual(seq.masks.intersecting(begin, end), expected)
+            self.assertEqual(seq.masks.intersects(begin, end), bool(expected))
@@ -0,0 +1,134 @@
+import gc
+import unittest
+import warnings
+
+from .. import METAGENOMIC_BINS, OrfFinder, Sequence, memory_stats, track_memory
+from . import data
+
+
+@unittest.skipUnless(data.resources, "importlib.resources not available")
+class TestMemoryStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.record = data.load_record("SRR492066.fna.gz")
+
+    def setUp(self):
+        self.tracking = track_memory(True)
+
+    def tearDown(self):
+        track_memory(self.tracking)
+
+    def test_disabled(self):
+        track_memory(False)
+        before = memory_stats()
+        self.assertFalse(before["tracking"])
+        seq = Sequence(str(self.record.seq))
+        after = memory_stats()
+        self.assertEqual(before["allocations"], after["allocations"])
+        self.assertEqual(before["current"], after["current"])
+
+    def test_subsystems(self):
+        stats = memory_stats()
+        self.assertTrue(stats["tracking"])
+        for name in ("masks", "sequence", "sequence_index", "nodes", "genes"):
+            self.assertIn(name, stats["subsystems"])
+            for key in ("current", "peak", "allocations", "reallocations", "frees"):
+                self.assertIn(key, stats["subsystems"][name])
+
+    def test_find_genes(self):
+        orf_finder = OrfFinder(meta=True)
+        memory_stats(reset=True)
+        genes = orf_finder.find_genes(str(self.record.seq))
+        stats = memory_stats()
+        sequence = stats["subsystems"]["sequence"]
+        self.assertEqual(sequence["allocations"], 1)
+        self.assertGreaterEqual(sequence["current"], len(self.record.seq))
+        nodes = stats["subsystems"]["nodes"]
+        self.assertGreater(nodes["allocations"], 0)
+        self.assertGreater(nodes["reallocations"], 0)
+        self.assertGreaterEqual(nodes["peak"], nodes["current"])
+        self.assertGreater(stats["peak"], 0)
+        self.assertGreaterEqual(stats["peak"], stats["current"])
+        # releasing the result frees its sequence, nodes and genes
+        del genes
+        gc.collect()
+        stats = memory_stats()
+        self.assertEqual(stats["subsystems"]["sequence"]["current"], 0)
+        self.assertEqual(stats["subsystems"]["genes"]["frees"], 1)
+
+    def test_find_genes_indices(self):
+        orf_finder = OrfFinder(meta=True)
+        before = memory_stats()["subsystems"]["sequence_index"]["current"]
+        # the indices built for a string input are not kept by the result
+        genes = orf_finder.find_genes(str(self.record.seq))
+        self.assertEqual(memory_stats()["subsystems"]["sequence_index"]["current"], before)
+        genes = orf_finder.find_genes_multi(str(self.record.seq), [METAGENOMIC_BINS[0].training_info])
+        self.assertEqual(memory_stats()["subsystems"]["sequence_index"]["current"], before)
+        # the indices of a `Sequence` input are kept for later calls
+        seq = Sequence(str(self.record.seq))
+        genes = orf_finder.find_genes(seq)
+        self.assertGreater(memory_stats()["subsystems"]["sequence_index"]["current"], before)
+
+    def test_train(self):
+        orf_finder = OrfFinder()
+        memory_stats(reset=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            orf_finder.train(str(self.record.seq))
+        stats = memory_stats()
+        buffers = stats["subsystems"]["training_buffers"]
+        self.assertGreater(buffers["allocations"], 0)
+        self.assertEqual(buffers["allocations"], buffers["frees"])
+        self.assertEqual(buffers["current"], 0)
+        self.assertGreater(buffers["peak"], 0)
+        self.assertEqual(stats["subsystems"]["training_info"]["allocations"], 1)
+
+    def test_reset(self):
+        seq = Sequence(str(self.record.seq))
+        stats = memory_stats(reset=True)
+        self.assertGreater(stats["subsystems"]["sequence"]["allocations"], 0)
+        stats = memory_stats()
+        self.assertEqual(stats["subsystems"]["sequence"]["allocations"], 0)
+        self.assertEqual(stats["peak"], stats["current"])
+
+    def test_sequence_index(self):
+        memory_stats(reset=True)
+        seq = Sequence(str(self.record.seq))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            OrfFinder().train(seq)
+        index = memory_stats()["subsystems"]["sequence_index"]
+        self.assertGreater(index["current"], 0)
+        self.assertEqual(index["current"], seq.__sizeof__() - Sequence("").__sizeof__() - len(seq))
+        # releasing the sequence frees exactly the size of its indices
+        del seq
+        gc.collect()
+        index = memory_stats()["subsystems"]["sequence_index"]
+        self.assertEqual(index["current"], 0)
+
+    def test_garbage_collection(self):
+        # make sure deallocating objects while the statistics are being
+        # built does not deadlock on the memory accounting lock
+        threshold = gc.get_threshold()
+        gc.set_threshold(1)
+        try:
+            for _ in range(100):
+                cycle = [Sequence("ATGCNNNNNNNNNNATGC", mask=True)]
+                cycle.append(cycle)
+                del cycle
+                memory_stats(reset=True)
+        finally:
+            gc.set_threshold(*threshold)
+
+    def test_close(self):
+        orf_finder = OrfFinder(meta=True)
+        before = memory_stats()["subsystems"]["nodes"]["current"]
+        orf_finder.find_genes(str(self.record.seq), keep_nodes=False)
+        # the nodes buffer is kept by the ORF finder between calls
+        self.assertGreater(memory_stats()["subsystems"]["nodes"]["current"], before)
+        orf_finder.close()
+        self.assertEqual(memory_stats()["subsystems"]["nodes"]["current"], before)
+        # the ORF finder is still usable after being closed
+        with orf_finder:
+            orf_finder.find_genes(str(self.record.seq), keep_nodes=False)
+        self.assertEqual(memory_stats()["subsystems"]["nodes"]["current"], before)
@@ -1,12 +1,16 @@
 import abc
+import asyncio
+import concurrent.futures
 import gzip
 import os
 import pickle
+import random
 import textwrap
+import threading
 import unittest
 import warnings
 
-from .. import OrfFinder
+from .. import METAGENOMIC_BINS, OrfFinder, ResourceLimitError, Sequence, TrainingInfo, memory_stats, track_memory
 from . import data
 
 
@@ -187,6 +191,283 @@ class TestOrfFinder(_OrfFinderTestCase, unittest.TestCase):
     def test_invalid_min_gene(self):
         self.assertRaises(ValueError, OrfFinder, min_gene=-1)
 
+    def test_invalid_profile(self):
+        self.assertRaises(TypeError, OrfFinder, profile=1)
+
+    def test_invalid_limits(self):
+        self.assertRaises(ValueError, OrfFinder, max_nodes=0)
+        self.assertRaises(ValueError, OrfFinder, max_sequence_length=-1)
+
+    def test_max_sequence_length(self):
+        p = OrfFinder(meta=True, max_sequence_length=1000)
+        p.find_genes("ATGC" * 250)
+        self.assertRaises(ResourceLimitError, p.find_genes, "ATGC" * 251)
+        p = OrfFinder(max_sequence_length=1000)
+        self.assertRaises(ResourceLimitError, p.train, "ATGC" * 10000)
+
+    def test_max_sequence_length_before_digitizing(self):
+        p = OrfFinder(meta=True, max_sequence_length=1000)
+        tracking = track_memory(True)
+        try:
+            before = memory_stats()["subsystems"]["sequence"]["allocations"]
+            self.assertRaises(ResourceLimitError, p.find_genes, "ATGC" * 251)
+            self.assertRaises(ResourceLimitError, p.find_genes, b"ATGC" * 251)
+            after = memory_stats()["subsystems"]["sequence"]["allocations"]
+            self.assertEqual(before, after)
+        finally:
+            track_memory(tracking)
+
+    def test_max_nodes(self):
+        seq = "ATGAAATAA" * 100
+        estimate = Sequence(seq).estimated_nodes
+        p = OrfFinder(meta=True, closed=True, max_nodes=estimate)
+        genes = p.find_genes(seq)
+        self.assertLessEqual(len(genes.nodes), estimate)
+        p = OrfFinder(meta=True, closed=True, max_nodes=estimate - 1)
+        self.assertRaises(ResourceLimitError, p.find_genes, seq)
+
+    def test_max_nodes_edges(self):
+        # a sequence without start or stop codons only has edge nodes
+        seq = "C" * 300
+        tinf = TrainingInfo(0.5)
+        nodes = len(OrfFinder(tinf).find_genes(seq).nodes)
+        self.assertGreater(nodes, 0)
+        p = OrfFinder(tinf, max_nodes=nodes - 1)
+        self.assertRaises(ResourceLimitError, p.find_genes, seq)
+        p = OrfFinder(tinf, closed=True, max_nodes=1)
+        self.assertEqual(len(p.find_genes(seq).nodes), 0)
+
+    def test_max_nodes_upper_bound(self):
+        # the limit must reject any sequence with more nodes, including
+        # edge nodes and the extra stops of some tables
+        rng = random.Random(42)
+        seq = "".join(rng.choice("ACGT") for _ in range(5000))
+        window, overlap = 1000, 100
+        for table in (11, 2, 22, 23):
+            tinf = TrainingInfo(0.5, translation_table=table)
+            for closed in (False, True):
+                p = OrfFinder(tinf, closed=closed)
+                nodes = len(p.find_genes(seq).nodes)
+                p = OrfFinder(tinf, closed=closed, max_nodes=nodes - 1)
+                self.assertRaises(ResourceLimitError, p.find_genes, seq)
+                p = OrfFinder(tinf, closed=closed)
+                nodes = max(
+                    len(p.find_genes(seq[begin:begin + window]).nodes)
+                    for begin in range(0, len(seq) - overlap, window - overlap)
+                )
+                p = OrfFinder(tinf, closed=closed, max_nodes=nodes - 1)
+                self.assertRaises(ResourceLimitError, p.find_genes, seq, window=window, overlap=overlap)
+
+
+class TestIterFindGenes(_OrfFinderTestCase, unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(42)
+        self.records = [
+            ("seq{}".format(i), "".join(rng.choice("ACGT") for _ in range(length)))
+            for i, length in enumerate((5000, 20000, 100, 12000, 8000))
+        ]
+
+    def test_invalid_arguments(self):
+        orf_finder = OrfFinder(meta=True)
+        self.assertRaises(ValueError, orf_finder.iter_find_genes, self.records, threads=-1)
+        self.assertRaises(ValueError, orf_finder.iter_find_genes, self.records, threads=2, max_in_flight=1)
+
+    def test_order(self):
+        orf_finder = OrfFinder(meta=True)
+        expected = [orf_finder.find_genes(seq) for _, seq in self.records]
+        for threads in (1, 2, 4):
+            results = list(orf_finder.iter_find_genes(self.records, threads=threads))
+            self.assertEqual([id_ for id_, _ in results], [id_ for id_, _ in self.records])
+            for (_, genes), genes_expected in zip(results, expected):
+                self.assertEqual(len(genes), len(genes_expected))
+                for gene1, gene2 in zip(genes, genes_expected):
+                    self.assertGeneEqual(gene1, gene2)
+
+    def test_backpressure(self):
+        consumed = []
+        def records():
+            for record in self.records:
+                consumed.append(record[0])
+                yield record
+        orf_finder = OrfFinder(meta=True)
+        it = orf_finder.iter_find_genes(records(), threads=2, max_in_flight=3)
+        next(it)
+        self.assertEqual(len(consumed), 3)
+        next(it)
+        self.assertEqual(len(consumed), 4)
+        it.close()
+        self.assertEqual(len(consumed), 4)
+
+    def test_error(self):
+        orf_finder = OrfFinder()
+        it = orf_finder.iter_find_genes(self.records)
+        self.assertRaises(RuntimeError, next, it)
+
+
+class _AsyncIterator(object):
+    def __init__(self, items):
+        self.items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self, max_workers):
+        super().__init__(max_workers)
+        self.lock = threading.Lock()
+        self.submitted = 0
+        self.pending = 0
+        self.max_pending = 0
+
+    def _done(self, future):
+        with self.lock:
+            self.pending -= 1
+
+    def submit(self, *args, **kwargs):
+        with self.lock:
+            self.submitted += 1
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+        future = super().submit(*args, **kwargs)
+        future.add_done_callback(self._done)
+        return future
+
+
+class TestAsync(_OrfFinderTestCase, unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        rng = random.Random(42)
+        self.sequences = [
+            "".join(rng.choice("ACGT") for _ in range(length))
+            for length in (5000, 20000, 100, 12000)
+        ]
+
+    def tearDown(self):
+        self.loop.close()
+
+    def assertGenesEqual(self, genes1, genes2):
+        self.assertEqual(len(genes1), len(genes2))
+        for gene1, gene2 in zip(genes1, genes2):
+            self.assertGeneEqual(gene1, gene2)
+
+    def test_find_genes_async(self):
+        orf_finder = OrfFinder(meta=True)
+        for sequence in self.sequences:
+            expected = orf_finder.find_genes(sequence)
+            genes = self.loop.run_until_complete(orf_finder.find_genes_async(sequence))
+            self.assertGenesEqual(genes, expected)
+
+    def test_find_genes_async_error(self):
+        orf_finder = OrfFinder()
+        with self.assertRaises(RuntimeError):
+            self.loop.run_until_complete(orf_finder.find_genes_async(self.sequences[0]))
+
+    def test_iter_find_genes_async(self):
+        orf_finder = OrfFinder(meta=True)
+        expected = [orf_finder.find_genes(seq) for seq in self.sequences]
+
+        async def collect(sequences, concurrency):
+            results = []
+            async for genes in orf_finder.iter_find_genes_async(sequences, concurrency):
+                results.append(genes)
+            return results
+
+        for concurrency in (None, 1, 2, 10):
+            results = self.loop.run_until_complete(collect(self.sequences, concurrency))
+            self.assertEqual(len(results), len(expected))
+            for genes, genes_expected in zip(results, expected):
+                self.assertGenesEqual(genes, genes_expected)
+            results = self.loop.run_until_complete(collect(_AsyncIterator(self.sequences), concurrency))
+            self.assertEqual(len(results), len(expected))
+            for genes, genes_expected in zip(results, expected):
+                self.assertGenesEqual(genes, genes_expected)
+
+    def test_find_genes_async_executor(self):
+        orf_finder = OrfFinder(meta=True)
+        expected = [orf_finder.find_genes(seq) for seq in self.sequences]
+
+        async def collect(executor):
+            results = [
+                orf_finder.find_genes_async(seq, executor=executor)
+                for seq in self.sequences
+            ]
+            return await asyncio.gather(*results)
+
+        with _CountingExecutor(2) as executor:
+            results = self.loop.run_until_complete(collect(executor))
+        self.assertEqual(executor.submitted, len(self.sequences))
+        for genes, genes_expected in zip(results, expected):
+            self.assertGenesEqual(genes, genes_expected)
+
+    def test_find_genes_async_concurrency(self):
+        # calls exceeding the concurrency limit wait on the event loop
+        # instead of piling up in the executor
+        orf_finder = OrfFinder(meta=True)
+        limit = os.cpu_count() or 1
+        sequences = self.sequences * (limit + 1)
+
+        async def collect(executor):
+            results = [
+                orf_finder.find_genes_async(seq, executor=executor)
+                for seq in sequences
+            ]
+            return await asyncio.gather(*results)
+
+        with _CountingExecutor(len(sequences)) as executor:
+            results = self.loop.run_until_complete(collect(executor))
+        self.assertEqual(len(results), len(sequences))
+        self.assertEqual(executor.submitted, len(sequences))
+        self.assertLessEqual(executor.max_pending, limit)
+
+    def test_find_genes_async_max_concurrency(self):
+        orf_finder = OrfFinder(meta=True, max_concurrency=2)
+        sequences = self.sequences * 3
+
+        async def collect(executor):
+            results = [
+                orf_finder.find_genes_async(seq, executor=executor)
+                for seq in sequences
+            ]
+            return await asyncio.gather(*results)
+
+        with _CountingExecutor(len(sequences)) as executor:
+            results = self.loop.run_until_complete(collect(executor))
+        self.assertEqual(len(results), len(sequences))
+        self.assertLessEqual(executor.max_pending, 2)
+        self.assertRaises(ValueError, OrfFinder, max_concurrency=0)
+        self.assertEqual(pickle.loads(pickle.dumps(orf_finder)).max_concurrency, 2)
+
+    def test_iter_find_genes_async_aclose(self):
+        orf_finder = OrfFinder(meta=True)
+
+        async def first():
+            iterator = orf_finder.iter_find_genes_async(self.sequences * 10, 2)
+            genes = await iterator.__anext__()
+            await iterator.aclose()
+            with self.assertRaises(StopAsyncIteration):
+                await iterator.__anext__()
+            return genes
+
+        genes = self.loop.run_until_complete(first())
+        self.assertGenesEqual(genes, orf_finder.find_genes(self.sequences[0]))
+
+    def test_iter_find_genes_async_invalid_concurrency(self):
+        orf_finder = OrfFinder(meta=True)
+
+        async def collect():
+            async for genes in orf_finder.iter_find_genes_async(self.sequences, 0):
+                pass
+
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(collect())
+
 
 class TestMeta(_OrfFinderTestCase, unittest.TestCase):
     @unittest.skipUnless(data.resources, "importlib.resources not available")
@@ -233,6 +514,39 @@ class TestMeta(_OrfFinderTestCase, unittest.TestCase):
         self.assertEqual(len(genes), 0)
         self.assertRaises(StopIteration, next, iter(genes))
 
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_find_genes_reuse(self):
+        long = str(data.load_record("SRR492066.fna.gz").seq)
+        short = long[:5000]
+        p1 = OrfFinder(meta=True)
+        g1 = p1.find_genes(short)
+        p2 = OrfFinder(meta=True)
+        p2.find_genes(long)
+        g2 = p2.find_genes(short)
+        self.assertEqual(len(g1), len(g2))
+        self.assertEqual(len(g1.nodes), len(g2.nodes))
+        for gene1, gene2 in zip(g1, g2):
+            self.assertGeneEqual(gene1, gene2)
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_find_genes_profile(self):
+        record = data.load_record("SRR492066.fna.gz")
+        g1 = OrfFinder(meta=True).find_genes(str(record.seq))
+        self.assertIs(g1.stats, None)
+        g2 = OrfFinder(meta=True, profile=True).find_genes(str(record.seq))
+        self.assertEqual(len(g1), len(g2))
+        for gene1, gene2 in zip(g1, g2):
+            self.assertGeneEqual(gene1, gene2)
+        self.assertEqual(g2.stats["method"], "find_genes")
+        for stage in ("extract", "sort", "index", "score", "dynamic_programming"):
+            self.assertGreaterEqual(g2.stats["times"][stage], 0.0)
+        self.assertLessEqual(sum(g2.stats["times"].values()), g2.stats["total"])
+        counters = g2.stats["counters"]
+        self.assertEqual(counters["bins_evaluated"], len(g2.stats["bins"]))
+        self.assertGreater(counters["bins_evaluated"], 0)
+        self.assertGreaterEqual(counters["nodes_extracted"], len(g2.nodes))
+        self.assertGreater(counters["connections_scored"], 0)
+
     @unittest.skipUnless(data.resources, "importlib.resources not available")
     def test_find_genes_masked_MIIJ01000039(self):
         record = data.load_record("MIIJ01000039.fna.gz")
@@ -319,6 +633,245 @@ class TestSingle(_OrfFinderTestCase, unittest.TestCase):
         self.assertEqual(info.type_weights[2], -2.136731395763296)
         self.assertTrue(info.uses_sd)
 
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_train_threads(self):
+        record = data.load_record("SRR492066.fna.gz")
+        p = OrfFinder(meta=False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for force_nonsd in (False, True):
+                info1 = p.train(record.seq, force_nonsd=force_nonsd, threads=1)
+                for threads in (2, 3, 0):
+                    info2 = p.train(record.seq, force_nonsd=force_nonsd, threads=threads)
+                    self.assertEqual(info1.__getstate__(), info2.__getstate__())
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    @unittest.skipUnless(hasattr(os, "fork"), "os.fork not available")
+    def test_train_threads_fork(self):
+        # worker threads kept alive by the parent process do not exist in
+        # a forked child, which must start its own
+        record = data.load_record("SRR492066.fna.gz")
+        p = OrfFinder(meta=False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            info1 = p.train(record.seq, threads=4)
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    info2 = p.train(record.seq, threads=4)
+                    os._exit(0 if info1.__getstate__() == info2.__getstate__() else 1)
+                finally:
+                    os._exit(2)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.WEXITSTATUS(status), 0)
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_profile_callback(self):
+        record = data.load_record("SRR492066.fna.gz")
+        stats = []
+        p = OrfFinder(meta=False, profile=stats.append)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            p.train(str(record.seq))
+        genes = p.find_genes(str(record.seq), window=10000, overlap=2000)
+        self.assertEqual([s["method"] for s in stats], ["train", "find_genes"])
+        self.assertIn("calc_dicodon_gene", stats[0]["times"])
+        self.assertIs(stats[1], genes.stats)
+        self.assertEqual(stats[1]["bins"], {})
+        self.assertGreater(stats[1]["counters"]["nodes_extracted"], 0)
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_find_genes_multi(self):
+        record = data.load_record("SRR492066.fna.gz")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            info = OrfFinder().train(str(record.seq))
+        # mix translation tables to check nodes are extracted for each
+        models = [info] + [
+            bin.training_info
+            for bin in METAGENOMIC_BINS
+            if bin.training_info.translation_table in (4, 25)
+        ][:3]
+        self.assertNotEqual(len({m.translation_table for m in models}), 1)
+        expected = [
+            OrfFinder(training_info=model).find_genes(str(record.seq))
+            for model in models
+        ]
+        for threads in (1, 2, 0):
+            results = OrfFinder().find_genes_multi(str(record.seq), models, threads=threads)
+            self.assertEqual(len(results), len(models))
+            for model, (genes, score), genes_expected in zip(models, results, expected):
+                self.assertIs(genes.training_info, model)
+                self.assertIsInstance(score, float)
+                self.assertEqual(len(genes), len(genes_expected))
+                for gene1, gene2 in zip(genes, genes_expected):
+                    self.assertGeneEqual(gene1, gene2)
+        # the trained model should fit its own genome better
+        scores = [score for _, score in results]
+        self.assertEqual(max(scores), scores[0])
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_find_genes_view(self):
+        record = data.load_record("SRR492066.fna.gz")
+        seq = str(record.seq)
+        seq = seq[:30000] + "N" * 100 + seq[30100:]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            info = OrfFinder().train(seq)
+        for mask in (False, True):
+            for p in (OrfFinder(info, mask=mask), OrfFinder(meta=True, mask=mask)):
+                for parent in (Sequence(seq), Sequence(seq, mask=True)):
+                    genes = p.find_genes(parent)
+                    self.assertIs(genes.sequence is parent, mask == bool(parent.masks))
+                    expected = p.find_genes(seq)
+                    self.assertEqual(len(genes), len(expected))
+                    for gene1, gene2 in zip(genes, expected):
+                        self.assertGeneEqual(gene1, gene2)
+                    for begin, end in [(0, 20000), (25000, 55000)]:
+                        genes = p.find_genes(parent.view(begin, end))
+                        expected = p.find_genes(seq[begin:end])
+                        self.assertEqual(len(genes), len(expected))
+                        for gene1, gene2 in zip(genes, expected):
+                            self.assertGeneEqual(gene1, gene2)
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_find_genes_released_indices(self):
+        # the hexamer and GC indices released when `find_genes` returns
+        # are rebuilt when the nodes of the result are scored again
+        record = data.load_record("SRR492066.fna.gz")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            info = OrfFinder().train(str(record.seq))
+        genes = OrfFinder(info).find_genes(str(record.seq))
+        nodes1 = genes.nodes.copy()
+        nodes1.score(genes.sequence, info)
+        nodes2 = genes.nodes.copy()
+        nodes2.score(Sequence(str(record.seq)), info)
+        self.assertEqual(len(nodes1), len(nodes2))
+        for node1, node2 in zip(nodes1, nodes2):
+            self.assertEqual(node1.cscore, node2.cscore)
+            self.assertEqual(node1.rscore, node2.rscore)
+            self.assertEqual(node1.sscore, node2.sscore)
+
+    def test_find_genes_multi_invalid(self):
+        p = OrfFinder()
+        self.assertRaises(TypeError, p.find_genes_multi, "ATGC" * 100, [None])
+        self.assertRaises(TypeError, p.find_genes_multi, "ATGC" * 100, [1])
+        self.assertEqual(p.find_genes_multi("ATGC" * 100, []), [])
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_max_nodes_window(self):
+        record = data.load_record("SRR492066.fna.gz")
+        seq = Sequence(str(record.seq))
+        p1 = OrfFinder(meta=False)
+        p2 = OrfFinder(meta=False, max_nodes=seq.estimated_nodes // 2)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertRaises(ResourceLimitError, p2.train, seq)
+            tinf = p1.train(seq)
+        p2 = OrfFinder(tinf, max_nodes=seq.estimated_nodes // 2)
+        self.assertRaises(ResourceLimitError, p2.find_genes, seq)
+        genes = p2.find_genes(seq, window=len(seq) // 4)
+        self.assertGreater(len(genes), 0)
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_train_auto_translation_table(self):
+        record = data.load_record("SRR492066.fna.gz")
+        p = OrfFinder(meta=False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            info1 = p.train(record.seq)
+            for threads in (1, 3):
+                info2 = p.train(record.seq, translation_table="auto", threads=threads)
+                self.assertEqual(info1.__getstate__(), info2.__getstate__())
+                self.assertIs(p.training_info, info2)
+            info3 = p.train(record.seq, translation_table="auto", candidates=[4])
+        self.assertEqual(info3.translation_table, 4)
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_train_contigs(self):
+        record = data.load_record("SRR492066.fna.gz")
+        seq = str(record.seq)
+        # add unknown regions to check masks are placed at the right offset
+        seq = seq[:30000] + "N" * 100 + seq[30100:60000] + "N" * 100 + seq[60100:]
+        contigs = [seq[:25000], seq[25000:55000], seq[55000:]]
+        joined = "".join(contig + "TTAATTAATTAA" for contig in contigs)
+        for mask in (False, True):
+            p = OrfFinder(meta=False, mask=mask)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                expected = p.train(joined).__getstate__()
+                self.assertEqual(p.train(*contigs).__getstate__(), expected)
+                self.assertEqual(p.train(contigs).__getstate__(), expected)
+                self.assertEqual(p.train(iter(contigs)).__getstate__(), expected)
+                self.assertEqual(p.train(*[c.encode() for c in contigs]).__getstate__(), expected)
+                sequences = [Sequence(contig, mask=mask) for contig in contigs]
+                self.assertEqual(p.train(*sequences).__getstate__(), expected)
+                mixed = [sequences[0], contigs[1], bytearray(contigs[2].encode())]
+                self.assertEqual(p.train(mixed).__getstate__(), expected)
+
+    def test_train_invalid_candidates(self):
+        p = OrfFinder(meta=False)
+        seq = "ATGC" * 10000
+        self.assertRaises(ValueError, p.train, seq, translation_table="auto", candidates=())
+        self.assertRaises(ValueError, p.train, seq, translation_table="auto", candidates=(11, 7))
+        self.assertRaises(ValueError, p.train, seq, translation_table="11")
+
+    def test_train_invalid_threads(self):
+        p = OrfFinder(meta=False)
+        self.assertRaises(ValueError, p.train, "ATGC" * 10000, threads=-1)
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_find_genes_window(self):
+        record = data.load_record("SRR492066.fna.gz")
+        p = OrfFinder(meta=False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            p.train(str(record.seq))
+        g1 = p.find_genes(str(record.seq))
+        for window, overlap, threads in [(10000, 2000, 1), (4000, 1000, 2), (2000, 1000, 0)]:
+            g2 = p.find_genes(str(record.seq), window=window, overlap=overlap, threads=threads)
+            self.assertEqual(len(g1), len(g2))
+            for gene1, gene2 in zip(g1, g2):
+                self.assertGeneEqual(gene1, gene2)
+            self.assertEqual(len(g1.nodes), len(g2.nodes))
+            for node1, node2 in zip(g1.nodes, g2.nodes):
+                self.assertEqual(node1.index, node2.index)
+                self.assertEqual(node1.strand, node2.strand)
+                self.assertEqual(node1.cscore, node2.cscore)
+
+    @unittest.skipUnless(data.resources, "importlib.resources not available")
+    def test_find_genes_window_keep_nodes(self):
+        record = data.load_record("SRR492066.fna.gz")
+        p = OrfFinder(meta=False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            p.train(str(record.seq))
+        previous = track_memory(True)
+        try:
+            memory_stats(reset=True)
+            g1 = p.find_genes(str(record.seq), window=4000, overlap=1000, threads=2)
+            peak1 = memory_stats(reset=True)["subsystems"]["nodes"]["peak"]
+            g2 = p.find_genes(str(record.seq), window=4000, overlap=1000, threads=2, keep_nodes=False)
+            peak2 = memory_stats()["subsystems"]["nodes"]["peak"]
+        finally:
+            track_memory(previous)
+        self.assertEqual(len(g1), len(g2))
+        for gene1, gene2 in zip(g1, g2):
+            self.assertGeneEqual(gene1, gene2)
+        # only the nodes of the windows in flight and of the genes are kept
+        self.assertLess(peak2, peak1 // 2)
+
+    def test_find_genes_invalid_window(self):
+        p = OrfFinder(meta=False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            p.train("ATGC" * 10000)
+        self.assertRaises(ValueError, p.find_genes, "ATGC" * 10000, window=0)
+        self.assertRaises(ValueError, p.find_genes, "ATGC" * 10000, window=1000, overlap=600)
+        self.assertRaises(ValueError, p.find_genes, "ATGC" * 10000, window=1000, threads=-1)
+        self.assertRaises(RuntimeError, OrfFinder(meta=True).find_genes, "ATGC" * 10000, window=1000)
+
     @unittest.skipUnless(data.resources, "importlib.resources not available")
     def test_train_not_called(self):
         record = data.load_record("SRR492066.fna.gz")
@@ -17,6 +17,122 @@ class TestSequence(unittest.TestCase):
             self.assertEqual(m1.begin, m2.begin)
             self.assertEqual(m1.end, m2.end)
 
+    def test_estimated_nodes(self):
+        # ATG and TAA on the direct strand
+        self.assertEqual(Sequence("ATGTAA").estimated_nodes, 2)
+        # ATG and TAA on the reverse strand
+        self.assertEqual(Sequence("TTACAT").estimated_nodes, 2)
+        self.assertEqual(Sequence("NNNNNN").estimated_nodes, 0)
+        self.assertEqual(Sequence("").estimated_nodes, 0)
+        s1 = Sequence("ATGAAATAGCATTTA" * 10)
+        s2 = pickle.loads(pickle.dumps(s1))
+        self.assertEqual(s1.estimated_nodes, s2.estimated_nodes)
+        self.assertEqual(s1.estimated_nodes, Sequence(s1).estimated_nodes)
+
+    def test_from_digits(self):
+        s1 = Sequence("ATGCNNNNNNNNNNATGCNNNNNNNNTGC", mask=True, mask_size=0)
+        for buffer in (bytes(s1), bytearray(s1), memoryview(bytes(s1))):
+            s2 = Sequence.from_digits(buffer, masks=s1.masks)
+            self.assertEqual(str(s1), str(s2))
+            self.assertEqual(s1.gc, s2.gc)
+            self.assertEqual(s1.estimated_nodes, s2.estimated_nodes)
+            self.assertEqual(s1.masks.__getstate__(), s2.masks.__getstate__())
+            self.assertIsNot(s1.masks, s2.masks)
+        s3 = Sequence.from_digits(bytes(s1), gc=0.5)
+        self.assertEqual(s3.gc, 0.5)
+        self.assertEqual(len(s3.masks), 0)
+        self.assertEqual(len(Sequence.from_digits(b"")), 0)
+
+    def test_from_digits_subclass(self):
+        class MySequence(Sequence):
+            pass
+        s1 = MySequence.from_digits(bytes(Sequence("ATGCATGC")))
+        self.assertIsInstance(s1, MySequence)
+        self.assertEqual(str(s1), "ATGCATGC")
+
+    def test_from_digits_copy(self):
+        # writable buffers are copied
+        buffer = bytearray(Sequence("ATGC"))
+        seq = Sequence.from_digits(buffer)
+        buffer[0] = buffer[1]
+        self.assertEqual(str(seq), "ATGC")
+        # read-only buffers are borrowed
+        buffer = bytes(Sequence("ATGC"))
+        seq = Sequence.from_digits(buffer)
+        del buffer
+        self.assertEqual(str(seq), "ATGC")
+        self.assertTrue(memoryview(seq).readonly)
+        self.assertEqual(str(pickle.loads(pickle.dumps(seq))), "ATGC")
+
+    def test_from_digits_invalid(self):
+        self.assertRaises(ValueError, Sequence.from_digits, b"\x00\x04")
+        self.assertRaises(ValueError, Sequence.from_digits, b"ATGC")
+        self.assertRaises(ValueError, Sequence.from_digits, b"\x00\x01", gc=2.0)
+        masks = Sequence("ATGCNNNNNNNNNNATGC", mask=True, mask_size=0).masks
+        self.assertRaises(ValueError, Sequence.from_digits, b"\x00\x01", masks=masks)
+        self.assertRaises(TypeError, Sequence.from_digits, memoryview(b"\x00" * 8).cast("I"))
+
+    def test_view(self):
+        s = "ATGCNNNNNNNNNNATGCNNNNNNNNTGC"
+        seq = Sequence(s, mask=True, mask_size=0)
+        for begin, end in [(0, len(s)), (2, 20), (5, 10), (16, 16), (20, len(s))]:
+            view = seq.view(begin, end)
+            expected = Sequence(s[begin:end], mask=True, mask_size=0)
+            self.assertEqual(str(view), s[begin:end])
+            self.assertEqual(len(view), end - begin)
+            self.assertEqual(view.gc, expected.gc)
+            self.assertEqual(view.estimated_nodes, expected.estimated_nodes)
+            masks = [
+                (max(mask.begin, begin) - begin, min(mask.end, end) - begin)
+                for mask in seq.masks
+                if mask.intersects(begin, end)
+            ]
+            self.assertEqual(view.masks.__getstate__(), masks)
+            self.assertEqual(str(seq[begin:end]), s[begin:end])
+        self.assertRaises(IndexError, seq.view, -1, 5)
+        self.assertRaises(IndexError, seq.view, 5, 4)
+        self.assertRaises(IndexError, seq.view, 0, len(s) + 1)
+
+    def test_view_gc(self):
+        # the GC content of a view must not depend on whether the GC frame
+        # index of the parent sequence was built (it counts unknown
+        # nucleotides as GC)
+        s = "ATGCNNNNNNNNNNATGCNNNNNNNNTGC"
+        seq = Sequence(s)
+        before = [seq.view(begin, end).gc for begin, end in [(2, 20), (5, 10), (20, len(s))]]
+        seq.max_gc_frame_plot()
+        after = [seq.view(begin, end).gc for begin, end in [(2, 20), (5, 10), (20, len(s))]]
+        self.assertEqual(before, after)
+        self.assertEqual(seq.view(5, 10).gc, 0.0)
+
+    def test_buffer_readonly(self):
+        # cached indices and views would not see writes to the digits
+        seq = Sequence("ATGCATGC")
+        view = seq[2:6]
+        mem = memoryview(seq)
+        self.assertTrue(mem.readonly)
+        with self.assertRaises(TypeError):
+            mem[0] = mem[1]
+        self.assertEqual(str(seq), "ATGCATGC")
+        self.assertEqual(str(view), "GCAT")
+
+    def test_view_lifetime(self):
+        seq = Sequence("ATGCATGCATGC")
+        view = seq[3:9][1:5]
+        del seq
+        self.assertEqual(str(view), "ATGC")
+        self.assertTrue(memoryview(view).readonly)
+        self.assertEqual(str(pickle.loads(pickle.dumps(view))), "ATGC")
+
+    def test_getitem(self):
+        seq = Sequence("ATGCN")
+        self.assertEqual(seq[0], "A")
+        self.assertEqual(seq[-1], "N")
+        self.assertEqual(str(seq[-3:]), "GCN")
+        self.assertEqual(str(seq[3:1]), "")
+        self.assertRaises(IndexError, seq.__getitem__, 5)
+        self.assertRaises(ValueError, seq.__getitem__, slice(None, None, 2))
+
     def test_str(self):
         s = "ATGCNNNNNNNNNNATGCNNNNNNNNTGC"
         seq = Sequence(s, mask=False)